@@ -48,7 +48,13 @@ from .config import (  # noqa: E402
 )
 
 # Core functionality
-from .core import ArchiveFileReader, SevenZipFile, run_7z  # noqa: E402
+from .core import (  # noqa: E402
+    ArchiveFileReader,
+    SevenZipFile,
+    parallel_extract,
+    run_7z,
+    run_7z_async,
+)
 
 # Exceptions
 from .exceptions import (  # noqa: E402
@@ -231,6 +237,8 @@ __all__ = [
     "SevenZipFile",
     "ArchiveFileReader",
     "run_7z",
+    "run_7z_async",
+    "parallel_extract",
     # Archive information classes
     "ArchiveInfo",
     # Version information
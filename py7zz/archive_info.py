@@ -20,6 +20,39 @@ class ArchiveInfo:
     compatible with both zipfile and tarfile interfaces for easy migration.
     """
 
+    # Listings create one instance per member; like zipfile.ZipInfo, slots
+    # keep each instance small and attribute access direct.
+    __slots__ = (
+        "filename",
+        "orig_filename",
+        "file_size",
+        "compress_size",
+        "date_time",
+        "_mtime",
+        "compress_type",
+        "CRC",
+        "create_system",
+        "create_version",
+        "extract_version",
+        "reserved",
+        "flag_bits",
+        "volume",
+        "internal_attr",
+        "external_attr",
+        "header_offset",
+        "comment",
+        "extra",
+        "mode",
+        "uid",
+        "gid",
+        "uname",
+        "gname",
+        "type",
+        "method",
+        "solid",
+        "encrypted",
+    )
+
     def __init__(self, filename: str = "") -> None:
         """
         Initialize ArchiveInfo object.
@@ -39,7 +72,7 @@ class ArchiveInfo:
         self.date_time: Optional[tuple] = (
             None  # (year, month, day, hour, minute, second)
         )
-        self.mtime: Optional[float] = None  # tarfile-compatible modification time
+        self._mtime: Optional[float] = None  # Explicit timestamp, see mtime
 
         # Compression information
         self.compress_type: Optional[str] = None  # Compression method used
@@ -139,6 +172,25 @@ class ArchiveInfo:
 
     # Utility methods for time handling
 
+    @property
+    def mtime(self) -> Optional[float]:
+        """
+        Modification time as Unix timestamp (tarfile compatible).
+
+        When no timestamp was set explicitly it is derived from date_time on
+        access, so parsed listings only pay for the conversion when used.
+        """
+        if self._mtime is None and self.date_time is not None:
+            try:
+                return datetime(*self.date_time).timestamp()
+            except (ValueError, TypeError):
+                return None
+        return self._mtime
+
+    @mtime.setter
+    def mtime(self, value: Optional[float]) -> None:
+        self._mtime = value
+
     def get_mtime(self) -> Optional[float]:
         """
         Get modification time as Unix timestamp.
@@ -146,17 +198,7 @@ class ArchiveInfo:
         Returns:
             Unix timestamp or None if no time information available
         """
-        if self.mtime is not None:
-            return self.mtime
-
-        if self.date_time is not None:
-            try:
-                dt = datetime(*self.date_time)
-                return dt.timestamp()
-            except (ValueError, TypeError):
-                pass
-
-        return None
+        return self.mtime
 
     def set_mtime(self, timestamp: Union[float, datetime]) -> None:
         """
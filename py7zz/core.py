@@ -5,14 +5,32 @@ Core functionality for py7zz package.
 Provides subprocess wrapper and main SevenZipFile class.
 """
 
+import contextlib
 import os
 import platform
+import re
 import shutil
 import subprocess
 import tempfile
+import threading
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import Callable, Iterator, List, Optional, Union
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Union,
+    overload,
+)
 
 # Python 3.8 compatibility - use string annotation for subprocess.CompletedProcess
 from .archive_info import ArchiveInfo
@@ -38,6 +56,65 @@ from .logging_config import get_logger
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Directory holding the 7zz binary bundled into wheel packages
+_BUNDLED_BIN_DIR = os.path.join(os.path.dirname(__file__), "bin")
+
+# 7zz command prefixes that argument lists are built from
+_ADD_BASE = ("a",)
+_EXTRACT_BASE = ("x",)  # extract with full paths
+_STREAM_BASE = ("e", "-so")  # write member data to stdout
+_TEST_BASE = ("t",)
+
+# Named compression levels accepted by SevenZipFile and their 7zz -mx values
+_MX_LEVEL = {
+    "store": 0,
+    "fastest": 1,
+    "fast": 3,
+    "normal": 5,
+    "maximum": 7,
+    "ultra": 9,
+}
+
+# Accepted values for the mode and level constructor arguments
+_VALID_MODES = frozenset({"r", "w", "a"})
+_VALID_LEVELS = frozenset(_MX_LEVEL)
+
+# Dictionary size used by default for .7z archives at level "normal" and above
+_LZMA2_DICT_SIZE = "64m"
+
+# Methods the default dictionary size applies to; others reject or misread -md
+_LZMA_METHODS = frozenset({"lzma", "lzma2", "flzma2"})
+
+# Windows error messages from 7zz that point at an unusable file name
+_FILENAME_ERROR_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            [
+                "cannot create",
+                "cannot use name",
+                "invalid name",
+                "the filename, directory name, or volume label syntax is incorrect",
+                "the system cannot find the path specified",
+                "cannot find the path",
+                "access is denied",  # Sometimes occurs with reserved names
+                "filename too long",
+                "illegal characters in name",
+            ],
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Upper bound on concurrent 7zz runs when retrying members one by one
+_MAX_STREAM_WORKERS = 8
+
+# Chunk size for copying member data from 7zz's stdout into files
+_COPY_BUFFER_SIZE = 1 << 20
+
+# Shared worker pool for run_7z_async(); threads are started on first use
+_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="py7zz")
+
 
 def get_version() -> str:
     """Get current package version."""
@@ -58,21 +135,18 @@ def find_7z_binary() -> str:
     """
     # Check environment variable first (for development/testing only)
     env_binary = os.environ.get("PY7ZZ_BINARY")
-    if env_binary and Path(env_binary).exists():
+    if env_binary and os.path.isfile(env_binary):
         return env_binary
 
     # Use bundled binary (preferred for wheel packages) - unified directory
-    current_dir = Path(__file__).parent
-    binaries_dir = current_dir / "bin"
-
     # Platform-specific binary name but unified location
     system = platform.system().lower()
     binary_name = "7zz.exe" if system == "windows" else "7zz"
 
-    binary_path = binaries_dir / binary_name
-
-    if binary_path.exists():
-        return str(binary_path)
+    # A single stat() of the one candidate path
+    binary_path = os.path.join(_BUNDLED_BIN_DIR, binary_name)
+    if os.path.isfile(binary_path):
+        return binary_path
 
     # Auto-download binary for source installs
     # Skip auto-download to prevent circular dependency with bundled_info
@@ -86,15 +160,29 @@ def find_7z_binary() -> str:
     )
 
 
+@overload
 def run_7z(
-    args: List[str], cwd: Optional[str] = None
-) -> "subprocess.CompletedProcess[str]":
+    args: List[str], cwd: Optional[str] = None, text: Literal[True] = True
+) -> "subprocess.CompletedProcess[str]": ...
+
+
+@overload
+def run_7z(
+    args: List[str], cwd: Optional[str] = None, *, text: Literal[False]
+) -> "subprocess.CompletedProcess[bytes]": ...
+
+
+def run_7z(
+    args: List[str], cwd: Optional[str] = None, text: bool = True
+) -> "subprocess.CompletedProcess[Any]":
     """
     Execute 7zz command with given arguments.
 
     Args:
         args: Command arguments to pass to 7zz
         cwd: Working directory for the command
+        text: Decode output as text; pass False to capture raw bytes,
+            e.g. member data streamed with -so
 
     Returns:
         CompletedProcess object with stdout, stderr, and return code
@@ -108,7 +196,7 @@ def run_7z(
 
     try:
         result = subprocess.run(
-            cmd, cwd=cwd, capture_output=True, text=True, check=True
+            cmd, cwd=cwd, capture_output=True, text=text, check=True
         )
         return result
     except subprocess.CalledProcessError as e:
@@ -117,6 +205,147 @@ def run_7z(
         ) from e
 
 
+def run_7z_async(
+    args: List[str], cwd: Optional[str] = None
+) -> "Future[subprocess.CompletedProcess[str]]":
+    """
+    Execute 7zz command in a background thread.
+
+    7zz does its work in a separate process, so several commands submitted
+    this way run in parallel while the calling thread carries on.
+
+    Args:
+        args: Command arguments to pass to 7zz
+        cwd: Working directory for the command
+
+    Returns:
+        Future resolving to the CompletedProcess; result() re-raises any
+        error run_7z() would raise
+    """
+    return _EXECUTOR.submit(run_7z, args, cwd)
+
+
+@contextlib.contextmanager
+def _stream_7z(args: List[str]) -> Iterator[IO[bytes]]:
+    """
+    Execute 7zz command and expose its stdout as a binary stream.
+
+    Unlike run_7z(), the output is not collected, so member data written
+    with -so can be copied elsewhere chunk by chunk.
+
+    Args:
+        args: Command arguments to pass to 7zz
+
+    Yields:
+        Readable stream connected to the command's stdout
+
+    Raises:
+        subprocess.CalledProcessError: If command fails
+        RuntimeError: If 7zz binary not found
+    """
+    cmd = [find_7z_binary(), *args]
+
+    # stderr goes to a file: a pipe nobody reads could fill up and stall 7zz
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        assert process.stdout is not None
+        try:
+            yield process.stdout
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+
+        if returncode:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(
+                returncode, cmd, None, stderr.read().decode("utf-8", "replace")
+            )
+
+
+def _copy_exact(source: IO[bytes], target: Optional[IO[bytes]], size: int) -> bool:
+    """
+    Copy exactly size bytes between streams, one buffer at a time.
+
+    Args:
+        source: Stream to read from
+        target: Stream to write to, or None to discard the data
+        size: Number of bytes to copy
+
+    Returns:
+        True if source held at least size bytes
+    """
+    remaining = size
+    while remaining:
+        chunk = source.read(min(remaining, _COPY_BUFFER_SIZE))
+        if not chunk:
+            return False
+        if target is not None:
+            target.write(chunk)
+        remaining -= len(chunk)
+    return True
+
+
+def parallel_extract(
+    archives: Iterable[Union[str, Path]],
+    output_dir: Union[str, Path],
+    max_workers: Optional[int] = None,
+    overwrite: bool = False,
+) -> List[Path]:
+    """
+    Extract several archives concurrently, each into its own subdirectory.
+
+    Every archive is extracted to ``output_dir / <archive stem>`` by a
+    bounded pool of worker threads, each driving its own 7zz process.
+
+    Args:
+        archives: Paths of the archives to extract
+        output_dir: Directory to create the per-archive subdirectories in
+        max_workers: Maximum number of concurrent extractions
+            (defaults to the number of CPUs)
+        overwrite: Whether to overwrite existing files
+
+    Returns:
+        Output directory of each archive, in the order given
+
+    Raises:
+        ValueError: If two archives share a stem and so the same subdirectory
+        FileNotFoundError: If an archive does not exist
+        RuntimeError: If an extraction fails
+
+    Example:
+        >>> py7zz.parallel_extract(["a.7z", "b.zip"], "extracted/")
+        [PosixPath('extracted/a'), PosixPath('extracted/b')]
+    """
+    output_dir = Path(output_dir)
+    targets = [(Path(archive), output_dir / Path(archive).stem) for archive in archives]
+
+    # Concurrent extractions into one directory would overwrite each other
+    seen: Dict[Path, Path] = {}
+    for archive, target in targets:
+        other = seen.setdefault(target, archive)
+        if other is not archive:
+            raise ValueError(
+                f"Archives {other} and {archive} would both extract to {target}"
+            )
+
+    def extract_one(archive: Path, target: Path) -> None:
+        with SevenZipFile(archive, "r") as sz:
+            sz.extract(target, overwrite=overwrite)
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        futures = [
+            pool.submit(extract_one, archive, target) for archive, target in targets
+        ]
+        # Re-raise the first failure; leaving the block waits for the rest
+        for future in futures:
+            future.result()
+
+    return [target for _, target in targets]
+
+
 def _is_filename_error(error_message: str) -> bool:
     """
     Check if the error message indicates a filename compatibility issue.
@@ -130,22 +359,62 @@ def _is_filename_error(error_message: str) -> bool:
     if not is_windows():
         return False
 
-    error_lower = error_message.lower()
+    return _FILENAME_ERROR_RE.search(error_message) is not None
+
+
+def _check_within_target(target_path: Path, names: Iterable[str]) -> None:
+    """
+    Make sure sanitized names stay inside the extraction directory.
+
+    The target is resolved once and every name is checked against it
+    lexically, so the check costs no file system lookups per member.
+
+    Args:
+        target_path: Extraction directory
+        names: Sanitized member names relative to the target
+
+    Raises:
+        FilenameCompatibilityError: If a name points outside the target
+    """
+    root = os.path.normcase(os.path.join(target_path.resolve(), ""))
+    outside = []
+    for name in names:
+        destination = os.path.normpath(os.path.join(root, name))
+        if not os.path.normcase(destination).startswith(root):
+            outside.append(name)
+
+    if outside:
+        raise FilenameCompatibilityError(
+            f"Sanitized names point outside the target directory: {outside[:10]}",
+            problematic_files=outside,
+            sanitized=True,
+        )
+
+
+@contextlib.contextmanager
+def _member_selection(members: List[str]) -> Iterator[List[str]]:
+    """
+    Build the 7zz arguments that restrict a command to the given members.
+
+    Several members are passed through a temporary list file, which keeps
+    the command line short and lets a single 7zz run decode each solid block
+    once for the whole batch. Wildcard matching is disabled (-spd), so names
+    containing "*" or "?" select only themselves.
+
+    Args:
+        members: Names of the archive members
 
-    # Common Windows filename error patterns
-    filename_error_patterns = [
-        "cannot create",
-        "cannot use name",
-        "invalid name",
-        "the filename, directory name, or volume label syntax is incorrect",
-        "the system cannot find the path specified",
-        "cannot find the path",
-        "access is denied",  # Sometimes occurs with reserved names
-        "filename too long",
-        "illegal characters in name",
-    ]
+    Yields:
+        Arguments to append after the archive path
+    """
+    if len(members) == 1:
+        yield ["-spd", members[0]]
+        return
 
-    return any(pattern in error_lower for pattern in filename_error_patterns)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        list_file = Path(temp_dir) / "members.txt"
+        list_file.write_text("".join(f"{name}\n" for name in members), encoding="utf-8")
+        yield ["-spd", "-scsUTF-8", f"-i@{list_file}"]
 
 
 class SevenZipFile:
@@ -161,6 +430,9 @@ class SevenZipFile:
         level: str = "normal",
         preset: Optional[str] = None,
         config: Optional[Config] = None,
+        threads: Union[bool, int, None] = None,
+        dict_size: Optional[str] = None,
+        method: Optional[str] = None,
     ):
         """
         Initialize SevenZipFile.
@@ -171,8 +443,16 @@ class SevenZipFile:
             level: Compression level ('store', 'fastest', 'fast', 'normal', 'maximum', 'ultra')
             preset: Preset name ('fast', 'balanced', 'backup', 'ultra', 'secure', 'compatibility')
             config: Custom configuration object (overrides level and preset)
-        """
-        self.file = Path(file)
+            threads: Compression threads (overrides the configured value, see
+                Config.threads)
+            dict_size: Dictionary size such as "64m" (overrides the configured
+                value)
+            method: Compression method passed as -m0= ('lzma2', 'lzma', 'ppmd',
+                'bzip2', 'deflate'; 'flzma2', 'zstd' and 'lz4' need a 7-Zip-zstd
+                build selected with PY7ZZ_BINARY). Defaults to letting 7zz choose.
+        """
+        # Reuse Path inputs as-is rather than wrapping them again
+        self.file = file if isinstance(file, Path) else Path(file)
         self.mode = mode
 
         # Handle configuration priority: config > preset > level
@@ -182,31 +462,60 @@ class SevenZipFile:
             self.config = Presets.get_preset(preset)
         else:
             # Convert level to config for backwards compatibility
-            level_to_config = {
-                "store": Config(level=0),
-                "fastest": Config(level=1),
-                "fast": Config(level=3),
-                "normal": Config(level=5),
-                "maximum": Config(level=7),
-                "ultra": Config(level=9),
-            }
-            self.config = level_to_config.get(level, Config(level=5))
+            mx_level = _MX_LEVEL.get(level, 5)
+            # Give LZMA2 a larger dictionary from "normal" up. Only the 7z
+            # format and LZMA codecs are tuned; zip, tar, PPMd and Deflate
+            # reject -md=64m. Threads are left to 7zz, which already uses
+            # every core.
+            use_large_dict = (
+                mx_level >= 5
+                and self.file.suffix.lower() == ".7z"
+                and (method is None or method.lower() in _LZMA_METHODS)
+            )
+            self.config = Config(
+                level=mx_level,
+                dictionary_size=_LZMA2_DICT_SIZE if use_large_dict else None,
+            )
+
+        # Explicit keyword arguments win over level, preset and config
+        if threads is not None:
+            self.config = replace(self.config, threads=threads)
+        if dict_size is not None:
+            self.config = replace(self.config, dictionary_size=dict_size)
+        if method is not None:
+            self.config = replace(
+                self.config, compression=method, auto_compression=False
+            )
 
         # Keep level for backwards compatibility
         self.level = level
 
+        # Parsed member listing, shared by namelist()/infolist()/getinfo()/read()
+        self._info_cache: Optional[List[ArchiveInfo]] = None
+        # File names from a names-only listing, used until metadata is needed
+        self._names_only_cache: Optional[List[str]] = None
+        # Set once the archive file is known to exist, to skip repeated stat()s
+        self._archive_exists = False
+        # Lookups derived from the member list they were built from
+        self._index_source: Optional[List[ArchiveInfo]] = None
+        self._namelist_cache: List[str] = []
+        self._files_cache: List[str] = []
+        self._info_by_name: Dict[str, ArchiveInfo] = {}
+        self._name_index: Dict[str, str] = {}
+        # Guards the caches above, which background submit_*() calls share
+        self._cache_lock = threading.RLock()
+
         self._validate_mode()
         self._validate_level()
 
     def _validate_mode(self) -> None:
         """Validate file mode."""
-        if self.mode not in ("r", "w", "a"):
+        if self.mode not in _VALID_MODES:
             raise ValueError(f"Invalid mode: {self.mode}")
 
     def _validate_level(self) -> None:
         """Validate compression level."""
-        valid_levels = ["store", "fastest", "fast", "normal", "maximum", "ultra"]
-        if self.level not in valid_levels:
+        if self.level not in _VALID_LEVELS:
             raise ValueError(f"Invalid compression level: {self.level}")
 
     def __enter__(self) -> "SevenZipFile":
@@ -338,6 +647,11 @@ class SevenZipFile:
             name: Path to file or directory to add
             arcname: Name in archive (defaults to name)
         """
+        if arcname is None:
+            # Simple case: add file with its original name
+            self.add_many([name])
+            return
+
         if self.mode == "r":
             raise ValueError("Cannot add to archive opened in read mode")
 
@@ -345,32 +659,82 @@ class SevenZipFile:
         if not name.exists():
             raise FileNotFoundError(f"File not found: {name}")
 
-        if arcname is None:
-            # Simple case: add file with its original name
-            self._add_simple(name)
-        else:
-            # Complex case: add file with custom archive name
-            self._add_with_arcname(name, arcname)
+        # Archive contents are about to change
+        self._invalidate_cache()
 
-    def _add_simple(self, name: Path) -> None:
+        # Complex case: add file with custom archive name
+        self._add_with_arcname(name, arcname)
+
+    def add_many(self, names: Iterable[Union[str, Path]]) -> None:
         """
-        Add file with its original name to the archive.
+        Add several files or directories to archive with a single 7zz call.
+
+        Each path is stored under its original name, as with add() without
+        arcname. More than one path is passed to 7zz through a list file, so
+        the command line stays short however many paths are given. Wildcard
+        matching is disabled (-spd), so every path adds only itself.
 
         Args:
-            name: Path to file or directory to add
+            names: Paths to files or directories to add
+
+        Raises:
+            ValueError: If archive is opened in read mode
+            FileNotFoundError: If any of the paths does not exist
         """
-        args = ["a"]  # add command
+        if self.mode == "r":
+            raise ValueError("Cannot add to archive opened in read mode")
 
-        # Add configuration arguments
-        args.extend(self.config.to_7z_args())
+        paths = [Path(name) for name in names]
+        for path in paths:
+            if not path.exists():
+                raise FileNotFoundError(f"File not found: {path}")
 
-        # Add file and archive paths
-        args.extend([str(self.file), str(name)])
+        if not paths:
+            return
+
+        # Archive contents are about to change
+        self._invalidate_cache()
+
+        # Add command with configuration arguments
+        args = [*_ADD_BASE, *self.config.to_7z_args(), str(self.file), "-spd"]
+
+        if len(paths) == 1:
+            args.append(str(paths[0]))
+            self._run_add(args, str(paths[0]))
+            return
+
+        # 7zz trims blanks from each list file line, so paths with leading or
+        # trailing whitespace are passed on the command line instead
+        listed: List[str] = []
+        positional: List[str] = []
+        for path in paths:
+            text = str(path)
+            (listed if text == text.strip() else positional).append(text)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            if listed:
+                list_file = Path(temp_dir) / "members.txt"
+                list_file.write_text(
+                    "".join(f"{text}\n" for text in listed), encoding="utf-8"
+                )
+                args.extend(["-scsUTF-8", f"-i@{list_file}"])
+            args.extend(positional)
+            self._run_add(args, f"{len(paths)} files")
+
+    def _run_add(self, args: List[str], what: str) -> None:
+        """
+        Run a 7zz add command, wrapping failures in RuntimeError.
 
+        Args:
+            args: Complete 7zz arguments
+            what: Description of what is being added, for the error message
+        """
         try:
             run_7z(args)
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to add {name} to archive: {e.stderr}") from e
+            raise RuntimeError(f"Failed to add {what} to archive: {e.stderr}") from e
+        # A successful add always leaves the archive on disk
+        self._archive_exists = True
 
     def _add_with_arcname(self, name: Path, arcname: str) -> None:
         """
@@ -446,10 +810,8 @@ class SevenZipFile:
                     shutil.copytree(name, temp_target)
 
             # Add the temporary file/directory to the archive
-            args = ["a"]  # add command
-
-            # Add configuration arguments
-            args.extend(self.config.to_7z_args())
+            # Add command with configuration arguments
+            args = [*_ADD_BASE, *self.config.to_7z_args()]
 
             # Add archive path (use absolute path to avoid issues with cwd)
             args.append(str(Path(self.file).resolve()))
@@ -522,13 +884,12 @@ class SevenZipFile:
         if self.mode == "w":
             raise ValueError("Cannot extract from archive opened in write mode")
 
-        if not self.file.exists():
-            raise FileNotFoundError(f"Archive not found: {self.file}")
+        self._check_archive_exists()
 
         path = Path(path)
         path.mkdir(parents=True, exist_ok=True)
 
-        args = ["x", str(self.file), f"-o{path}"]
+        args = [*_EXTRACT_BASE, str(self.file), f"-o{path}"]
 
         if overwrite:
             args.append("-y")  # assume yes for all prompts
@@ -614,7 +975,7 @@ class SevenZipFile:
             temp_path = Path(temp_dir)
 
             # Extract to temporary directory first
-            args = ["x", str(self.file), f"-o{temp_path}"]
+            args = [*_EXTRACT_BASE, str(self.file), f"-o{temp_path}"]
             if overwrite:
                 args.append("-y")
 
@@ -652,6 +1013,16 @@ class SevenZipFile:
             sanitization_mapping: Mapping of original to sanitized names
             overwrite: Whether to overwrite existing files
         """
+        _check_within_target(target_path, sanitization_mapping.values())
+
+        # The temporary directory is often on another file system; find out
+        # once instead of letting every rename fail first
+        try:
+            same_device = os.stat(source_path).st_dev == os.stat(target_path).st_dev
+        except OSError:
+            same_device = False
+
+        created_dirs = set()
         for root, _dirs, files in os.walk(source_path):
             root_path = Path(root)
 
@@ -670,71 +1041,80 @@ class SevenZipFile:
                 source_file = root_path / file
                 target_file = target_path / sanitized_name
 
-                # Create target directory if needed
-                target_file.parent.mkdir(parents=True, exist_ok=True)
+                # Create target directory if needed, once per directory
+                if target_file.parent not in created_dirs:
+                    target_file.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(target_file.parent)
 
                 # Move file
                 if target_file.exists() and not overwrite:
                     logger.warning(f"Skipping existing file: {target_file}")
                     continue
 
-                shutil.move(str(source_file), str(target_file))
+                if same_device:
+                    os.replace(source_file, target_file)
+                else:
+                    shutil.copy2(source_file, target_file)
+                    source_file.unlink()
                 logger.debug(f"Moved {source_file} to {target_file}")
 
     def _extract_files_individually(
-        self, target_path: Path, sanitization_mapping: dict, overwrite: bool
+        self,
+        target_path: Path,
+        sanitization_mapping: dict,
+        overwrite: bool,
+        parallel: bool = True,
     ) -> None:
         """
         Extract files individually when bulk extraction fails.
 
+        Member data is streamed from 7zz's stdout (-so) and written straight
+        to the sanitized paths, so 7zz never creates a file under the
+        original name and nothing is staged in a temporary directory.
+
         Args:
             target_path: Target directory for extraction
             sanitization_mapping: Mapping of original to sanitized names
             overwrite: Whether to overwrite existing files
+            parallel: Whether members retried one by one may be streamed
+                concurrently; ignored for solid archives
         """
-        extracted_count = 0
-        failed_files = []
+        _check_within_target(target_path, sanitization_mapping.values())
 
+        destinations: Dict[str, Path] = {}
         for original_name, sanitized_name in sanitization_mapping.items():
-            try:
-                # Create a temporary file for this specific extraction
-                with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                    temp_path = Path(temp_file.name)
-
-                # Try to extract this specific file
-                args = [
-                    "e",
-                    str(self.file),
-                    f"-o{temp_path.parent}",
-                    original_name,
-                    "-y",
-                ]
-
-                try:
-                    run_7z(args)
-
-                    # Move to final location with sanitized name
-                    final_path = target_path / sanitized_name
-                    final_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    if final_path.exists() and not overwrite:
-                        logger.warning(f"Skipping existing file: {final_path}")
-                        temp_path.unlink(missing_ok=True)
-                        continue
-
-                    shutil.move(str(temp_path), str(final_path))
-                    extracted_count += 1
-                    logger.debug(
-                        f"Individually extracted {original_name} as {sanitized_name}"
-                    )
+            final_path = target_path / sanitized_name
+            if final_path.exists() and not overwrite:
+                logger.warning(f"Skipping existing file: {final_path}")
+                continue
+            destinations[original_name] = final_path
+
+        # Create each target directory once rather than once per file
+        for parent in {final_path.parent for final_path in destinations.values()}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        # One 7zz run for all members; whatever it cannot deliver is retried
+        # one by one so a single bad name does not sink the rest
+        extracted = self._stream_members(destinations)
+        retry = [name for name in destinations if name not in extracted]
+        if len(destinations) > 1 and retry:
+
+            def stream_one(name: str) -> Set[str]:
+                return self._stream_members({name: destinations[name]})
+
+            # Separate runs over one solid block would each decode it again
+            if parallel and len(retry) > 1 and not self._is_solid():
+                workers = min(os.cpu_count() or 1, _MAX_STREAM_WORKERS)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(stream_one, retry))
+            else:
+                results = [stream_one(name) for name in retry]
 
-                except subprocess.CalledProcessError:
-                    failed_files.append(original_name)
-                    temp_path.unlink(missing_ok=True)
+            for result in results:
+                extracted |= result
 
-            except Exception as e:
-                failed_files.append(original_name)
-                logger.error(f"Failed to extract {original_name}: {e}")
+        extracted_count = len(extracted)
+        failed_files = [name for name in destinations if name not in extracted]
 
         if failed_files:
             logger.warning(
@@ -752,6 +1132,86 @@ class SevenZipFile:
             f"Successfully extracted {extracted_count} files with sanitized names"
         )
 
+    def _is_solid(self) -> bool:
+        """
+        Guess whether the archive stores several files in one solid block.
+
+        Only the first file of a solid block has a packed size of its own,
+        so a file with data but no packed size points to a solid block.
+
+        Returns:
+            True if the archive appears to be solid
+        """
+        return any(
+            info.file_size and not info.compress_size and not info.is_dir()
+            for info in self._get_detailed_info()
+        )
+
+    def _stream_members(self, destinations: Dict[str, Path]) -> Set[str]:
+        """
+        Stream members from 7zz's stdout straight into their destination files.
+
+        7zz emits the members back to back in archive order, and the listed
+        sizes are used to split the stream, as in read_many(). Data passes
+        through a fixed-size buffer and is never held in memory as a whole.
+
+        Args:
+            destinations: Mapping of member names to the files to write
+
+        Returns:
+            Names of the members written; empty if 7zz failed or the listed
+            sizes do not account for the stream, in which case the files
+            opened by this run are removed again
+        """
+        if not destinations:
+            return set()
+
+        args = [*_STREAM_BASE, str(self.file)]
+
+        # Add password if available
+        if hasattr(self, "_password") and self._password is not None:
+            # Convert bytes password to string for 7zz command
+            password_str = (
+                self._password.decode("utf-8")
+                if isinstance(self._password, bytes)
+                else str(self._password)
+            )
+            args.append(f"-p{password_str}")
+
+        sizes = [
+            (info.filename, info.file_size)
+            for info in self._get_detailed_info()
+            if info.filename in destinations and not info.is_dir()
+        ]
+
+        written: Set[str] = set()
+        try:
+            with _member_selection(list(destinations)) as selection, _stream_7z(
+                [*args, *selection]
+            ) as stream:
+                for member, size in sizes:
+                    # First entry wins for duplicate names, as in getinfo()
+                    if member in written:
+                        complete = _copy_exact(stream, None, size)
+                    else:
+                        written.add(member)
+                        with destinations[member].open("wb") as target:
+                            complete = _copy_exact(stream, target, size)
+                    if not complete:
+                        raise ValueError(f"Stream ended inside {member}")
+
+                # Checked even for a single member: data the listing does not
+                # account for means 7zz streamed something other than asked
+                if stream.read(1):
+                    raise ValueError("Stream holds more data than listed")
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            logger.debug(f"Streaming {len(destinations)} members failed: {e}")
+            for member in written:
+                destinations[member].unlink(missing_ok=True)
+            return set()
+
+        return written
+
     def _list_contents(self) -> List[str]:
         """
         List archive contents (internal method).
@@ -759,16 +1219,14 @@ class SevenZipFile:
         Returns:
             List of file names in the archive
         """
-        if not self.file.exists():
-            raise FileNotFoundError(f"Archive not found: {self.file}")
+        self._check_archive_exists()
 
         # Use detailed info parsing for reliable filename extraction
         # This avoids issues with space parsing in standard 7zz list output
         try:
-            detailed_info = self._get_detailed_info()
-
-            # Extract filenames, excluding directories
-            files = [info.filename for info in detailed_info if not info.is_dir()]
+            # Raw filenames excluding directories, prebuilt with the name index
+            self._refresh_member_index()
+            files = list(self._files_cache)
 
             # Perform security checks on file list
             from .security import check_file_count_security
@@ -793,14 +1251,78 @@ class SevenZipFile:
         """
         Internal method to get detailed archive information using 7zz -slt.
 
+        The parsed listing is cached until the archive is modified through
+        this object, the password changes, or the archive is closed.
+
         Returns:
             List of ArchiveInfo objects with comprehensive metadata
         """
-        from .detailed_parser import get_detailed_archive_info
-
-        # Pass password if available
-        password = getattr(self, "_password", None)
-        return get_detailed_archive_info(self.file, password)
+        with self._cache_lock:
+            if self._info_cache is None:
+                from .detailed_parser import get_detailed_archive_info
+
+                # Pass password if available
+                password = getattr(self, "_password", None)
+                self._info_cache = get_detailed_archive_info(self.file, password)
+
+            return self._info_cache
+
+    def _refresh_member_index(self) -> None:
+        """Rebuild the name lookups if the underlying member list has changed."""
+        with self._cache_lock:
+            info_list = self._get_detailed_info()
+            if info_list is self._index_source:
+                return
+
+            names = []
+            files = []
+            by_name: Dict[str, ArchiveInfo] = {}
+            name_index: Dict[str, str] = {}
+            for info in info_list:
+                # First entry wins for duplicate names, matching a linear scan
+                by_name.setdefault(info.filename, info)
+                # Separator- and whitespace-insensitive lookup, e.g. for
+                # "puzzles/puzzle 10.txt" stored as "puzzles\\puzzle 10.txt"
+                normalized_key = self._normalize_path(info.filename)
+                if normalized_key:
+                    name_index.setdefault(normalized_key, info.filename)
+                # Skip directories - zipfile.ZipFile.namelist() only returns files
+                if info.is_dir():
+                    continue
+                files.append(info.filename)
+                normalized = self._normalize_path(info.filename)
+                if normalized:  # Skip empty or invalid entries
+                    names.append(normalized)
+
+            self._namelist_cache = names
+            self._files_cache = files
+            self._info_by_name = by_name
+            self._name_index = name_index
+            self._index_source = info_list
+
+    def _check_archive_exists(self) -> None:
+        """
+        Raise FileNotFoundError unless the archive file exists.
+
+        A positive result is remembered until the cached state is dropped, so
+        repeated operations on an open archive stat the file only once.
+        """
+        if not self._archive_exists:
+            if not self.file.exists():
+                raise FileNotFoundError(f"Archive not found: {self.file}")
+            self._archive_exists = True
+
+    def _invalidate_cache(self) -> None:
+        """Drop the cached member listing and everything derived from it."""
+        with self._cache_lock:
+            self._archive_exists = False
+            self._info_cache = None
+            self._names_only_cache = None
+            self._index_source = None
+            self._namelist_cache = []
+            self._files_cache = []
+            self._info_by_name = {}
+            self._name_index = {}
 
     # zipfile/tarfile compatibility methods
 
@@ -819,17 +1341,35 @@ class SevenZipFile:
                 operation="namelist",
             )
 
-        # Use infolist() and filter out directories for consistency with zipfile behavior
-        info_list = self.infolist()
-        normalized_files = []
-        for info in info_list:
-            # Skip directories - zipfile.ZipFile.namelist() only returns files
-            if info.is_dir():
-                continue
-            normalized = self._normalize_path(info.filename)
-            if normalized:  # Skip empty or invalid entries
-                normalized_files.append(normalized)
-        return normalized_files
+        with self._cache_lock:
+            if self._info_cache is None:
+                # Names only: skip the full -slt parse until metadata is needed
+                if self._names_only_cache is None:
+                    self._names_only_cache = self._list_names()
+                return list(self._names_only_cache)
+
+        # Built from the cached listing with directories filtered out
+        # for consistency with zipfile behavior
+        self._refresh_member_index()
+        return list(self._namelist_cache)
+
+    def _list_names(self) -> List[str]:
+        """
+        List file names using the lightweight 7zz -ba -slt listing.
+
+        Returns:
+            Normalized file names, with directories filtered out
+        """
+        from .detailed_parser import get_archive_member_names
+
+        password = getattr(self, "_password", None)
+        names = []
+        # Directories are already dropped while the listing is parsed
+        for path in get_archive_member_names(self.file, password):
+            normalized = self._normalize_path(path)
+            if normalized:
+                names.append(normalized)
+        return names
 
     def getnames(self) -> List[str]:
         """
@@ -864,13 +1404,12 @@ class SevenZipFile:
         Raises:
             KeyError: If the member is not found in the archive
         """
-        members = self._get_detailed_info()
+        self._refresh_member_index()
 
-        for member in members:
-            if member.filename == name:
-                return member
-
-        raise KeyError(f"File '{name}' not found in archive")
+        try:
+            return self._info_by_name[name]
+        except KeyError:
+            raise KeyError(f"File '{name}' not found in archive") from None
 
     def getmembers(self) -> List[ArchiveInfo]:
         """
@@ -912,8 +1451,10 @@ class SevenZipFile:
         if self.mode == "w":
             raise ValueError("Cannot extract from archive opened in write mode")
 
-        if not self.file.exists():
-            raise FileNotFoundError(f"Archive not found: {self.file}")
+        self._check_archive_exists()
+
+        if members is not None and not members:
+            return  # Nothing selected; leave the file system untouched
 
         path = Path(path)
         path.mkdir(parents=True, exist_ok=True)
@@ -937,14 +1478,12 @@ class SevenZipFile:
             return  # Nothing to extract
 
         # Build 7z command for selective extraction
-        args = ["x", str(self.file), f"-o{target_path}", "-y"]
-
-        # Add specific file names to extract
-        args.extend(members)
+        args = [*_EXTRACT_BASE, str(self.file), f"-o{target_path}", "-y"]
 
         try:
             # First attempt: direct selective extraction
-            run_7z(args)
+            with _member_selection(members) as selection:
+                run_7z([*args, *selection])
             logger.debug(f"Successfully extracted {len(members)} selected members")
 
         except subprocess.CalledProcessError as e:
@@ -987,8 +1526,9 @@ class SevenZipFile:
         all_files = self._list_contents()
 
         # Filter to only the requested members that exist in the archive
-        existing_members = [f for f in requested_members if f in all_files]
-        missing_members = [f for f in requested_members if f not in all_files]
+        archive_files = set(all_files)
+        existing_members = [f for f in requested_members if f in archive_files]
+        missing_members = [f for f in requested_members if f not in archive_files]
 
         if missing_members:
             logger.warning(f"Requested members not found in archive: {missing_members}")
@@ -1008,16 +1548,12 @@ class SevenZipFile:
                 problematic_files=problematic_files,
             )
 
-        # Generate sanitization mapping for all files (needed for context)
-        full_file_list = self._list_contents()
-        full_sanitization_mapping = get_sanitization_mapping(full_file_list)
-
-        # Filter mapping to only requested members
-        selective_mapping = {
-            original: sanitized
-            for original, sanitized in full_sanitization_mapping.items()
-            if original in existing_members
-        }
+        # Generate sanitization mapping for the requested members only, in
+        # archive order, reusing the listing above rather than asking 7zz again
+        requested_set = set(existing_members)
+        selective_mapping = get_sanitization_mapping(
+            [f for f in all_files if f in requested_set]
+        )
 
         if not selective_mapping:
             raise FilenameCompatibilityError(
@@ -1028,76 +1564,209 @@ class SevenZipFile:
         # Log the changes that will be made
         log_sanitization_changes(selective_mapping)
 
-        # Extract files individually with sanitized names
-        extracted_count = 0
-        failed_files = []
+        # Extract files individually with sanitized names, replacing existing ones
+        self._extract_files_individually(target_path, selective_mapping, True)
 
-        for original_name, sanitized_name in selective_mapping.items():
-            try:
-                # Create a temporary file for this specific extraction
-                with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                    temp_path = Path(temp_file.name)
-
-                # Try to extract this specific file
-                args = [
-                    "e",
-                    str(self.file),
-                    f"-o{temp_path.parent}",
-                    original_name,
-                    "-y",
-                ]
-
-                try:
-                    run_7z(args)
-
-                    # Move to final location with sanitized name
-                    final_path = target_path / sanitized_name
-                    final_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    if final_path.exists():
-                        logger.warning(f"Overwriting existing file: {final_path}")
-                        final_path.unlink()
-
-                    shutil.move(str(temp_path), str(final_path))
-                    extracted_count += 1
-                    logger.debug(
-                        f"Individually extracted {original_name} as {sanitized_name}"
-                    )
+    def read(self, name: str) -> bytes:
+        """
+        Read and return the bytes of a file in the archive.
+        Compatible with zipfile.ZipFile.read().
 
-                except subprocess.CalledProcessError:
-                    failed_files.append(original_name)
-                    temp_path.unlink(missing_ok=True)
+        The member is streamed from 7zz's stdout (-so), so nothing is
+        written to disk unless the streamed data does not match the listed
+        size.
 
-            except Exception as e:
-                failed_files.append(original_name)
-                logger.error(f"Failed to extract {original_name}: {e}")
+        Args:
+            name: Name of the file in the archive
 
-        if failed_files:
-            logger.warning(
-                f"Failed to extract {len(failed_files)} files: {failed_files[:5]}..."
+        Returns:
+            File contents as bytes
+
+        Raises:
+            OperationError: If archive is opened in write mode
+            FileNotFoundError: If the archive or the requested file is missing
+            IsADirectoryError: If the requested member is a directory
+            RuntimeError: If extraction fails
+        """
+        resolved = self._resolve_for_read([name])
+        actual_file_to_use = resolved[name]
+        info = self._info_by_name[actual_file_to_use]
+        if info.is_dir():
+            raise IsADirectoryError(
+                f"Cannot read directory from archive: {actual_file_to_use}"
             )
 
-        if extracted_count == 0:
-            raise FilenameCompatibilityError(
-                f"Unable to extract any requested files even with sanitization. Failed files: {failed_files[:10]}",
-                problematic_files=list(selective_mapping.keys()),
-                sanitized=True,
+        # Stream the single member to stdout instead of a temporary directory;
+        # -spd keeps names containing "*" or "?" from matching other members
+        selection = ["-spd", actual_file_to_use]
+
+        # Add password if available
+        if hasattr(self, "_password") and self._password is not None:
+            # Convert bytes password to string for 7zz command
+            password_str = (
+                self._password.decode("utf-8")
+                if isinstance(self._password, bytes)
+                else str(self._password)
             )
+            selection.append(f"-p{password_str}")
 
-        logger.info(
-            f"Successfully extracted {extracted_count} selected files with sanitized names"
-        )
+        try:
+            data = run_7z(
+                [*_STREAM_BASE, str(self.file), *selection], text=False
+            ).stdout
+        except subprocess.CalledProcessError as e:
+            stderr = (
+                e.stderr.decode("utf-8", errors="replace")
+                if isinstance(e.stderr, bytes)
+                else e.stderr
+            )
+            raise RuntimeError(
+                f"Failed to extract file {actual_file_to_use}: {stderr}"
+            ) from e
 
-    def read(self, name: str) -> bytes:
+        if len(data) == info.file_size:
+            return data
+
+        # Listed size does not match the stream (e.g. links or unknown sizes):
+        # extract to disk and read the file back instead
+        with tempfile.TemporaryDirectory() as tmpdir:
+            return self._read_via_extraction(Path(tmpdir), resolved, selection)[name]
+
+    def read_many(self, names: List[str]) -> Dict[str, bytes]:
         """
-        Read and return the bytes of a file in the archive.
-        Compatible with zipfile.ZipFile.read().
+        Read the bytes of several files in the archive with a single 7zz call.
+
+        All requested members are streamed from one 7zz process, so solid
+        blocks are decompressed once instead of once per member and nothing
+        is written to disk. 7zz emits the members back to back in archive
+        order, and the listed sizes are used to split the stream.
 
         Args:
-            name: Name of the file in the archive
+            names: Names of the files in the archive
 
         Returns:
-            File contents as bytes
+            Dictionary mapping each requested name to its contents as bytes
+
+        Raises:
+            OperationError: If archive is opened in write mode
+            FileNotFoundError: If the archive or any requested file is missing
+            IsADirectoryError: If any requested member is a directory
+            RuntimeError: If extraction fails
+        """
+        resolved = self._resolve_for_read(names)
+
+        if not resolved:
+            return {}
+
+        members = list(dict.fromkeys(resolved.values()))
+        directories = [name for name in members if self._info_by_name[name].is_dir()]
+        if directories:
+            raise IsADirectoryError(
+                f"Cannot read directories from archive: {directories[:5]}"
+            )
+
+        wanted = set(members)
+        sizes = [
+            (info.filename, info.file_size)
+            for info in self._get_detailed_info()
+            if info.filename in wanted and not info.is_dir()
+        ]
+
+        # Select members via a list file to keep the command line short, with
+        # wildcard matching disabled so each name selects only itself
+        selection = ["-spd", "-scsUTF-8"]
+
+        # Add password if available
+        if hasattr(self, "_password") and self._password is not None:
+            # Convert bytes password to string for 7zz command
+            password_str = (
+                self._password.decode("utf-8")
+                if isinstance(self._password, bytes)
+                else str(self._password)
+            )
+            selection.append(f"-p{password_str}")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            list_file = tmpdir_path / "members.txt"
+            list_file.write_text("\n".join(members) + "\n", encoding="utf-8")
+            selection.append(f"-i@{list_file}")
+
+            try:
+                data = run_7z(
+                    [*_STREAM_BASE, str(self.file), *selection], text=False
+                ).stdout
+            except subprocess.CalledProcessError as e:
+                stderr = (
+                    e.stderr.decode("utf-8", errors="replace")
+                    if isinstance(e.stderr, bytes)
+                    else e.stderr
+                )
+                raise RuntimeError(
+                    f"Failed to extract files {members}: {stderr}"
+                ) from e
+
+            if len(data) == sum(size for _, size in sizes):
+                contents: Dict[str, bytes] = {}
+                offset = 0
+                for member, size in sizes:
+                    # First entry wins for duplicate names, as in getinfo()
+                    contents.setdefault(member, data[offset : offset + size])
+                    offset += size
+                return {name: contents[actual] for name, actual in resolved.items()}
+
+            # Listed sizes do not add up (e.g. links or unknown sizes):
+            # extract to disk and read the files back instead
+            return self._read_via_extraction(tmpdir_path / "out", resolved, selection)
+
+    def _read_via_extraction(
+        self, output_dir: Path, resolved: Dict[str, str], selection: List[str]
+    ) -> Dict[str, bytes]:
+        """
+        Extract members to a temporary directory and read them back.
+
+        Used when the streamed data does not match the listed sizes.
+
+        Args:
+            output_dir: Temporary directory to extract into
+            resolved: Mapping of requested names to member names
+            selection: 7zz arguments selecting the members
+
+        Returns:
+            Dictionary mapping each requested name to its contents as bytes
+
+        Raises:
+            FileNotFoundError: If a member was not extracted
+            RuntimeError: If extraction fails
+        """
+        args = [*_EXTRACT_BASE, str(self.file), f"-o{output_dir}", "-y", *selection]
+        try:
+            run_7z(args)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(
+                f"Failed to extract files {list(dict.fromkeys(resolved.values()))}: "
+                f"{e.stderr}"
+            ) from e
+
+        return {
+            name: self._read_extracted(output_dir, actual)
+            for name, actual in resolved.items()
+        }
+
+    def _resolve_for_read(self, names: List[str]) -> Dict[str, str]:
+        """
+        Check the archive is readable and map requested names to members.
+
+        Args:
+            names: Requested file names
+
+        Returns:
+            Dictionary mapping each requested name to the member name
+            exactly as stored in the archive
+
+        Raises:
+            OperationError: If archive is opened in write mode
+            FileNotFoundError: If the archive or any requested file is missing
         """
         if self.mode == "w":
             from .exceptions import OperationError
@@ -1106,96 +1775,100 @@ class SevenZipFile:
                 "Cannot read from archive opened in write mode", operation="read"
             )
 
-        if not self.file.exists():
-            raise FileNotFoundError(f"Archive not found: {self.file}")
+        self._check_archive_exists()
+
+        # Resolve every requested name against the archive listing up front
+        # This uses the same data source as namelist() for consistency
+        # Exact names hit the prebuilt index; only misses scan the members
+        self._refresh_member_index()
+        return {
+            name: name if name in self._info_by_name else self._resolve_member(name)
+            for name in names
+        }
+
+    def _resolve_member(self, name: str) -> str:
+        """
+        Find the archive member that a user-supplied name refers to.
+
+        Expects the member index to be current; see _refresh_member_index().
+
+        Args:
+            name: Requested file name
+
+        Returns:
+            Member name exactly as stored in the archive
 
+        Raises:
+            FileNotFoundError: If no member matches
+        """
         # Normalize the requested filename
         normalized_name = self._normalize_path(name)
 
-        # Get the actual file list from infolist to ensure accurate matching
-        # This uses the same data source as namelist() for consistency
-        info_list = self.infolist()
-        actual_files = [info.filename for info in info_list]
-        actual_file_to_use = None
-
         # Try to find exact match first
-        for actual_file in actual_files:
-            if self._normalize_path(actual_file) == normalized_name:
-                actual_file_to_use = actual_file
-                break
+        actual_match = self._name_index.get(normalized_name)
+        if actual_match is not None:
+            return actual_match
 
         # If no exact match, try different path variations
-        if not actual_file_to_use:
-            for actual_file in actual_files:
-                normalized_actual = self._normalize_path(actual_file)
-                # Try with different separators and cases
-                if (
-                    normalized_actual.lower() == normalized_name.lower()
-                    or normalized_actual.replace("/", "\\")
-                    == normalized_name.replace("/", "\\")
-                    or normalized_actual.endswith("/" + normalized_name)
-                    or actual_file.endswith(normalized_name)
-                ):
-                    actual_file_to_use = actual_file
-                    break
-
-        if not actual_file_to_use:
-            # List available files for better error message using normalized names
-            available_files = [
-                self._normalize_path(info.filename)
-                for info in info_list
-                if self._normalize_path(info.filename)
-            ]
-            raise FileNotFoundError(
-                f"File '{name}' not found in archive. Available files: {available_files[:5]}..."
-            )
+        actual_files = self._info_by_name
+        for actual_file in actual_files:
+            normalized_actual = self._normalize_path(actual_file)
+            # Try with different separators and cases
+            if (
+                normalized_actual.lower() == normalized_name.lower()
+                or normalized_actual.replace("/", "\\")
+                == normalized_name.replace("/", "\\")
+                or normalized_actual.endswith("/" + normalized_name)
+                or actual_file.endswith(normalized_name)
+            ):
+                return actual_file
+
+        # List available files for better error message using normalized names
+        available_files = [
+            self._normalize_path(actual_file)
+            for actual_file in actual_files
+            if self._normalize_path(actual_file)
+        ]
+        raise FileNotFoundError(
+            f"File '{name}' not found in archive. Available files: {available_files[:5]}..."
+        )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Extract specific file to temporary directory with full paths
-            args = ["x", str(self.file), f"-o{tmpdir}", actual_file_to_use, "-y"]
-
-            # Add password if available
-            if hasattr(self, "_password") and self._password is not None:
-                # Convert bytes password to string for 7zz command
-                password_str = (
-                    self._password.decode("utf-8")
-                    if isinstance(self._password, bytes)
-                    else str(self._password)
-                )
-                args.append(f"-p{password_str}")
+    def _read_extracted(self, output_dir: Path, actual_file: str) -> bytes:
+        """
+        Read an extracted member back from a temporary extraction directory.
 
-            try:
-                run_7z(args)
+        Args:
+            output_dir: Directory the archive was extracted into
+            actual_file: Member name exactly as stored in the archive
 
-                # Try to find the extracted file - it might be in a subdirectory
-                tmpdir_path = Path(tmpdir)
-
-                # First try the direct path
-                extracted_file = tmpdir_path / actual_file_to_use
-                if extracted_file.exists():
-                    return extracted_file.read_bytes()
-
-                # If not found, search recursively in the temp directory
-                for extracted_file in tmpdir_path.rglob("*"):
-                    if extracted_file.is_file():
-                        # Check if this matches our target file
-                        relative_path = extracted_file.relative_to(tmpdir_path)
-                        if (
-                            str(relative_path) == actual_file_to_use
-                            or str(relative_path).replace("\\", "/")
-                            == actual_file_to_use.replace("\\", "/")
-                            or extracted_file.name == Path(actual_file_to_use).name
-                        ):
-                            return extracted_file.read_bytes()
-
-                raise FileNotFoundError(
-                    f"File not found in archive after extraction: {actual_file_to_use}"
-                )
+        Returns:
+            File contents as bytes
 
-            except subprocess.CalledProcessError as e:
-                raise RuntimeError(
-                    f"Failed to extract file {actual_file_to_use}: {e.stderr}"
-                ) from e
+        Raises:
+            FileNotFoundError: If the member was not extracted
+        """
+        # First try the direct path
+        extracted_file = output_dir / actual_file
+        if extracted_file.exists():
+            return extracted_file.read_bytes()
+
+        # If not found, it might be in a subdirectory; search recursively
+        if output_dir.exists():
+            for extracted_file in output_dir.rglob("*"):
+                if extracted_file.is_file():
+                    # Check if this matches our target file
+                    relative_path = extracted_file.relative_to(output_dir)
+                    if (
+                        str(relative_path) == actual_file
+                        or str(relative_path).replace("\\", "/")
+                        == actual_file.replace("\\", "/")
+                        or extracted_file.name == Path(actual_file).name
+                    ):
+                        return extracted_file.read_bytes()
+
+        raise FileNotFoundError(
+            f"File not found in archive after extraction: {actual_file}"
+        )
 
     def writestr(self, filename: str, data: Union[str, bytes]) -> None:
         """
@@ -1230,10 +1903,9 @@ class SevenZipFile:
         Returns:
             None if archive is OK, otherwise name of first bad file
         """
-        if not self.file.exists():
-            raise FileNotFoundError(f"Archive not found: {self.file}")
+        self._check_archive_exists()
 
-        args = ["t", str(self.file)]
+        args = [*_TEST_BASE, str(self.file)]
 
         # Add password if available
         if hasattr(self, "_password") and self._password is not None:
@@ -1264,13 +1936,55 @@ class SevenZipFile:
             # If we can't parse the error, return a generic error indicator
             return "unknown_file"
 
+    # Background variants, run on the shared run_7z_async() worker pool. They
+    # return concurrent.futures.Future rather than awaitables; use
+    # AsyncSevenZipFile from asyncio code. Reads may run concurrently on one
+    # instance, which serializes access to its cached listing, but the
+    # archive should not be modified while they are pending.
+
+    def submit_extract(
+        self, path: Union[str, Path] = ".", overwrite: bool = False
+    ) -> "Future[None]":
+        """
+        Extract archive contents in a background thread.
+
+        Args:
+            path: Directory to extract to
+            overwrite: Whether to overwrite existing files
+
+        Returns:
+            Future resolving once extract() has finished
+        """
+        return _EXECUTOR.submit(self.extract, path, overwrite)
+
+    def submit_read(self, name: str) -> "Future[bytes]":
+        """
+        Read a file from the archive in a background thread.
+
+        Args:
+            name: Name of file in archive
+
+        Returns:
+            Future resolving to the file contents, as returned by read()
+        """
+        return _EXECUTOR.submit(self.read, name)
+
+    def submit_namelist(self) -> "Future[List[str]]":
+        """
+        List archive members in a background thread.
+
+        Returns:
+            Future resolving to the member names, as returned by namelist()
+        """
+        return _EXECUTOR.submit(self.namelist)
+
     def close(self) -> None:
         """
         Close the archive.
         Compatible with zipfile.ZipFile.close() and tarfile.TarFile.close().
         """
-        # py7zz doesn't maintain persistent file handles, so this is a no-op
-        pass
+        # py7zz doesn't maintain persistent file handles; just drop cached state
+        self._invalidate_cache()
 
     def __iter__(self) -> Iterator[str]:
         """
@@ -1354,6 +2068,8 @@ class SevenZipFile:
         """
         # Store password for future use
         self._password = pwd
+        # The listing may differ once the password can decrypt headers
+        self._invalidate_cache()
 
     def comment(self) -> bytes:
         """
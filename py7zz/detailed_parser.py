@@ -8,17 +8,77 @@ comprehensive metadata about archive members.
 """
 
 import re
+import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 from .archive_info import ArchiveInfo
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# "Path = ..." and "Attributes = ..." lines, all a name-only listing needs
+_SLT_NAME_RE = re.compile(
+    r"^[ \t]*(Path|Attributes)[ \t]*=[ \t]*([^\r\n]*?)[ \t]*\r?$", re.M
+)
+
+# Long dashes (----------) mark the start of individual file entries
+_SLT_SEPARATOR_RE = re.compile(r"^[ \t]*-{10}", re.M)
+
+# (year, month, day, hour, minute, second), as in zipfile.ZipInfo.date_time
+_DateTuple = Tuple[int, int, int, int, int, int]
+
+# "YYYY-MM-DD[ HH:MM:SS]" (or slash-separated) prefix of a timestamp; any
+# fractional seconds or other trailing text is ignored
+_DATETIME_RE = re.compile(
+    r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})(?:\s+(\d{1,2}):(\d{1,2}):(\d{1,2}))?"
+)
+
+# Day-first "DD/MM/YYYY HH:MM:SS" timestamp
+_DMY_DATETIME_RE = re.compile(
+    r"(\d{1,2})/(\d{1,2})/(\d{4}) (\d{1,2}):(\d{1,2}):(\d{1,2})$"
+)
+
+# Map 7zz attribute letters to Windows file attribute bits
+_ATTRIBUTE_LETTERS = {
+    "D": 0x10,  # FILE_ATTRIBUTE_DIRECTORY
+    "A": 0x20,  # FILE_ATTRIBUTE_ARCHIVE
+    "R": 0x01,  # FILE_ATTRIBUTE_READONLY
+    "H": 0x02,  # FILE_ATTRIBUTE_HIDDEN
+    "S": 0x04,  # FILE_ATTRIBUTE_SYSTEM
+}
+
+# Attribute bit for every byte value, letters matched case-insensitively
+_ATTRIBUTE_BITS = [_ATTRIBUTE_LETTERS.get(chr(i).upper(), 0) for i in range(256)]
+
+# 7zz list command prefixes: full technical listing, and bare names-only listing
+_LIST_DETAILED_BASE = ("l", "-slt")
+_LIST_NAMES_BASE = ("l", "-ba", "-slt")
+
+# Archive-level properties listed in the header section
+_ARCHIVE_LEVEL_PROPS = frozenset(
+    ["Type", "Physical Size", "Headers Size", "Method", "Solid", "Blocks"]
+)
+
+# Properties that mark an entry as a real archive member
+_MEMBER_PROPS = frozenset(
+    [
+        "Size",
+        "Packed Size",
+        "Modified",
+        "Attributes",
+        "CRC",
+        "Method",
+        "Solid",
+        "Encrypted",
+        "Comment",
+    ]
+)
+
 
-def parse_7zz_slt_output(output: str) -> List[ArchiveInfo]:
+def parse_7zz_slt_output(output: Union[str, bytes]) -> List[ArchiveInfo]:
     """
     Parse 7zz -slt output to extract detailed archive member information.
 
@@ -36,129 +96,194 @@ def parse_7zz_slt_output(output: str) -> List[ArchiveInfo]:
     Encrypted = -
 
     Args:
-        output: Raw output from 7zz -slt command
+        output: Raw output from 7zz -slt command, as text or as the
+            UTF-8 bytes 7zz writes
 
     Returns:
         List of ArchiveInfo objects with parsed metadata
     """
-    members: List[ArchiveInfo] = []
-    current_member: Optional[ArchiveInfo] = None
-    member_has_props = False  # Track if current member has any file-level properties
-    in_archive_header = True  # Track if we're still in archive header section
+    members = list(iter_parse_7zz_slt_output(output))
+    logger.debug(f"Parsed {len(members)} archive members from 7zz -slt output")
+    return members
 
-    lines = output.split("\n")
 
-    for line in lines:
-        line = line.strip()
+def iter_parse_7zz_slt_output(output: Union[str, bytes]) -> Iterator[ArchiveInfo]:
+    """
+    Parse 7zz -slt output lazily, yielding each member as its entry ends.
 
-        # Skip empty lines and separators; the long dashes indicate file entries start
-        if not line or line.startswith("=="):
-            continue
+    Same parsing as parse_7zz_slt_output(); callers that stop early, e.g.
+    after finding one member, skip building ArchiveInfo objects for the rest.
 
-        # Long dashes (----------) indicate start of individual file entries
-        if line.startswith("----------"):
-            in_archive_header = False
-            continue
+    Args:
+        output: Raw output from 7zz -slt command, as text or as the
+            UTF-8 bytes 7zz writes
+
+    Yields:
+        ArchiveInfo objects in listing order
+    """
+    output = _decode_listing(output)
+    current_path: Optional[str] = None
+    current_props: Dict[str, str] = {}
+
+    # Long dashes (----------) separate the archive header from file entries,
+    # so everything up to the first of them is skipped in one step. Outputs
+    # without them are treated as header-only, where "Path" still starts a
+    # member so minimal listings parse correctly.
+    separator = _SLT_SEPARATOR_RE.search(output)
+    if separator:
+        output = output[separator.end() :]
+        skipped_props: FrozenSet[str] = frozenset()
+    else:
+        skipped_props = _ARCHIVE_LEVEL_PROPS
 
-        # Short dashes (--) indicate archive metadata section
-        if line.startswith("--") and in_archive_header:
+    for line in output.split("\n"):
+        # "Property = Value" lines split at their first "=", blanks trimmed
+        prop, sep, value = line.partition("=")
+        if not sep:
             continue
 
-        # Skip header information until we reach file entries
-        if any(
-            line.startswith(prefix)
-            for prefix in [
-                "Listing archive:",
-                "7-Zip",
-            ]
-        ):
+        prop = prop.strip(" \t")
+        # Skip known archive-level properties when in header section
+        if prop in skipped_props:
             continue
+        value = value.strip(" \t\r")
 
-        # Parse property lines (format: "Property = Value")
-        if "=" in line:
-            prop, value = line.split("=", 1)
-            prop = prop.strip()
-            value = value.strip()
-
-            # Skip known archive-level properties when in header section,
-            # but allow "Path" to start a member for minimal outputs where
-            # the separator lines (----------) are omitted.
-            if in_archive_header and prop in [
-                "Type",
-                "Physical Size",
-                "Headers Size",
-                "Method",
-                "Solid",
-                "Blocks",
-            ]:
-                continue
-
-            # Start of new file entry
-            if prop == "Path":
-                # Save previous member if it had any file-level properties
-                if current_member is not None and member_has_props:
-                    members.append(current_member)
-
-                # Start new member
-                current_member = ArchiveInfo(value)
-                member_has_props = False
-                continue
-
-            # Skip if no current member
-            if current_member is None:
-                continue
-
-            # Parse different properties
-            if prop == "Size":
-                current_member.file_size = _parse_int(value, 0)
-                member_has_props = True
-
-            elif prop == "Packed Size":
-                current_member.compress_size = _parse_int(value, 0)
-                member_has_props = True
-
-            elif prop == "Modified":
-                current_member.date_time, current_member.mtime = _parse_datetime(value)
-                member_has_props = True
-
-            elif prop == "Attributes":
-                current_member.external_attr = _parse_attributes(value)
-                current_member.type = _determine_file_type(
-                    value, current_member.filename
-                )
-                member_has_props = True
-
-            elif prop == "CRC":
-                current_member.CRC = _parse_int(value, 0, base=16) if value != "" else 0
-                member_has_props = True
-
-            elif prop == "Method":
-                current_member.compress_type = value if value else ""
-                current_member.method = value if value else ""
-                # Method may appear for both archive and file entries; do not
-                # mark as file-level property by itself when still in header.
-                if not in_archive_header:
-                    member_has_props = True
-
-            elif prop == "Solid":
-                current_member.solid = value == "+"
-                if not in_archive_header:
-                    member_has_props = True
-
-            elif prop == "Encrypted":
-                current_member.encrypted = value == "+"
-                member_has_props = True
-
-            elif prop == "Comment":
-                current_member.comment = value
-                member_has_props = True
-
-    # Add the last member if it had any file-level properties
-    if current_member is not None and member_has_props:
-        members.append(current_member)
+        # Start of new file entry; 7zz separates entries only by blank lines
+        if prop == "Path":
+            member = _build_member(current_path, current_props)
+            if member is not None:
+                yield member
+            current_path = value
+            current_props = {}
+        elif current_path is not None:
+            current_props[prop] = value
 
-    logger.debug(f"Parsed {len(members)} archive members from 7zz -slt output")
-    return members
+    # Yield the last member if it had any file-level properties
+    member = _build_member(current_path, current_props)
+    if member is not None:
+        yield member
+
+
+def _decode_listing(output: Union[str, bytes]) -> str:
+    """
+    Decode raw 7zz listing output in one pass.
+
+    7zz writes listings as UTF-8. Decoding the captured bytes directly skips
+    the locale-dependent codec and newline translation of text-mode pipes;
+    the property parsers already accept both line ending styles. Every
+    property value ends up as str, so one bulk decode is cheaper than
+    parsing bytes and decoding each value separately.
+
+    Args:
+        output: Listing as captured bytes, or already decoded text
+
+    Returns:
+        Listing text
+    """
+    if isinstance(output, bytes):
+        return output.decode("utf-8", errors="replace")
+    return output
+
+
+def _build_member(path: Optional[str], props: Dict[str, str]) -> Optional[ArchiveInfo]:
+    """
+    Build an ArchiveInfo from one entry's collected -slt properties.
+
+    Args:
+        path: Value of the entry's "Path" property
+        props: Remaining properties of the entry, by name
+
+    Returns:
+        ArchiveInfo, or None if the entry has no file-level properties
+    """
+    if path is None or _MEMBER_PROPS.isdisjoint(props):
+        return None
+
+    member = ArchiveInfo(path)
+
+    if "Size" in props:
+        member.file_size = _parse_int(props["Size"], 0)
+
+    if "Packed Size" in props:
+        member.compress_size = _parse_int(props["Packed Size"], 0)
+
+    if "Modified" in props:
+        # mtime is derived from date_time only when it is read
+        member.date_time = _parse_date_time(props["Modified"])
+
+    if "Attributes" in props:
+        attributes = props["Attributes"]
+        member.external_attr = _parse_attributes(attributes)
+        member.type = _determine_file_type(attributes, path)
+
+    if "CRC" in props:
+        member.CRC = _parse_int(props["CRC"], 0, base=16)
+
+    if "Method" in props:
+        # The same few method strings repeat across members; share one copy
+        method = sys.intern(props["Method"])
+        member.compress_type = method
+        member.method = method
+
+    if "Solid" in props:
+        member.solid = props["Solid"] == "+"
+
+    if "Encrypted" in props:
+        member.encrypted = props["Encrypted"] == "+"
+
+    if "Comment" in props:
+        member.comment = props["Comment"]
+
+    return member
+
+
+def parse_7zz_slt_names(
+    output: Union[str, bytes], dir_names: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Parse only file paths from 7zz -slt output.
+
+    Lighter than parse_7zz_slt_output() for callers that only need names:
+    every property other than Path and Attributes is skipped, no ArchiveInfo
+    objects are built, and directory entries are dropped as they are parsed.
+
+    Args:
+        output: Raw output from 7zz -slt command, typically with -ba, as text
+            or as the UTF-8 bytes 7zz writes
+        dir_names: Optional list that directory paths are appended to
+
+    Returns:
+        Paths of non-directory members in listing order
+    """
+    output = _decode_listing(output)
+    # Skip the archive header when present; bare (-ba) output has none
+    separator = _SLT_SEPARATOR_RE.search(output)
+    if separator:
+        output = output[separator.start() :]
+
+    files: List[str] = []
+    current_path: Optional[str] = None
+    is_dir = False
+
+    for prop, value in _SLT_NAME_RE.findall(output):
+        if prop == "Path":
+            if current_path is not None:
+                if not is_dir:
+                    files.append(current_path)
+                elif dir_names is not None:
+                    dir_names.append(current_path)
+            current_path = value
+            is_dir = value.endswith("/")
+        elif current_path is not None:
+            is_dir = _determine_file_type(value, current_path) == "dir"
+
+    if current_path is not None:
+        if not is_dir:
+            files.append(current_path)
+        elif dir_names is not None:
+            dir_names.append(current_path)
+
+    return files
 
 
 def _parse_int(value: str, default: int = 0, base: int = 10) -> int:
@@ -173,75 +298,97 @@ def _parse_int(value: str, default: int = 0, base: int = 10) -> int:
     Returns:
         Parsed integer or default value
     """
+    if not value:
+        return default
     try:
-        if not value or value == "":
-            return default
         return int(value, base)
     except (ValueError, TypeError):
         logger.warning(f"Failed to parse integer value: {value}")
         return default
 
 
-def _parse_datetime(value: str) -> Tuple[Optional[Tuple], Optional[float]]:
+def _parse_datetime(value: str) -> Tuple[Optional[_DateTuple], Optional[float]]:
     """
     Parse datetime string from 7zz output.
 
-    7zz outputs datetime in format: "YYYY-MM-DD HH:MM:SS"
-
     Args:
         value: DateTime string from 7zz
 
     Returns:
         Tuple of (date_time tuple, unix timestamp) or (None, None)
     """
-    if not value or value == "":
+    date_tuple = _parse_date_time(value)
+    if date_tuple is None:
         return None, None
+    return date_tuple, datetime(*date_tuple).timestamp()
 
-    # Common 7zz datetime formats
-    formats = [
-        "%Y-%m-%d %H:%M:%S",  # "2024-01-15 10:30:45"
-        "%Y-%m-%d %H:%M:%S.%f",  # "2024-01-15 10:30:45.123"
-        "%Y-%m-%d",  # "2024-01-15" (date only)
-        "%Y/%m/%d %H:%M:%S",  # Alternative format
-        "%d/%m/%Y %H:%M:%S",  # DD/MM/YYYY format
-    ]
 
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(value, fmt)
-            date_tuple = (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
-            timestamp = dt.timestamp()
-            return date_tuple, timestamp
-        except ValueError:
-            continue
+@lru_cache(maxsize=4096)
+def _parse_date_time(value: str) -> Optional[_DateTuple]:
+    """
+    Parse datetime string from 7zz output into a date_time tuple.
 
-    # Try to parse partial matches
-    try:
-        # Extract year, month, day from various formats
-        match = re.match(
-            r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})(?:\s+(\d{1,2}):(\d{1,2}):(\d{1,2}))?",
-            value,
+    7zz outputs datetime in format: "YYYY-MM-DD HH:MM:SS[.fffffff]". Members
+    of one archive often share timestamps, so results are cached by raw
+    string; they are immutable tuples and safe to share. Sub-second digits
+    are dropped, as date_time has one-second resolution.
+
+    Args:
+        value: DateTime string from 7zz
+
+    Returns:
+        (year, month, day, hour, minute, second), or None if unparseable
+    """
+    if not value:
+        return None
+
+    # Fast path: slice the canonical fixed-width layout instead of strptime
+    if (
+        len(value) >= 19
+        and value[4] == value[7] == "-"
+        and value[10] == " "
+        and value[13] == value[16] == ":"
+        and (len(value) == 19 or value[19] == ".")
+    ):
+        digits = value[:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16]
+        digits += value[17:19]
+        if digits.isdecimal():
+            date_tuple: _DateTuple = (
+                int(digits[0:4]),
+                int(digits[4:6]),
+                int(digits[6:8]),
+                int(digits[8:10]),
+                int(digits[10:12]),
+                int(digits[12:14]),
+            )
+            try:
+                datetime(*date_tuple)
+                return date_tuple
+            except ValueError:
+                # Out-of-range fields, e.g. month 13; fall through to the warning
+                pass
+
+    # One regex scan per layout instead of trying strptime formats in turn
+    match = _DATETIME_RE.match(value)
+    if match:
+        year, month, day, hour, minute, second = (
+            int(group) if group else 0 for group in match.groups()
         )
+    else:
+        match = _DMY_DATETIME_RE.match(value)
         if match:
-            year, month, day = (
-                int(match.group(1)),
-                int(match.group(2)),
-                int(match.group(3)),
-            )
-            hour = int(match.group(4)) if match.group(4) else 0
-            minute = int(match.group(5)) if match.group(5) else 0
-            second = int(match.group(6)) if match.group(6) else 0
-
-            dt = datetime(year, month, day, hour, minute, second)
-            date_tuple = (year, month, day, hour, minute, second)
-            timestamp = dt.timestamp()
-            return date_tuple, timestamp
-    except (ValueError, TypeError):
-        # Date parsing failed, fall back to warning and return None
-        pass
+            day, month, year, hour, minute, second = map(int, match.groups())
+
+    if match:
+        try:
+            # Validates the fields, e.g. rejects month 13
+            datetime(year, month, day, hour, minute, second)
+            return (year, month, day, hour, minute, second)
+        except ValueError:
+            pass
 
     logger.warning(f"Failed to parse datetime value: {value}")
-    return None, None
+    return None
 
 
 def _parse_attributes(attributes: str) -> int:
@@ -265,19 +412,8 @@ def _parse_attributes(attributes: str) -> int:
         return 0
 
     attr_value = 0
-
-    # Map 7zz attribute letters to Windows file attribute bits
-    attr_map = {
-        "D": 0x10,  # FILE_ATTRIBUTE_DIRECTORY
-        "A": 0x20,  # FILE_ATTRIBUTE_ARCHIVE
-        "R": 0x01,  # FILE_ATTRIBUTE_READONLY
-        "H": 0x02,  # FILE_ATTRIBUTE_HIDDEN
-        "S": 0x04,  # FILE_ATTRIBUTE_SYSTEM
-    }
-
-    for char in attributes.upper():
-        if char in attr_map:
-            attr_value |= attr_map[char]
+    for byte in attributes.encode("ascii", "ignore"):
+        attr_value |= _ATTRIBUTE_BITS[byte]
 
     return attr_value
 
@@ -333,7 +469,7 @@ def get_detailed_archive_info(
         raise FileNotFoundError(f"Archive not found: {archive_path}")
 
     # Execute 7zz list command with technical information
-    args = ["l", "-slt", str(archive_path)]
+    args = [*_LIST_DETAILED_BASE, str(archive_path)]
 
     # Add password if provided
     if password is not None:
@@ -344,7 +480,7 @@ def get_detailed_archive_info(
         args.append(f"-p{password_str}")
 
     try:
-        result = run_7z(args)
+        result = run_7z(args, text=False)
         members = parse_7zz_slt_output(result.stdout)
 
         logger.info(
@@ -357,6 +493,53 @@ def get_detailed_archive_info(
         raise RuntimeError(f"Failed to get detailed archive information: {e}") from e
 
 
+def get_archive_member_names(
+    archive_path: Union[str, Path],
+    password: Optional[Union[str, bytes]] = None,
+    dir_names: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    Get the names of all files in an archive without their metadata.
+
+    This function executes '7zz l -ba -slt' and parses only the Path and
+    Attributes properties, which is much cheaper than a full listing.
+
+    Args:
+        archive_path: Path to the archive file
+        password: Password for encrypted archives (optional)
+        dir_names: Optional list that directory paths are appended to
+
+    Returns:
+        Paths of non-directory members in listing order
+
+    Raises:
+        FileNotFoundError: If archive does not exist
+        RuntimeError: If 7zz command fails
+    """
+    from .core import run_7z
+
+    archive_path = Path(archive_path)
+
+    if not archive_path.exists():
+        raise FileNotFoundError(f"Archive not found: {archive_path}")
+
+    args = [*_LIST_NAMES_BASE, str(archive_path)]
+
+    if password is not None:
+        password_str = (
+            password.decode("utf-8") if isinstance(password, bytes) else str(password)
+        )
+        args.append(f"-p{password_str}")
+
+    try:
+        result = run_7z(args, text=False)
+        return parse_7zz_slt_names(result.stdout, dir_names)
+
+    except Exception as e:
+        logger.error(f"Failed to list archive member names: {e}")
+        raise RuntimeError(f"Failed to list archive member names: {e}") from e
+
+
 def create_archive_summary(
     members: List[ArchiveInfo],
 ) -> Dict[str, Union[int, float, str]]:
@@ -385,7 +568,9 @@ def create_archive_summary(
     directory_count = 0
     total_uncompressed = 0
     total_compressed = 0
+    method_counts: Dict[str, int] = {}
 
+    # One pass collects counts, sizes and compression method frequencies
     for member in members:
         if member.is_dir():
             directory_count += 1
@@ -395,21 +580,20 @@ def create_archive_summary(
         total_uncompressed += member.file_size
         total_compressed += member.compress_size
 
+        method = member.method
+        if method:
+            method_counts[method] = method_counts.get(method, 0) + 1
+
     # Calculate compression ratio
     if total_uncompressed > 0:
         compression_ratio = 1.0 - (total_compressed / total_uncompressed)
     else:
         compression_ratio = 0.0
 
-    # Determine predominant archive type
-    methods = [m.method for m in members if m.method]
+    # Predominant archive type is the most common compression method
     archive_type = "mixed"
-    if methods:
-        # Find most common compression method
-        method_counts: Dict[str, int] = {}
-        for method in methods:
-            method_counts[method] = method_counts.get(method, 0) + 1
-        archive_type = max(method_counts, key=lambda k: method_counts[k])
+    if method_counts:
+        archive_type = max(method_counts, key=method_counts.__getitem__)
 
     return {
         "file_count": file_count,
@@ -8,7 +8,10 @@ for archives containing files with invalid Windows names.
 """
 
 import hashlib
+import os
 import platform
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -44,15 +47,34 @@ RESERVED_NAMES = {
     "LPT7",
     "LPT8",
     "LPT9",
+    "CONIN$",
+    "CONOUT$",
 }
 
+# Frozen copy of RESERVED_NAMES and the lengths that occur in it, so
+# candidates of any other length are rejected without upper-casing them
+_RESERVED = frozenset(RESERVED_NAMES)
+_RESERVED_LENGTHS = frozenset(len(name) for name in _RESERVED)
+
+# Matches any character of INVALID_CHARS
+_INVALID_CHARS_RE = re.compile('[<>:"|?*\x00-\x1f]')
+
+# Replaces every character of INVALID_CHARS with an underscore
+_INVALID_CHARS_TABLE = str.maketrans(dict.fromkeys(INVALID_CHARS, "_"))
+
 # Maximum filename length (Windows NTFS limit is 255)
 MAX_FILENAME_LENGTH = 255
 MAX_PATH_LENGTH = 260
 
 
+@lru_cache(maxsize=None)
 def is_windows() -> bool:
-    """Check if running on Windows system."""
+    """
+    Check if running on Windows system.
+
+    The platform cannot change while running, and this is asked once per
+    archive member, so the answer is computed only once.
+    """
     return platform.system().lower() == "windows"
 
 
@@ -69,31 +91,63 @@ def needs_sanitization(filename: str) -> bool:
     if not is_windows():
         return False
 
-    # Check for invalid characters
-    if any(char in INVALID_CHARS for char in filename):
+    # Check for invalid characters, trailing spaces or dots, excessive length
+    # and directory traversal attempts, each in a single C-level call
+    if (
+        _INVALID_CHARS_RE.search(filename)
+        or filename[-1:].isspace()
+        or filename.endswith(".")
+        or len(filename) > MAX_FILENAME_LENGTH
+        or ".." in filename
+        or filename.startswith(("/", "\\"))
+    ):
         return True
 
-    # Check for reserved names (case-insensitive)
-    name_without_ext = Path(filename).stem.upper()
-    if name_without_ext in RESERVED_NAMES:
-        return True
+    return _has_reserved_name(filename)
 
-    # Check for names that are reserved with any extension
-    if "." in filename:
-        base_name = filename.split(".")[0].upper()
-        if base_name in RESERVED_NAMES:
-            return True
 
-    # Check for trailing spaces or dots
-    if filename.rstrip() != filename or filename.rstrip(".") != filename:
-        return True
+def _has_reserved_name(filename: str) -> bool:
+    """
+    Check if a filename uses a Windows reserved name.
 
-    # Check for excessive length
-    if len(filename) > MAX_FILENAME_LENGTH:
+    Both the part before the first dot (reserved with any extension) and
+    the stem of the last path component are checked, ignoring case.
+
+    Args:
+        filename: The filename to check
+
+    Returns:
+        True if a reserved name is used, False otherwise
+    """
+    # Check for names that are reserved with any extension
+    first_dot = filename.find(".")
+    if _is_reserved(filename, len(filename) if first_dot < 0 else first_dot):
         return True
 
-    # Check for directory traversal attempts
-    return ".." in filename or filename.startswith("/") or filename.startswith("\\")
+    # Check for reserved names (case-insensitive)
+    name = os.path.basename(filename)
+    if name in ("", "."):
+        # Trailing separator or "." component; let pathlib normalize it
+        name = Path(filename).name
+    last_dot = name.rfind(".")
+    return _is_reserved(name, last_dot if 0 < last_dot < len(name) - 1 else len(name))
+
+
+def _is_reserved(name: str, end: int) -> bool:
+    """
+    Check whether name[:end] is a reserved name, ignoring case.
+
+    Reserved names are only a few characters long, so other lengths are
+    rejected without upper-casing anything.
+
+    Args:
+        name: String starting with the candidate
+        end: Length of the candidate
+
+    Returns:
+        True if the candidate is in RESERVED_NAMES
+    """
+    return end in _RESERVED_LENGTHS and name[:end].upper() in _RESERVED
 
 
 def sanitize_filename(
@@ -112,6 +166,48 @@ def sanitize_filename(
     if existing_names is None:
         existing_names = set()
 
+    filename, changed = _sanitize_name(filename)
+
+    # Handle name conflicts
+    original_base = filename
+    counter = 1
+    while filename in existing_names:
+        path_obj = Path(original_base)
+        stem = path_obj.stem
+        suffix = path_obj.suffix
+        filename = f"{stem}_{counter}{suffix}"
+        counter += 1
+        changed = True
+
+    return filename, changed
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_name(filename: str) -> Tuple[str, bool]:
+    """
+    Sanitize a filename without regard to name conflicts.
+
+    The same directory names recur across the paths of an archive, so
+    results are cached.
+
+    Args:
+        filename: The original filename
+
+    Returns:
+        Tuple of (sanitized_filename, was_changed)
+    """
+    # Most names need no change at all; return them without the full pass
+    if not (
+        _INVALID_CHARS_RE.search(filename)
+        or ".." in filename
+        or filename.startswith(("/", "\\"))
+        or filename.endswith((" ", "."))
+        or len(filename) > MAX_FILENAME_LENGTH
+        or filename in ("", "_")
+        or _has_reserved_name(filename)
+    ):
+        return filename, False
+
     original_filename = filename
     changed = False
 
@@ -126,10 +222,10 @@ def sanitize_filename(
         changed = True
 
     # Replace invalid characters with underscores
-    for char in INVALID_CHARS:
-        if char in filename:
-            filename = filename.replace(char, "_")
-            changed = True
+    translated = filename.translate(_INVALID_CHARS_TABLE)
+    if translated != filename:
+        filename = translated
+        changed = True
 
     # Handle reserved names
     path_obj = Path(filename)
@@ -180,17 +276,6 @@ def sanitize_filename(
 
         changed = True
 
-    # Handle name conflicts
-    original_base = filename
-    counter = 1
-    while filename in existing_names:
-        path_obj = Path(original_base)
-        stem = path_obj.stem
-        suffix = path_obj.suffix
-        filename = f"{stem}_{counter}{suffix}"
-        counter += 1
-        changed = True
-
     return filename, changed
 
 
@@ -258,46 +343,51 @@ def get_sanitization_mapping(file_list: List[str]) -> Dict[str, str]:
     used_names = set()
 
     # First pass: add all files that don't need sanitization to used_names
-    for filename in file_list:
-        if not needs_sanitization(filename):
-            used_names.add(filename)
-
-    # Second pass: sanitize problematic files ensuring uniqueness
+    problematic = []
     for filename in file_list:
         if needs_sanitization(filename):
-            sanitized_path, changes = sanitize_path(filename, used_names)
+            problematic.append(filename)
+        else:
+            used_names.add(filename)
 
-            # Ensure the sanitized path is unique
-            counter = 1
+    # Second pass: sanitize problematic files ensuring uniqueness. Names
+    # that collide keep probing from where the last probe on the same name
+    # stopped; used_names only grows, so the skipped candidates are taken.
+    resume: Dict[str, Tuple[str, int]] = {}
+    for filename in problematic:
+        sanitized_path, changes = sanitize_path(filename, used_names)
+
+        # Ensure the sanitized path is unique
+        if sanitized_path in used_names:
+            first_candidate = sanitized_path
+            sanitized_path, counter = resume.get(first_candidate, (sanitized_path, 1))
             while sanitized_path in used_names:
-                # Extract directory and filename parts
-                path_parts = sanitized_path.split("/")
-                if len(path_parts) > 1:
-                    # Has directory components
-                    dirs = "/".join(path_parts[:-1])
-                    filename_part = path_parts[-1]
-
-                    # Add counter to filename part
-                    path_obj = Path(filename_part)
-                    stem = path_obj.stem
-                    suffix = path_obj.suffix
-                    new_filename = f"{stem}_{counter}{suffix}"
-                    sanitized_path = f"{dirs}/{new_filename}"
-                else:
-                    # Just a filename
-                    path_obj = Path(sanitized_path)
-                    stem = path_obj.stem
-                    suffix = path_obj.suffix
-                    sanitized_path = f"{stem}_{counter}{suffix}"
-
+                sanitized_path = _add_counter(sanitized_path, counter)
                 counter += 1
+            resume[first_candidate] = (sanitized_path, counter)
 
-            mapping[filename] = sanitized_path
-            used_names.add(sanitized_path)
+        mapping[filename] = sanitized_path
+        used_names.add(sanitized_path)
 
     return mapping
 
 
+def _add_counter(path: str, counter: int) -> str:
+    """
+    Append a counter to the stem of the last component of a path.
+
+    Args:
+        path: Slash-separated path
+        counter: Number to append
+
+    Returns:
+        The path with "_<counter>" inserted before the extension
+    """
+    dirs, slash, name = path.rpartition("/")
+    path_obj = Path(name)
+    return f"{dirs}{slash}{path_obj.stem}_{counter}{path_obj.suffix}"
+
+
 def log_sanitization_changes(changes: Dict[str, str]) -> None:
     """
     Log sanitization changes with detailed information.
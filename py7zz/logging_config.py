@@ -8,9 +8,13 @@ and logging management features for different types of operations.
 Includes support for file logging, structured logging, and performance monitoring.
 """
 
+import json
 import logging
 import logging.handlers
 import sys
+import time
+import traceback
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union, overload
 
@@ -133,15 +137,44 @@ def setup_logging(
         _setup_performance_logging(numeric_level, structured)
 
 
+# LogRecord attributes that StructuredFormatter does not repeat under "extra"
+_STANDARD_RECORD_ATTRS = frozenset(
+    [
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "getMessage",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+    ]
+)
+
+# Compact JSON encoder shared by every StructuredFormatter record
+_json_encode = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), default=str
+).encode
+
+
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
-        import json
-        import traceback
-        from datetime import datetime
-
-        log_data = {
+        log_data: Dict[str, Any] = {
             "timestamp": datetime.fromtimestamp(record.created).isoformat(),
             "level": record.levelname,
             "logger": record.name,
@@ -162,37 +195,15 @@ class StructuredFormatter(logging.Formatter):
                 }
 
         # Add extra fields from record
-        for key, value in record.__dict__.items():
-            if key not in (
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "getMessage",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-            ):
-                if "extra" not in log_data:
-                    log_data["extra"] = {}
-                extra_dict = log_data["extra"]
-                if isinstance(extra_dict, dict):
-                    extra_dict[key] = str(value) if value is not None else None
-
-        return json.dumps(log_data, ensure_ascii=False)
+        extra = {
+            key: str(value) if value is not None else None
+            for key, value in record.__dict__.items()
+            if key not in _STANDARD_RECORD_ATTRS
+        }
+        if extra:
+            log_data["extra"] = extra
+
+        return _json_encode(log_data)
 
 
 def _setup_filename_warnings(
@@ -511,14 +522,14 @@ class PerformanceLogger:
         self.operation = operation
         self.size = size
         self.logger = logging.getLogger(logger_name)
-        self.start_time: Optional[float] = None
+        self.start_time: Optional[int] = None
+        # Resolved once: with debug off, entering and exiting only reads the clock
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
 
     def __enter__(self) -> "PerformanceLogger":
-        import time
-
-        self.start_time = time.perf_counter()
-        size_info = f" (size: {self.size} bytes)" if self.size is not None else ""
-        self.logger.debug(f"Started: {self.operation}{size_info}")
+        if self._debug_enabled:
+            self.logger.debug(f"Started: {self.operation}{self._size_info()}")
+        self.start_time = time.perf_counter_ns()
         return self
 
     def __exit__(
@@ -527,22 +538,26 @@ class PerformanceLogger:
         exc_val: Optional[BaseException],
         exc_tb: Optional[object],
     ) -> None:
-        import time
+        if not exc_type and not self._debug_enabled:
+            return
 
-        end_time = time.perf_counter()
-        duration = end_time - (self.start_time or 0.0)
-        size_info = f" (size: {self.size} bytes)" if self.size is not None else ""
+        duration = (time.perf_counter_ns() - (self.start_time or 0)) / 1e9
 
         if exc_type:
             self.logger.error(
-                f"Failed: {self.operation} (duration: {duration:.4f}s){size_info}",
+                f"Failed: {self.operation} (duration: {duration:.4f}s)"
+                f"{self._size_info()}",
                 exc_info=True,
             )
         else:
             self.logger.debug(
-                f"Completed: {self.operation} (duration: {duration:.4f}s){size_info}"
+                f"Completed: {self.operation} (duration: {duration:.4f}s)"
+                f"{self._size_info()}"
             )
 
+    def _size_info(self) -> str:
+        return f" (size: {self.size} bytes)" if self.size is not None else ""
+
 
 def performance_decorator(
     operation: str,
@@ -615,30 +630,24 @@ def log_performance(
     if isinstance(name_or_func, str) and duration is None:
         # Decorator mode
         operation_name = name_or_func
+        logger = logging.getLogger(logger_name)
+        size_info = f" (size: {size} bytes)" if size is not None else ""
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             def wrapper(*args: Any, **func_kwargs: Any) -> Any:
-                import time
+                # Checked per call so level changes apply; with debug off only
+                # the clock is read, to time a possible failure
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
                 # Log start (similar to PerformanceLogger.__enter__)
-                logger = logging.getLogger(logger_name)
-                size_info = f" (size: {size} bytes)" if size is not None else ""
-                logger.debug(f"Started: {operation_name}{size_info}")
+                if debug_enabled:
+                    logger.debug(f"Started: {operation_name}{size_info}")
 
-                start_time = time.perf_counter()
+                start_time = time.perf_counter_ns()
                 try:
                     result = func(*args, **func_kwargs)
-                    end_time = time.perf_counter()
-                    actual_duration = end_time - start_time
-
-                    # Log completion (similar to PerformanceLogger.__exit__)
-                    logger.debug(
-                        f"Completed: {operation_name} (duration: {actual_duration:.4f}s){size_info}"
-                    )
-                    return result
                 except Exception:
-                    end_time = time.perf_counter()
-                    actual_duration = end_time - start_time
+                    actual_duration = (time.perf_counter_ns() - start_time) / 1e9
 
                     # Log failure (similar to PerformanceLogger.__exit__ with exception)
                     logger.error(
@@ -646,6 +655,15 @@ def log_performance(
                     )
                     raise
 
+                if debug_enabled:
+                    actual_duration = (time.perf_counter_ns() - start_time) / 1e9
+
+                    # Log completion (similar to PerformanceLogger.__exit__)
+                    logger.debug(
+                        f"Completed: {operation_name} (duration: {actual_duration:.4f}s){size_info}"
+                    )
+                return result
+
             return wrapper
 
         return decorator
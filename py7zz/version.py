@@ -19,8 +19,17 @@ The version is automatically determined from:
 
 import re
 import subprocess
+from functools import lru_cache
 from typing import Dict, Optional, Union
 
+# PEP 440 subset used by py7zz: N.N.N[{a|b|rc}N][.postN][.devN]
+_PEP440_RE = re.compile(
+    r"^(\d+)\.(\d+)\.(\d+)(?:(a|b|rc)(\d+))?(?:\.post(\d+))?(?:\.dev(\d+))?$"
+)
+
+# Older dev format without a patch component, e.g. 0.1.dev21
+_LEGACY_DEV_RE = re.compile(r"^(\d+)\.(\d+)\.dev(\d+)$")
+
 # Dynamic version following PEP 440 specification
 # This is determined at runtime from git tags or package metadata
 
@@ -104,13 +113,25 @@ def parse_version(version_string: str) -> Dict[str, Union[str, int, None]]:
         >>> parse_version('1.1.0.dev1')
         {'major': 1, 'minor': 1, 'patch': 0, 'version_type': 'dev', 'build_number': 1}
     """
-    # Use a comprehensive PEP 440 regex pattern
-    # Pattern: [N!]N(.N)*[{a|b|rc}N][.postN][.devN]
-    pep440_pattern = (
-        r"^(\d+)\.(\d+)\.(\d+)(?:(a|b|rc)(\d+))?(?:\.post(\d+))?(?:\.dev(\d+))?$"
-    )
+    # Callers may modify the result, so hand out a copy of the cached dict
+    return dict(_parse_version_cached(version_string))
 
-    match = re.match(pep440_pattern, version_string)
+
+@lru_cache(maxsize=32)
+def _parse_version_cached(version_string: str) -> Dict[str, Union[str, int, None]]:
+    """
+    Parse a version string once per distinct value; see parse_version().
+
+    Args:
+        version_string: Version string in PEP 440 format
+
+    Returns:
+        Dictionary containing parsed version components (shared, do not modify)
+
+    Raises:
+        ValueError: If version string format is invalid
+    """
+    match = _PEP440_RE.match(version_string)
     if match:
         groups = match.groups()
         major = int(groups[0])
@@ -161,8 +182,7 @@ def parse_version(version_string: str) -> Dict[str, Union[str, int, None]]:
         }
 
     # Fallback for older dev formats like 0.1.dev21
-    dev_pattern = r"^(\d+)\.(\d+)\.dev(\d+)$"
-    match = re.match(dev_pattern, version_string)
+    match = _LEGACY_DEV_RE.match(version_string)
     if match:
         major = int(match.group(1))
         minor = int(match.group(2))
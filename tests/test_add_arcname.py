@@ -25,13 +25,13 @@ class TestAddArcnameParameter:
         mock_file_path = Path("/mock/test.txt")
 
         with patch("py7zz.core.Path.exists", return_value=True), patch.object(
-            SevenZipFile, "_add_simple"
-        ) as mock_add_simple:
+            SevenZipFile, "add_many"
+        ) as mock_add_many:
             sz = SevenZipFile(mock_archive_path, "w")
             sz.add(mock_file_path)
 
-            # Should call _add_simple with the file path
-            mock_add_simple.assert_called_once_with(mock_file_path)
+            # Should call add_many with just the file path
+            mock_add_many.assert_called_once_with([mock_file_path])
 
     def test_add_with_arcname_uses_custom_name(self):
         """Test that add() with arcname uses custom archive name."""
@@ -72,21 +72,22 @@ class TestAddArcnameParameter:
                 sz.add(mock_file_path, arcname="custom.txt")
 
 
-class TestAddSimpleMethod:
-    """Test the _add_simple internal method."""
+class TestAddManyMethod:
+    """Test the add_many method."""
 
     def setup_method(self):
         """Setup for each test."""
         self.mock_archive_path = Path("/mock/archive.7z")
         self.sz = SevenZipFile(self.mock_archive_path, "w")
 
+    @patch("py7zz.core.Path.exists", return_value=True)
     @patch("py7zz.core.run_7z")
-    def test_add_simple_success(self, mock_run_7z):
-        """Test successful simple file addition."""
+    def test_add_many_single_path(self, mock_run_7z, mock_exists):
+        """Test a single path is passed to 7zz directly."""
         mock_run_7z.return_value = Mock()
         mock_file_path = Path("/mock/test.txt")
 
-        self.sz._add_simple(mock_file_path)
+        self.sz.add_many([mock_file_path])
 
         # Should call run_7z with correct arguments
         mock_run_7z.assert_called_once()
@@ -98,9 +99,10 @@ class TestAddSimpleMethod:
         # Should include compression configuration
         assert any("-mx" in arg for arg in args)
 
+    @patch("py7zz.core.Path.exists", return_value=True)
     @patch("py7zz.core.run_7z")
-    def test_add_simple_7z_error(self, mock_run_7z):
-        """Test simple addition when 7z command fails."""
+    def test_add_many_7z_error(self, mock_run_7z, mock_exists):
+        """Test addition when 7z command fails."""
         import subprocess
 
         mock_run_7z.side_effect = subprocess.CalledProcessError(
@@ -110,7 +112,7 @@ class TestAddSimpleMethod:
         mock_file_path = Path("/mock/test.txt")
 
         with pytest.raises(RuntimeError, match="Failed to add .* to archive"):
-            self.sz._add_simple(mock_file_path)
+            self.sz.add_many([mock_file_path])
 
 
 class TestAddWithArcnameMethod:
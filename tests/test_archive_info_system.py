@@ -49,6 +49,14 @@ class TestArchiveInfoClass:
         assert info.comment == ""
         assert info.type == "file"
 
+    def test_uses_slots(self):
+        """Test that instances are slotted like zipfile.ZipInfo."""
+        info = ArchiveInfo("test.txt")
+
+        assert not hasattr(info, "__dict__")
+        with pytest.raises(AttributeError):
+            info.unknown_field = 1
+
     def test_init_empty(self):
         """Test initialization with empty filename."""
         info = ArchiveInfo()
@@ -136,6 +144,17 @@ class TestArchiveInfoClass:
         retrieved_mtime = info.get_mtime()
         assert retrieved_mtime == test_time.timestamp()
 
+    def test_mtime_derived_from_date_time(self):
+        """Test that mtime follows date_time until a timestamp is set."""
+        info = ArchiveInfo("test.txt")
+        info.date_time = (2024, 1, 15, 10, 30, 45)
+
+        assert info.mtime == datetime.datetime(2024, 1, 15, 10, 30, 45).timestamp()
+
+        info.mtime = 42.0
+        assert info.mtime == 42.0
+        assert info.get_mtime() == 42.0
+
     def test_time_handling_from_timestamp(self):
         """Test time handling with Unix timestamps."""
         info = ArchiveInfo("test.txt")
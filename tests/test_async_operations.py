@@ -17,8 +17,11 @@ Consolidated from:
 - test_async_new_features.py (new async information methods)
 """
 
+import asyncio
 import contextlib
-import tempfile
+import re
+import shutil
+from collections import namedtuple
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
@@ -49,6 +52,21 @@ try:
 except ImportError:
     simple_async_available = False
 
+# Share one event loop across the async tests of this module. Applied per class
+# (or per test in classes mixing sync tests) rather than module-wide, since
+# pytest-asyncio warns about sync tests carrying the asyncio marker.
+module_loop = pytest.mark.asyncio(loop_scope="module")
+
+
+class _EmptyAsyncIter:
+    """Async iterator that yields nothing, standing in for empty process output."""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
 
 @pytest.fixture
 def test_files(tmp_path):
@@ -88,24 +106,152 @@ def sample_archive(test_files, tmp_path):
     return archive_path
 
 
+# Precompiled pytest.raises(match=...) patterns
+_RE_INVALID_MODE = re.compile("Invalid mode")
+_RE_NOT_A_DIRECTORY = re.compile("Path is not a directory")
+
+# Process attributes async_ops touches; keeps the mock from growing others lazily
+_PROC_SPEC = ["communicate", "returncode", "stdout", "wait"]
+
+# (batch function, inner helper it fans out to, operation factory) per batch API
+_BATCH_CASES = [
+    (
+        batch_compress_async,
+        "py7zz.async_ops.compress_async",
+        lambda tmp, i: (tmp / f"batch{i}.7z", [tmp / f"test{i}.txt"]),
+    ),
+    (
+        batch_extract_async,
+        "py7zz.async_ops.extract_async",
+        lambda tmp, i: (tmp / f"archive{i}.7z", tmp / "extracted"),
+    ),
+]
+_BATCH_IDS = ["compress", "extract"]
+
+_ArchiveEnv = namedtuple("_ArchiveEnv", ["archive_path", "make_test_file"])
+
+
+@pytest.fixture
+def archive_env(tmp_path):
+    """Provide a ``test.7z`` path and a factory that writes ``test.txt`` on demand."""
+
+    def make_test_file(content="test content"):
+        test_file = tmp_path / "test.txt"
+        test_file.write_text(content)
+        return test_file
+
+    return _ArchiveEnv(tmp_path / "test.7z", make_test_file)
+
+
+@pytest.fixture
+def tmpdir_path(tmp_path_factory):
+    """Provide a fresh directory from pytest's session-managed temp root."""
+    return tmp_path_factory.mktemp("t")
+
+
+@pytest.fixture(scope="session")
+def _extraction_root(tmp_path_factory):
+    """Create the shared extraction directory once per session."""
+    return tmp_path_factory.mktemp("extracted", numbered=False)
+
+
+@pytest.fixture
+def output_dir(_extraction_root):
+    """Provide the shared extraction directory, emptied before each test."""
+    shutil.rmtree(_extraction_root)
+    _extraction_root.mkdir()
+    return _extraction_root
+
+
+@pytest.fixture
+def mock_7z_subprocess(monkeypatch):
+    """Route async 7zz invocations to a single pre-built, successful process."""
+    monkeypatch.setattr("py7zz.async_ops.find_7z_binary", lambda: "/fake/7zz")
+
+    mock_process = AsyncMock(spec=_PROC_SPEC)
+    mock_process.communicate = AsyncMock(return_value=(b"", b""))
+    mock_process.wait = AsyncMock(return_value=0)
+    mock_process.returncode = 0
+    mock_process.stdout = _EmptyAsyncIter()
+
+    mock_exec = AsyncMock(return_value=mock_process)
+    monkeypatch.setattr("asyncio.create_subprocess_exec", mock_exec)
+    return mock_exec
+
+
 class TestProgressInfo:
     """Test ProgressInfo class and progress tracking."""
 
-    def test_progress_info_creation(self):
-        """Test ProgressInfo object creation."""
-        info = ProgressInfo(
-            operation="compress",
-            current_file="test.txt",
-            files_processed=1,
-            total_files=5,
-            percentage=20.0,
-        )
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            pytest.param(
+                {
+                    "operation": "compress",
+                    "current_file": "test.txt",
+                    "files_processed": 1,
+                    "total_files": 5,
+                    "percentage": 20.0,
+                },
+                {
+                    "operation": "compress",
+                    "current_file": "test.txt",
+                    "files_processed": 1,
+                    "total_files": 5,
+                    "percentage": 20.0,
+                },
+                id="creation",
+            ),
+            pytest.param(
+                {"operation": "test"},
+                {
+                    "operation": "test",
+                    "current_file": "",
+                    "files_processed": 0,
+                    "total_files": 0,
+                    "percentage": 0.0,
+                },
+                id="defaults",
+            ),
+            pytest.param(
+                {"operation": "compress", "percentage": 75.5},
+                {"percentage": 75.5},
+                id="percentage",
+            ),
+            pytest.param(
+                {"operation": "compress", "percentage": 0.0},
+                {"percentage": 0.0},
+                id="percentage-lower-bound",
+            ),
+            pytest.param(
+                {"operation": "compress", "percentage": 100.0},
+                {"percentage": 100.0},
+                id="percentage-upper-bound",
+            ),
+            pytest.param(
+                {
+                    "operation": "extract",
+                    "current_file": "long/path/to/file.txt",
+                    "files_processed": 5,
+                    "total_files": 20,
+                    "percentage": 25.0,
+                },
+                {
+                    "current_file": "long/path/to/file.txt",
+                    "files_processed": 5,
+                    "total_files": 20,
+                    "percentage": 25.0,
+                },
+                id="file-details",
+            ),
+        ],
+    )
+    def test_progress_info_values(self, kwargs, expected):
+        """Test ProgressInfo stores the given values and fills in defaults."""
+        info = ProgressInfo(**kwargs)
 
-        assert info.operation == "compress"
-        assert info.current_file == "test.txt"
-        assert info.files_processed == 1
-        assert info.total_files == 5
-        assert info.percentage == 20.0
+        for attr, value in expected.items():
+            assert getattr(info, attr) == value
 
     def test_progress_info_repr(self):
         """Test ProgressInfo string representation."""
@@ -119,60 +265,33 @@ class TestProgressInfo:
         assert "doc.pdf" in repr_str
         assert "50.0%" in repr_str
 
-    def test_progress_info_defaults(self):
-        """Test ProgressInfo with default values."""
-        info = ProgressInfo(operation="test")
-
-        assert info.operation == "test"
-        assert info.current_file == ""
-        assert info.files_processed == 0
-        assert info.total_files == 0
-        assert info.percentage == 0.0
-
-    def test_progress_info_validation(self):
-        """Test ProgressInfo validation."""
-        # Test valid percentage
-        info = ProgressInfo(operation="compress", percentage=75.5)
-        assert info.percentage == 75.5
-
-        # Test boundary values
-        info = ProgressInfo(operation="compress", percentage=0.0)
-        assert info.percentage == 0.0
-
-        info = ProgressInfo(operation="compress", percentage=100.0)
-        assert info.percentage == 100.0
-
 
 class TestAsyncSevenZipFileBasic:
     """Test basic AsyncSevenZipFile functionality."""
 
-    def test_init(self):
+    def test_init(self, archive_env):
         """Test AsyncSevenZipFile initialization."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            archive_path = Path(tmpdir) / "test.7z"
+        archive_path = archive_env.archive_path
 
-            # Test read mode
-            sz = AsyncSevenZipFile(archive_path, "r")
-            assert sz.file == archive_path
-            assert sz.mode == "r"
+        # Test read mode
+        sz = AsyncSevenZipFile(archive_path, "r")
+        assert sz.file == archive_path
+        assert sz.mode == "r"
 
-            # Test write mode
-            sz = AsyncSevenZipFile(archive_path, "w")
-            assert sz.file == archive_path
-            assert sz.mode == "w"
+        # Test write mode
+        sz = AsyncSevenZipFile(archive_path, "w")
+        assert sz.file == archive_path
+        assert sz.mode == "w"
 
-    def test_init_invalid_mode(self):
+    def test_init_invalid_mode(self, archive_env):
         """Test AsyncSevenZipFile initialization with invalid mode."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            archive_path = Path(tmpdir) / "test.7z"
+        with pytest.raises(ValueError, match=_RE_INVALID_MODE):
+            AsyncSevenZipFile(archive_env.archive_path, "x")
 
-            with pytest.raises(ValueError, match="Invalid mode"):
-                AsyncSevenZipFile(archive_path, "x")
-
-    @pytest.mark.asyncio
-    async def test_context_manager(self, tmp_path):
+    @module_loop
+    async def test_context_manager(self, archive_env):
         """Test async context manager functionality."""
-        archive_path = tmp_path / "test.7z"
+        archive_path = archive_env.archive_path
 
         async with AsyncSevenZipFile(archive_path, "w") as asz:
             assert asz.file == archive_path
@@ -181,10 +300,10 @@ class TestAsyncSevenZipFileBasic:
         # File should be properly closed after context
 
 
+@module_loop
 class TestAsyncSevenZipFileAPI:
     """Test complete AsyncSevenZipFile API compatibility."""
 
-    @pytest.mark.asyncio
     async def test_async_read_method(self, sample_archive):
         """Test async read method."""
         async with AsyncSevenZipFile(sample_archive, "r") as asz:
@@ -196,7 +315,6 @@ class TestAsyncSevenZipFileAPI:
             with pytest.raises(py7zz.FileNotFoundError):
                 await asz.read("nonexistent.txt")
 
-    @pytest.mark.asyncio
     async def test_async_writestr_method(self, tmp_path):
         """Test async writestr method."""
         archive_path = tmp_path / "test_writestr.7z"
@@ -213,7 +331,6 @@ class TestAsyncSevenZipFileAPI:
             binary_content = sz.read("binary_file.bin")
             assert binary_content == b"Binary data"
 
-    @pytest.mark.asyncio
     async def test_async_add_method(self, test_files, tmp_path):
         """Test async add method."""
         archive_path = tmp_path / "test_add.7z"
@@ -228,33 +345,24 @@ class TestAsyncSevenZipFileAPI:
             assert test_files[0].name in files
             assert "custom_name.txt" in files
 
-    @pytest.mark.asyncio
-    async def test_async_extract_method(self, sample_archive, tmp_path):
+    async def test_async_extract_method(self, sample_archive, output_dir):
         """Test async extractall method (extract all files)."""
-        output_dir = tmp_path / "extracted"
-        output_dir.mkdir()
-
         async with AsyncSevenZipFile(sample_archive, "r") as asz:
             await asz.extractall(output_dir)
 
         # Verify files were extracted
-        extracted_files = list(output_dir.rglob("*"))
-        assert len([f for f in extracted_files if f.is_file()]) >= 3
+        assert sum(1 for p in output_dir.rglob("*") if p.is_file()) >= 3
 
-    @pytest.mark.asyncio
-    async def test_async_extractall_method(self, sample_archive, tmp_path):
+    async def test_async_extractall_method(self, sample_archive, output_dir):
         """Test async extractall method."""
-        output_dir = tmp_path / "extracted_all"
-        output_dir.mkdir()
-
         async with AsyncSevenZipFile(sample_archive, "r") as asz:
             await asz.extractall(output_dir)
 
         # Verify all files were extracted
-        extracted_files = list(output_dir.rglob("*"))
-        assert len([f for f in extracted_files if f.is_file()]) >= 3
+        assert sum(1 for p in output_dir.rglob("*") if p.is_file()) >= 3
 
 
+@module_loop
 class TestAsyncInformationMethods:
     """Test async information methods (zipfile/tarfile compatible)."""
 
@@ -263,7 +371,6 @@ class TestAsyncInformationMethods:
         self.mock_archive_path = Path("/mock/archive.7z")
         self.async_sz = AsyncSevenZipFile(self.mock_archive_path, "r")
 
-    @pytest.mark.asyncio
     async def test_async_infolist_method_exists(self):
         """Test that async infolist method exists and is callable."""
         assert hasattr(self.async_sz, "infolist")
@@ -274,7 +381,6 @@ class TestAsyncInformationMethods:
         assert hasattr(coro, "__await__")
         coro.close()  # Cleanup
 
-    @pytest.mark.asyncio
     async def test_async_infolist_returns_archive_info_list(self):
         """Test that async infolist returns list of ArchiveInfo objects."""
         # Create mock ArchiveInfo objects
@@ -301,7 +407,6 @@ class TestAsyncInformationMethods:
             assert result[0].filename == "file1.txt"
             assert result[1].filename == "file2.txt"
 
-    @pytest.mark.asyncio
     async def test_async_getinfo_method_exists(self):
         """Test that async getinfo method exists and is callable."""
         assert hasattr(self.async_sz, "getinfo")
@@ -312,7 +417,6 @@ class TestAsyncInformationMethods:
         assert hasattr(coro, "__await__")
         coro.close()  # Cleanup
 
-    @pytest.mark.asyncio
     async def test_async_getinfo_returns_archive_info(self):
         """Test that async getinfo method can be called."""
         # Test that the method exists and can be called
@@ -324,7 +428,6 @@ class TestAsyncInformationMethods:
         # Just verify the method is async and callable
         assert callable(self.async_sz.getinfo)
 
-    @pytest.mark.asyncio
     async def test_async_getmembers_method_exists(self):
         """Test that async getmembers method exists (tarfile compatible)."""
         assert hasattr(self.async_sz, "getmembers")
@@ -335,7 +438,6 @@ class TestAsyncInformationMethods:
         assert hasattr(coro, "__await__")
         coro.close()  # Cleanup
 
-    @pytest.mark.asyncio
     async def test_async_getmember_method_exists(self):
         """Test that async getmember method exists (tarfile compatible)."""
         assert hasattr(self.async_sz, "getmember")
@@ -346,7 +448,6 @@ class TestAsyncInformationMethods:
         assert hasattr(coro, "__await__")
         coro.close()  # Cleanup
 
-    @pytest.mark.asyncio
     async def test_async_namelist_method_exists(self):
         """Test that async namelist method exists."""
         assert hasattr(self.async_sz, "namelist")
@@ -357,7 +458,6 @@ class TestAsyncInformationMethods:
         assert hasattr(coro, "__await__")
         coro.close()  # Cleanup
 
-    @pytest.mark.asyncio
     async def test_async_getnames_method_exists(self):
         """Test that async getnames method exists (tarfile compatible)."""
         assert hasattr(self.async_sz, "getnames")
@@ -369,10 +469,10 @@ class TestAsyncInformationMethods:
         coro.close()  # Cleanup
 
 
+@module_loop
 class TestAsyncCoreOperations:
     """Test core async operations (compress_async, extract_async, etc.)."""
 
-    @pytest.mark.asyncio
     async def test_compress_async_basic(self, test_files, tmp_path):
         """Test basic async compression."""
         output_archive = tmp_path / "test_compress.7z"
@@ -385,7 +485,6 @@ class TestAsyncCoreOperations:
 
             mock_asz.assert_called_once_with(output_archive, "w")
 
-    @pytest.mark.asyncio
     async def test_extract_async_basic(self, sample_archive, tmp_path):
         """Test basic async extraction."""
         output_dir = tmp_path / "extracted"
@@ -398,113 +497,136 @@ class TestAsyncCoreOperations:
 
             mock_asz.assert_called_once_with(sample_archive, "r")
 
-    @pytest.mark.asyncio
-    async def test_batch_compress_async(self, test_files, tmp_path):
-        """Test batch async compression."""
-        operations = [
-            (tmp_path / "batch1.7z", [test_files[0]]),
-            (tmp_path / "batch2.7z", [test_files[1]]),
-        ]
+    @pytest.mark.parametrize(
+        "op,needs_archive",
+        [("add", False), ("compress", False), ("extract", True)],
+    )
+    async def test_subprocess_invocation(
+        self, op, needs_archive, test_files, tmp_path, mock_7z_subprocess
+    ):
+        """Test each async entry point builds and runs one 7zz command."""
+        archive_path = tmp_path / "test.7z"
+        if needs_archive:
+            archive_path.write_text("fake")
+        output_dir = tmp_path / "extracted"
+
+        operations = {
+            "add": lambda: AsyncSevenZipFile(archive_path, "w").add_async(
+                test_files[0]
+            ),
+            "compress": lambda: compress_async(archive_path, [test_files[0]]),
+            "extract": lambda: extract_async(archive_path, output_dir),
+        }
+        await operations[op]()
+
+        mock_7z_subprocess.assert_called_once()
+        args = mock_7z_subprocess.call_args[0]
+        assert args[0] == "/fake/7zz"
+        assert args[1] == ("x" if op == "extract" else "a")
+        assert args[2] == str(archive_path)
+        if op == "extract":
+            assert args[3] == f"-o{output_dir}"
+        else:
+            assert args[3] == str(test_files[0])
+
+    @pytest.mark.parametrize(
+        "batch_fn,inner_patch,make_operation", _BATCH_CASES, ids=_BATCH_IDS
+    )
+    async def test_batch_async(self, batch_fn, inner_patch, make_operation, tmp_path):
+        """Test batch helpers dispatch one inner call per operation."""
+        # The inner operation is mocked, so none of these paths need to exist
+        operations = [make_operation(tmp_path, i) for i in (1, 2)]
 
-        with patch("py7zz.async_ops.compress_async") as mock_compress:
-            mock_compress.return_value = None  # Async function returns None
+        with patch(inner_patch, new_callable=AsyncMock) as mock_inner:
+            await batch_fn(operations)
 
-            await batch_compress_async(operations)
+            assert mock_inner.await_count == 2
 
-            assert mock_compress.call_count == 2
+    @pytest.mark.parametrize(
+        "batch_fn,inner_patch,make_operation", _BATCH_CASES, ids=_BATCH_IDS
+    )
+    async def test_batch_async_runs_concurrently(
+        self, batch_fn, inner_patch, make_operation, tmp_path
+    ):
+        """Test batch helpers overlap their operations instead of serializing."""
+        in_flight = 0
+        peak = 0
 
-    @pytest.mark.asyncio
-    async def test_batch_extract_async(self, tmp_path):
-        """Test batch async extraction."""
-        archives = [
-            tmp_path / "archive1.7z",
-            tmp_path / "archive2.7z",
-        ]
-        operations = [(archive, tmp_path / "extracted") for archive in archives]
+        async def fake_operation(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Yield so a concurrent sibling can start before this one finishes
+            await asyncio.sleep(0)
+            in_flight -= 1
 
-        with patch("py7zz.async_ops.extract_async") as mock_extract:
-            mock_extract.return_value = None  # Async function returns None
+        operations = [make_operation(tmp_path, i) for i in (1, 2)]
 
-            await batch_extract_async(operations)
+        with patch(inner_patch, side_effect=fake_operation):
+            await batch_fn(operations)
 
-            assert mock_extract.call_count == 2
+        assert peak == len(operations)
 
 
+@module_loop
 @pytest.mark.skipif(
     not simple_async_available, reason="Simple async functions not available"
 )
 class TestSimpleAsyncAPI:
     """Test simple async API functions."""
 
-    @pytest.mark.asyncio
-    async def test_create_archive_async_file_not_found(self):
+    async def test_create_archive_async_file_not_found(self, archive_env):
         """Test create_archive_async with non-existent file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            archive_path = Path(tmpdir) / "test.7z"
-            nonexistent_file = Path(tmpdir) / "nonexistent.txt"
+        nonexistent_file = archive_env.archive_path.with_name("nonexistent.txt")
 
-            with pytest.raises(FileNotFoundError):
-                await create_archive_async(archive_path, [nonexistent_file])
+        with pytest.raises(FileNotFoundError):
+            await create_archive_async(archive_env.archive_path, [nonexistent_file])
 
-    @pytest.mark.asyncio
-    async def test_extract_archive_async_not_found(self):
+    async def test_extract_archive_async_not_found(self, tmpdir_path):
         """Test extract_archive_async with non-existent archive."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            nonexistent_archive = Path(tmpdir) / "nonexistent.7z"
+        nonexistent_archive = tmpdir_path / "nonexistent.7z"
 
-            with pytest.raises(FileNotFoundError):
-                await extract_archive_async(nonexistent_archive, tmpdir)
+        with pytest.raises(FileNotFoundError):
+            await extract_archive_async(nonexistent_archive, tmpdir_path)
 
-    @pytest.mark.asyncio
-    async def test_compress_file_async_not_found(self):
+    async def test_compress_file_async_not_found(self, tmpdir_path):
         """Test compress_file_async with non-existent file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            nonexistent_file = Path(tmpdir) / "nonexistent.txt"
+        nonexistent_file = tmpdir_path / "nonexistent.txt"
 
-            with pytest.raises(FileNotFoundError):
-                await compress_file_async(nonexistent_file)
+        with pytest.raises(FileNotFoundError):
+            await compress_file_async(nonexistent_file)
 
-    @pytest.mark.asyncio
-    async def test_compress_directory_async_not_found(self):
+    async def test_compress_directory_async_not_found(self, tmpdir_path):
         """Test compress_directory_async with non-existent directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            nonexistent_dir = Path(tmpdir) / "nonexistent"
+        nonexistent_dir = tmpdir_path / "nonexistent"
 
-            with pytest.raises(FileNotFoundError):
-                await compress_directory_async(nonexistent_dir)
+        with pytest.raises(FileNotFoundError):
+            await compress_directory_async(nonexistent_dir)
 
-    @pytest.mark.asyncio
-    async def test_compress_directory_async_not_directory(self):
+    async def test_compress_directory_async_not_directory(self, archive_env):
         """Test compress_directory_async with file instead of directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.txt"
-            test_file.write_text("test content")
+        test_file = archive_env.make_test_file()
 
-            with pytest.raises(ValueError, match="Path is not a directory"):
-                await compress_directory_async(test_file)
+        with pytest.raises(ValueError, match=_RE_NOT_A_DIRECTORY):
+            await compress_directory_async(test_file)
 
-    @pytest.mark.asyncio
-    async def test_create_archive_async_with_progress(self):
+    async def test_create_archive_async_with_progress(self, archive_env):
         """Test create_archive_async with progress callback."""
         progress_calls = []
 
         def progress_callback(info):  # Not async to avoid warning
             progress_calls.append(info)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a test file
-            test_file = Path(tmpdir) / "test.txt"
-            test_file.write_text("test content")
-            archive_path = Path(tmpdir) / "test.7z"
+        test_file = archive_env.make_test_file()
+        archive_path = archive_env.archive_path
 
-            # Test that the function accepts progress callback parameter
-            with contextlib.suppress(FileNotFoundError):
-                # Expected for non-existent files, but callback parameter is accepted
-                await create_archive_async(
-                    archive_path, [test_file], progress_callback=progress_callback
-                )
+        # Test that the function accepts progress callback parameter
+        with contextlib.suppress(FileNotFoundError):
+            # Expected for non-existent files, but callback parameter is accepted
+            await create_archive_async(
+                archive_path, [test_file], progress_callback=progress_callback
+            )
 
-    @pytest.mark.asyncio
     async def test_extract_archive_async_with_progress(self, sample_archive, tmp_path):
         """Test extract_archive_async with progress callback."""
         progress_calls = []
@@ -521,30 +643,27 @@ class TestSimpleAsyncAPI:
                 sample_archive, output_dir, progress_callback=progress_callback
             )
 
-    @pytest.mark.asyncio
-    async def test_compress_file_async_basic(self, tmp_path):
+    async def test_compress_file_async_basic(self, archive_env):
         """Test basic compress_file_async functionality."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("test content")
-
-        with patch("py7zz.simple.create_archive_async") as mock_create:
-            mock_create.return_value = None
+        test_file = archive_env.make_test_file()
 
+        with patch(
+            "py7zz.simple.create_archive_async", new_callable=AsyncMock
+        ) as mock_create:
             result = await compress_file_async(test_file)
 
             assert result == test_file.with_suffix(test_file.suffix + ".7z")
             mock_create.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_compress_directory_async_basic(self, tmp_path):
         """Test basic compress_directory_async functionality."""
         test_dir = tmp_path / "testdir"
         test_dir.mkdir()
         (test_dir / "file.txt").write_text("content")
 
-        with patch("py7zz.simple.create_archive_async") as mock_create:
-            mock_create.return_value = None
-
+        with patch(
+            "py7zz.simple.create_archive_async", new_callable=AsyncMock
+        ) as mock_create:
             result = await compress_directory_async(test_dir)
 
             assert result == test_dir.with_suffix(".7z")
@@ -554,8 +673,10 @@ class TestSimpleAsyncAPI:
 class TestProgressCallbacks:
     """Test progress callback functionality in async operations."""
 
-    @pytest.mark.asyncio
-    async def test_progress_callback_called(self, test_files, tmp_path):
+    @module_loop
+    async def test_progress_callback_called(
+        self, test_files, tmp_path, mock_7z_subprocess
+    ):
         """Test that progress callbacks are called during operations."""
         progress_updates = []
 
@@ -564,14 +685,14 @@ class TestProgressCallbacks:
 
         output_archive = tmp_path / "test.7z"
 
-        # Mock the async operation to simulate progress
-        with patch("py7zz.async_ops.AsyncSevenZipFile"):
-            await compress_async(output_archive, test_files, progress_callback)
+        await compress_async(output_archive, test_files, progress_callback)
 
-        # Note: In real implementation, progress_updates would be populated
-        # This test ensures the callback parameter is properly handled
+        # One 7zz invocation per input; the mocked process emits no output,
+        # so this only ensures the callback path runs to completion
+        assert mock_7z_subprocess.call_count == len(test_files)
+        assert progress_updates == []
 
-    @pytest.mark.asyncio
+    @module_loop
     async def test_progress_callback_none(self, test_files, tmp_path):
         """Test async operations without progress callback."""
         output_archive = tmp_path / "test.7z"
@@ -586,26 +707,11 @@ class TestProgressCallbacks:
         # In real implementation, percentage would be calculated
         assert hasattr(info1, "percentage")
 
-    def test_progress_info_with_file_details(self):
-        """Test progress info with file details."""
-        info = ProgressInfo(
-            operation="extract",
-            current_file="long/path/to/file.txt",
-            files_processed=5,
-            total_files=20,
-            percentage=25.0,
-        )
-
-        assert info.current_file == "long/path/to/file.txt"
-        assert info.files_processed == 5
-        assert info.total_files == 20
-        assert info.percentage == 25.0
-
 
+@module_loop
 class TestAsyncErrorHandling:
     """Test error handling in async operations."""
 
-    @pytest.mark.asyncio
     async def test_async_file_not_found_error(self):
         """Test async operations with missing files."""
         nonexistent_archive = Path("/nonexistent/archive.7z")
@@ -615,7 +721,6 @@ class TestAsyncErrorHandling:
         asz = AsyncSevenZipFile(nonexistent_archive, "r")
         assert asz.file == nonexistent_archive
 
-    @pytest.mark.asyncio
     async def test_async_invalid_archive_error(self, tmp_path):
         """Test async operations with invalid archive."""
         invalid_archive = tmp_path / "invalid.7z"
@@ -625,7 +730,6 @@ class TestAsyncErrorHandling:
         # For now, just test that the file exists but is invalid
         assert invalid_archive.exists()
 
-    @pytest.mark.asyncio
     async def test_async_permission_error_handling(self):
         """Test handling of permission errors in async operations."""
         # Test would involve creating files with restricted permissions
@@ -636,7 +740,7 @@ class TestAsyncErrorHandling:
 class TestAsyncIntegration:
     """Integration tests for async operations."""
 
-    @pytest.mark.asyncio
+    @module_loop
     async def test_async_zipfile_compatibility(self, sample_archive):
         """Test async operations maintain zipfile compatibility."""
         async with AsyncSevenZipFile(sample_archive, "r") as asz:
@@ -646,7 +750,7 @@ class TestAsyncIntegration:
             assert hasattr(asz, "infolist")
             assert hasattr(asz, "getinfo")
 
-    @pytest.mark.asyncio
+    @module_loop
     async def test_async_tarfile_compatibility(self, sample_archive):
         """Test async operations maintain tarfile compatibility."""
         async with AsyncSevenZipFile(sample_archive, "r") as asz:
@@ -674,7 +778,7 @@ class TestAsyncIntegration:
             assert "archive_path" in sig.parameters
             assert "output_dir" in sig.parameters
 
-    @pytest.mark.asyncio
+    @module_loop
     async def test_async_context_manager_cleanup(self, tmp_path):
         """Test that async context managers properly clean up resources."""
         archive_path = tmp_path / "cleanup_test.7z"
@@ -5,14 +5,110 @@ Basic tests for py7zz core functionality.
 """
 
 import os
+import re
+import subprocess
+import threading
+import time
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
-from py7zz.core import SevenZipFile, find_7z_binary, get_version
+from py7zz import version as _py7zz_version
+from py7zz.core import (
+    SevenZipFile,
+    find_7z_binary,
+    get_version,
+    parallel_extract,
+    run_7z_async,
+)
 from py7zz.exceptions import FileNotFoundError as Py7zzFileNotFoundError
 
+# Precompiled pytest.raises(match=...) patterns
+_RE_BINARY_NOT_FOUND = re.compile("7zz binary not found")
+_RE_INVALID_MODE = re.compile("Invalid mode")
+_RE_INVALID_LEVEL = re.compile("Invalid compression level")
+_RE_READ_MODE = re.compile("Cannot add to archive opened in read mode")
+_RE_FILE_NOT_FOUND = re.compile("File not found")
+_RE_WRITE_MODE = re.compile("Cannot extract from archive opened in write mode")
+_RE_ARCHIVE_NOT_FOUND = re.compile("Archive not found")
+
+# Canned `7zz l -slt` output (raw bytes, as listings are captured) with one
+# file and one directory entry
+_FAKE_7Z_LIST_STDOUT = b"""\
+7-Zip 24.00 (x64) : Copyright (c) 1999-2024 Igor Pavlov : 2024-05-26
+
+Listing archive: test.7z
+
+--
+Path = test.7z
+Type = 7z
+Physical Size = 512
+Headers Size = 154
+Method = LZMA2:19
+Solid = -
+Blocks = 1
+
+----------
+Path = test.txt
+Size = 1024
+Packed Size = 358
+Modified = 2024-01-01 12:00:00
+Attributes = A
+CRC = 12345678
+Method = LZMA2:19
+Solid = -
+Encrypted = -
+
+----------
+Path = folder
+Size = 0
+Packed Size = 0
+Modified = 2024-01-01 12:00:00
+Attributes = D
+Method =
+Solid = -
+Encrypted = -
+
+"""
+
+
+def _fake_7z_extract(contents):
+    """Build a run_7z stand-in that extracts ``contents``.
+
+    With ``-so`` the members named in the ``-i@`` list file are returned as
+    one concatenated stdout, in ``contents`` order; otherwise all of
+    ``contents`` is written into the ``-o`` directory. Listed member names
+    are recorded on the returned mock's ``listed`` attribute.
+    """
+
+    def run(args, **kwargs):
+        list_file = Path(next(arg[3:] for arg in args if arg.startswith("-i@")))
+        listed = list_file.read_text(encoding="utf-8").splitlines()
+        mock.listed.extend(listed)
+        if "-so" in args:
+            stdout = b"".join(data for name, data in contents.items() if name in listed)
+            return SimpleNamespace(stdout=stdout, returncode=0)
+        output_dir = Path(next(arg[2:] for arg in args if arg.startswith("-o")))
+        for name, data in contents.items():
+            target = output_dir / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+        return SimpleNamespace(stdout="", returncode=0)
+
+    mock = Mock(side_effect=run)
+    mock.listed = []
+    return mock
+
+
+@pytest.fixture
+def archive_cwd(tmp_path, monkeypatch):
+    """Run from a temp directory holding a placeholder ``test.7z`` archive."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "test.7z").touch()
+    return tmp_path
+
 
 def test_get_version():
     """Test version retrieval."""
@@ -22,9 +118,7 @@ def test_get_version():
     assert len(version) > 0
 
     # Test version format follows PEP 440
-    import py7zz.version
-
-    parsed = py7zz.version.parse_version(version)
+    parsed = _py7zz_version.parse_version(version)
     # Version components should be valid integers
     assert isinstance(parsed["major"], int) and parsed["major"] >= 0
     assert isinstance(parsed["minor"], int) and parsed["minor"] >= 0
@@ -33,40 +127,29 @@ def test_get_version():
     assert parsed["version_type"] in ["stable", "alpha", "beta", "rc", "dev"]
 
 
-def test_find_7z_binary_env_var():
+def test_find_7z_binary_env_var(monkeypatch):
     """Test binary detection from environment variable."""
-    with patch.dict(os.environ, {"PY7ZZ_BINARY": "/fake/path/7zz"}), patch(
-        "pathlib.Path.exists", return_value=True
-    ):
-        binary = find_7z_binary()
-        assert binary == "/fake/path/7zz"
+    monkeypatch.setenv("PY7ZZ_BINARY", "/fake/path/7zz")
+    monkeypatch.setattr(os.path, "isfile", lambda path: True)
 
+    assert find_7z_binary() == "/fake/path/7zz"
 
-def test_find_7z_binary_system_path():
-    """Test binary detection from system PATH - now removed from design."""
-    # This test is no longer valid since we removed system PATH detection
-    # py7zz now only uses bundled binaries for version consistency
-    pass
 
-
-def test_find_7z_binary_bundled():
+def test_find_7z_binary_bundled(monkeypatch):
     """Test binary detection from bundled location."""
-    with patch.dict(os.environ, {}, clear=True), patch(
-        "shutil.which", return_value=None
-    ), patch("platform.system", return_value="Linux"), patch(
-        "pathlib.Path.exists", return_value=True
-    ):
-        binary = find_7z_binary()
-        assert binary.endswith(("bin/7zz", "bin\\7zz"))
+    monkeypatch.delenv("PY7ZZ_BINARY", raising=False)
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    monkeypatch.setattr(os.path, "isfile", lambda path: path.endswith("7zz"))
+
+    assert find_7z_binary().endswith(("bin/7zz", "bin\\7zz"))
 
 
-def test_find_7z_binary_not_found():
+def test_find_7z_binary_not_found(monkeypatch):
     """Test binary not found raises error."""
-    with patch.dict(os.environ, {}, clear=True), patch(
-        "shutil.which", return_value=None
-    ), patch("pathlib.Path.exists", return_value=False), pytest.raises(
-        RuntimeError, match="7zz binary not found"
-    ):
+    monkeypatch.delenv("PY7ZZ_BINARY", raising=False)
+    monkeypatch.setattr(os.path, "isfile", lambda path: False)
+
+    with pytest.raises(RuntimeError, match=_RE_BINARY_NOT_FOUND):
         find_7z_binary()
 
 
@@ -80,13 +163,13 @@ def test_sevenzipfile_init():
 
 def test_sevenzipfile_invalid_mode():
     """Test SevenZipFile with invalid mode."""
-    with pytest.raises(ValueError, match="Invalid mode"):
+    with pytest.raises(ValueError, match=_RE_INVALID_MODE):
         SevenZipFile("test.7z", "x")
 
 
 def test_sevenzipfile_invalid_level():
     """Test SevenZipFile with invalid compression level."""
-    with pytest.raises(ValueError, match="Invalid compression level"):
+    with pytest.raises(ValueError, match=_RE_INVALID_LEVEL):
         SevenZipFile("test.7z", "w", "invalid")
 
 
@@ -96,126 +179,311 @@ def test_sevenzipfile_context_manager():
         assert isinstance(sz, SevenZipFile)
 
 
-@patch("py7zz.core.run_7z")
-def test_sevenzipfile_add(mock_run_7z):
+def test_sevenzipfile_add(archive_cwd, monkeypatch):
     """Test adding files to archive."""
-    mock_run_7z.return_value = Mock()
+    mock_run_7z = Mock(return_value=Mock())
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
+    (archive_cwd / "test.txt").write_text("test content")
 
-    with patch("pathlib.Path.exists", return_value=True):
-        sz = SevenZipFile("test.7z", "w", "normal")
-        sz.add("test.txt")
+    sz = SevenZipFile("test.7z", "w", "normal")
+    sz.add("test.txt")
+
+    mock_run_7z.assert_called_once()
+    args = mock_run_7z.call_args[0][0]
+    assert "a" in args
+    assert "-mx5" in args
+    assert "test.7z" in args
+    assert "test.txt" in args
+
+
+@pytest.mark.parametrize(
+    ("archive", "kwargs", "expected", "unexpected"),
+    [
+        ("test.7z", {}, ["-md=64m"], []),
+        ("test.7z", {"threads": 2, "dict_size": "16m"}, ["-mmt=2", "-md=16m"], []),
+        ("test.zip", {}, [], ["-md=64m"]),
+        ("test.7z", {"level": "fast"}, [], ["-md=64m"]),
+    ],
+    ids=["default", "overridden", "zip", "fast"],
+)
+def test_sevenzipfile_add_tuning_flags(
+    archive_cwd, monkeypatch, archive, kwargs, expected, unexpected
+):
+    """Test add() passes thread and dictionary flags unless overridden."""
+    mock_run_7z = Mock(return_value=Mock())
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
+    (archive_cwd / "test.txt").write_text("test content")
+
+    sz = SevenZipFile(archive, "w", **kwargs)
+    sz.add("test.txt")
+
+    args = mock_run_7z.call_args[0][0]
+    for flag in expected:
+        assert flag in args
+    for flag in unexpected:
+        assert flag not in args
+    if "threads" not in kwargs:
+        # 7zz picks the thread count itself unless one is requested
+        assert not any(arg.startswith("-mmt") for arg in args)
+
+
+def test_sevenzipfile_add_method(archive_cwd, monkeypatch):
+    """Test method= selects the codec with -m0= next to the level flag."""
+    mock_run_7z = Mock(return_value=Mock())
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
+    (archive_cwd / "test.txt").write_text("test content")
+
+    sz = SevenZipFile("x.7z", "w", "normal", method="flzma2")
+    sz.add("test.txt")
+
+    args = mock_run_7z.call_args[0][0]
+    assert "-m0=flzma2" in args
+    assert "-mx5" in args
+
+
+def test_sevenzipfile_add_many_single_call(archive_cwd, monkeypatch):
+    """Test adding several files runs one 7zz command with a list file."""
+    listed = []
+
+    def fake_run_7z(args, **kwargs):
+        list_arg = next(arg for arg in args if arg.startswith("-i@"))
+        listed.extend(Path(list_arg[3:]).read_text(encoding="utf-8").splitlines())
+        return Mock()
+
+    mock_run_7z = Mock(side_effect=fake_run_7z)
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
+    names = [f"file{i}.txt" for i in range(3)]
+    for name in names:
+        (archive_cwd / name).write_text(name)
 
-        mock_run_7z.assert_called_once()
-        args = mock_run_7z.call_args[0][0]
-        assert "a" in args
-        assert "-mx5" in args
-        assert "test.7z" in args
-        assert "test.txt" in args
+    sz = SevenZipFile("test.7z", "w", "normal")
+    sz.add_many(names)
+
+    mock_run_7z.assert_called_once()
+    args = mock_run_7z.call_args[0][0]
+    assert args[0] == "a"
+    assert "-mx5" in args
+    assert "test.7z" in args
+    assert listed == names
 
 
 def test_sevenzipfile_add_read_mode():
     """Test adding to read-only archive raises error."""
     sz = SevenZipFile("test.7z", "r")
-    with pytest.raises(ValueError, match="Cannot add to archive opened in read mode"):
+    with pytest.raises(ValueError, match=_RE_READ_MODE):
         sz.add("test.txt")
 
 
-def test_sevenzipfile_add_missing_file():
+def test_sevenzipfile_add_missing_file(archive_cwd):
     """Test adding missing file raises error."""
     sz = SevenZipFile("test.7z", "w")
-    with patch("pathlib.Path.exists", return_value=False), pytest.raises(
-        Py7zzFileNotFoundError, match="File not found"
-    ):
+    with pytest.raises(Py7zzFileNotFoundError, match=_RE_FILE_NOT_FOUND):
         sz.add("missing.txt")
 
 
-@patch("py7zz.core.run_7z")
-def test_sevenzipfile_extract(mock_run_7z):
+def test_sevenzipfile_extract(archive_cwd, monkeypatch):
     """Test extracting archive."""
-    mock_run_7z.return_value = Mock()
+    mock_run_7z = Mock(return_value=Mock())
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
 
-    with patch("pathlib.Path.exists", return_value=True), patch("pathlib.Path.mkdir"):
-        sz = SevenZipFile("test.7z", "r")
-        sz.extract("./output", overwrite=True)
+    sz = SevenZipFile("test.7z", "r")
+    sz.extract("./output", overwrite=True)
 
-        mock_run_7z.assert_called_once()
-        args = mock_run_7z.call_args[0][0]
-        assert "x" in args
-        assert "test.7z" in args
-        assert "-ooutput" in args
-        assert "-y" in args
+    mock_run_7z.assert_called_once()
+    args = mock_run_7z.call_args[0][0]
+    assert "x" in args
+    assert "test.7z" in args
+    assert "-ooutput" in args
+    assert "-y" in args
+
+
+def test_sevenzipfile_archive_exists_checked_once(archive_cwd, monkeypatch):
+    """Test repeated operations stat the archive only once."""
+    monkeypatch.setattr("py7zz.core.run_7z", Mock(return_value=Mock()))
+    archive_stats = []
+    real_exists = Path.exists
+
+    def counting_exists(self):
+        if self.name == "test.7z":
+            archive_stats.append(self)
+        return real_exists(self)
+
+    monkeypatch.setattr(Path, "exists", counting_exists)
+
+    sz = SevenZipFile("test.7z", "r")
+    sz.extract("./output", overwrite=True)
+    sz.extract("./output", overwrite=True)
+    sz.testzip()
+
+    assert len(archive_stats) == 1
+
+
+def test_sevenzipfile_background_operations(archive_cwd, monkeypatch):
+    """Test submit_* methods return futures that resolve like the sync calls."""
+    mock_run_7z = Mock(
+        return_value=SimpleNamespace(stdout=_FAKE_7Z_LIST_STDOUT, returncode=0)
+    )
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
+
+    sz = SevenZipFile("test.7z", "r")
+    futures = [sz.submit_extract("./output", overwrite=True), sz.submit_namelist()]
+
+    assert futures[0].result(timeout=10) is None
+    assert futures[1].result(timeout=10) == ["test.txt"]
+    assert mock_run_7z.call_count == 2
+
+
+def test_sevenzipfile_concurrent_reads_share_listing(archive_cwd, monkeypatch):
+    """Test reads from several threads on one instance list the archive once."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from py7zz.archive_info import ArchiveInfo
+
+    info = ArchiveInfo("test.txt")
+    info.file_size = 4
+    listings = []
+
+    def slow_listing(archive_path, password=None):
+        listings.append(archive_path)
+        time.sleep(0.05)
+        return [info]
+
+    monkeypatch.setattr("py7zz.detailed_parser.get_detailed_archive_info", slow_listing)
+    monkeypatch.setattr(
+        "py7zz.core.run_7z", Mock(return_value=SimpleNamespace(stdout=b"data"))
+    )
+
+    sz = SevenZipFile("test.7z", "r")
+    # A pool of our own, as the shared one may have a single worker here
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: sz.read("test.txt"), range(4)))
+
+    assert results == [b"data"] * 4
+    assert len(listings) == 1
+
+
+def test_run_7z_async_propagates_errors(monkeypatch):
+    """Test run_7z_async() re-raises run_7z() failures from result()."""
+    error = subprocess.CalledProcessError(2, ["7zz"], stderr="boom")
+    monkeypatch.setattr("py7zz.core.run_7z", Mock(side_effect=error))
+
+    future = run_7z_async(["t", "test.7z"])
+
+    with pytest.raises(subprocess.CalledProcessError):
+        future.result(timeout=10)
+
+
+def test_parallel_extract(tmp_path, monkeypatch):
+    """Test parallel_extract() runs one extraction per archive concurrently."""
+    archives = [tmp_path / f"archive{i}.7z" for i in range(3)]
+    for archive in archives:
+        archive.touch()
+    last_started = threading.Event()
+    completed = []
+
+    def fake_run_7z(args, **kwargs):
+        archive = Path(args[1])
+        if archive == archives[-1]:
+            last_started.set()
+        else:
+            # Hold earlier archives until the last one has been submitted too
+            assert last_started.wait(timeout=10)
+        if archive == archives[0]:
+            time.sleep(0.05)
+        completed.append(archive)
+        return Mock()
+
+    mock_run_7z = Mock(side_effect=fake_run_7z)
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
+
+    targets = parallel_extract(archives, tmp_path / "out", max_workers=3)
+
+    assert mock_run_7z.call_count == len(archives)
+    assert targets == [tmp_path / "out" / f"archive{i}" for i in range(3)]
+    assert sorted(completed) == archives
+    assert completed[-1] == archives[0]
+
+
+@pytest.mark.parametrize(
+    "names", [["a.7z", "a.zip"], ["x/a.7z", "y/a.7z"]], ids=["suffix", "directory"]
+)
+def test_parallel_extract_rejects_shared_targets(tmp_path, monkeypatch, names):
+    """Test parallel_extract() refuses archives that share an output directory."""
+    mock_run_7z = Mock()
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
+
+    with pytest.raises(ValueError, match="would both extract to"):
+        parallel_extract([tmp_path / name for name in names], tmp_path / "out")
+
+    mock_run_7z.assert_not_called()
 
 
 def test_sevenzipfile_extract_write_mode():
     """Test extracting from write-only archive raises error."""
     sz = SevenZipFile("test.7z", "w")
-    with pytest.raises(
-        ValueError, match="Cannot extract from archive opened in write mode"
-    ):
+    with pytest.raises(ValueError, match=_RE_WRITE_MODE):
         sz.extract()
 
 
-def test_sevenzipfile_extract_missing_archive():
+def test_sevenzipfile_extract_missing_archive(archive_cwd):
     """Test extracting missing archive raises error."""
     sz = SevenZipFile("missing.7z", "r")
-    with patch("pathlib.Path.exists", return_value=False), pytest.raises(
-        Py7zzFileNotFoundError, match="Archive not found"
-    ):
+    with pytest.raises(Py7zzFileNotFoundError, match=_RE_ARCHIVE_NOT_FOUND):
         sz.extract()
 
 
-@patch("py7zz.core.run_7z")
-def test_sevenzipfile_namelist(mock_run_7z):
+def test_sevenzipfile_namelist(archive_cwd, monkeypatch):
     """Test listing archive contents via namelist() method."""
-    # Mock the -slt output that detailed_parser expects
-    mock_run_7z.return_value = Mock(
-        stdout="""\
-7-Zip 24.00 (x64) : Copyright (c) 1999-2024 Igor Pavlov : 2024-05-26
-
-Listing archive: test.7z
+    mock_run_7z = Mock(
+        return_value=SimpleNamespace(stdout=_FAKE_7Z_LIST_STDOUT, returncode=0)
+    )
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
 
---
-Path = test.7z
-Type = 7z
-Physical Size = 512
-Headers Size = 154
-Method = LZMA2:19
-Solid = -
-Blocks = 1
+    sz = SevenZipFile("test.7z", "r")
+    contents = sz.namelist()
 
-----------
-Path = test.txt
-Size = 1024
-Packed Size = 358
-Modified = 2024-01-01 12:00:00
-Attributes = A
-CRC = 12345678
-Method = LZMA2:19
-Solid = -
-Encrypted = -
+    # With our new implementation, namelist() excludes directories
+    # and only returns files for consistency with zipfile.ZipFile
+    assert "test.txt" in contents
+    assert "folder" not in contents  # Directories are excluded
+    assert len(contents) == 1  # Only the file, not the directory
 
-----------
-Path = folder
-Size = 0
-Packed Size = 0
-Modified = 2024-01-01 12:00:00
-Attributes = D
-Method =
-Solid = -
-Encrypted = -
 
-"""
+def test_sevenzipfile_listing_is_cached(archive_cwd, monkeypatch):
+    """Test that listing methods share one 7zz -slt call until the archive changes."""
+    mock_run_7z = Mock(
+        return_value=SimpleNamespace(stdout=_FAKE_7Z_LIST_STDOUT, returncode=0)
     )
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
+
+    sz = SevenZipFile("test.7z", "a")
+    assert sz.getinfo("test.txt").file_size == 1024
+    assert len(sz.infolist()) == 2
+    assert sz.namelist() == ["test.txt"]
+    assert sz._list_contents() == ["test.txt"]
+    assert mock_run_7z.call_count == 1
+
+    (archive_cwd / "new.txt").write_text("new content")
+    sz.add("new.txt")
+    sz.namelist()
+    sz.namelist()
+    # One call for the add, one to re-list the modified archive
+    assert mock_run_7z.call_count == 3
+
+
+def test_sevenzipfile_namelist_uses_bare_listing(archive_cwd, monkeypatch):
+    """Test namelist() alone runs the lightweight -ba listing, not a full parse."""
+    mock_run_7z = Mock(
+        return_value=SimpleNamespace(stdout=_FAKE_7Z_LIST_STDOUT, returncode=0)
+    )
+    monkeypatch.setattr("py7zz.core.run_7z", mock_run_7z)
 
-    with patch("pathlib.Path.exists", return_value=True):
-        sz = SevenZipFile("test.7z", "r")
-        contents = sz.namelist()
+    sz = SevenZipFile("test.7z", "r")
+    with patch("py7zz.detailed_parser.parse_7zz_slt_output") as mock_parse:
+        assert sz.namelist() == ["test.txt"]
 
-        # With our new implementation, namelist() excludes directories
-        # and only returns files for consistency with zipfile.ZipFile
-        assert "test.txt" in contents
-        assert "folder" not in contents  # Directories are excluded
-        assert len(contents) == 1  # Only the file, not the directory
+    mock_parse.assert_not_called()
+    assert "-ba" in mock_run_7z.call_args[0][0]
 
 
 def test_sevenzipfile_namelist_missing_archive():
@@ -230,8 +498,7 @@ def test_sevenzipfile_namelist_missing_archive():
 # Space filename parsing tests (Issue #21)
 
 
-@patch("pathlib.Path.exists", return_value=True)
-def test_sevenzipfile_space_filenames_list_contents(mock_exists):
+def test_sevenzipfile_space_filenames_list_contents(archive_cwd):
     """Test that _list_contents() preserves spaces in filenames."""
     from py7zz.archive_info import ArchiveInfo
 
@@ -266,32 +533,21 @@ def test_sevenzipfile_space_filenames_list_contents(mock_exists):
     assert files == expected_files
 
 
-@patch("pathlib.Path.exists", return_value=True)
-def test_sevenzipfile_space_filenames_namelist(mock_exists):
+def test_sevenzipfile_space_filenames_namelist(archive_cwd, monkeypatch):
     """Test that namelist() preserves spaces and excludes directories."""
-    from py7zz.archive_info import ArchiveInfo
-
-    mock_info_list = [
-        ArchiveInfo("puzzles/puzzle 1.txt"),
-        ArchiveInfo("puzzles/puzzle 10.txt"),
-        ArchiveInfo("files/multiple      spaces.txt"),
-        ArchiveInfo("puzzles/"),  # Directory - should be excluded
-    ]
-
-    # Configure as files or directories
-    for _i, info in enumerate(mock_info_list[:-1]):  # All except last
-        info.file_size = 1000
-        info.external_attr = 0x20
-
-    # Last item is directory
-    mock_info_list[-1].file_size = 0
-    mock_info_list[-1].external_attr = 0x30  # Directory
-    mock_info_list[-1].type = "dir"
+    bare_listing = (
+        "Path = puzzles/puzzle 1.txt\nSize = 1000\nAttributes = A\n\n"
+        "Path = puzzles/puzzle 10.txt\nSize = 1000\nAttributes = A\n\n"
+        "Path = files/multiple      spaces.txt\nSize = 1000\nAttributes = A\n\n"
+        "Path = puzzles\nSize = 0\nAttributes = D\n"
+    )
+    monkeypatch.setattr(
+        "py7zz.core.run_7z",
+        Mock(return_value=SimpleNamespace(stdout=bare_listing, returncode=0)),
+    )
 
     sz = SevenZipFile("test.7z")
-
-    with patch.object(sz, "_get_detailed_info", return_value=mock_info_list):
-        names = sz.namelist()
+    names = sz.namelist()
 
     # Should preserve exact spacing and exclude directories
     expected_names = [
@@ -301,11 +557,10 @@ def test_sevenzipfile_space_filenames_namelist(mock_exists):
     ]
 
     assert names == expected_names
-    assert "puzzles/" not in names  # Directory excluded
+    assert "puzzles" not in names  # Directory excluded
 
 
-@patch("pathlib.Path.exists", return_value=True)
-def test_sevenzipfile_space_filenames_read(mock_exists):
+def test_sevenzipfile_space_filenames_read(archive_cwd):
     """Test that read() can find and read files with spaces."""
     from py7zz.archive_info import ArchiveInfo
 
@@ -315,37 +570,114 @@ def test_sevenzipfile_space_filenames_read(mock_exists):
         ArchiveInfo("files/multiple      spaces.txt"),
     ]
 
+    expected_content = b"test file content"
+
     # Configure as files
     for info in mock_info_list:
-        info.file_size = 1000
+        info.file_size = len(expected_content)
         info.external_attr = 0x20
 
     sz = SevenZipFile("test.7z")
-    expected_content = b"test file content"
+    mock_run_7z = Mock(return_value=SimpleNamespace(stdout=expected_content))
 
     with patch.object(sz, "_get_detailed_info", return_value=mock_info_list), patch(
-        "py7zz.core.run_7z"
-    ) as mock_run_7z, patch("tempfile.TemporaryDirectory") as mock_temp_dir, patch(
-        "pathlib.Path.read_bytes", return_value=expected_content
+        "py7zz.core.run_7z", mock_run_7z
     ):
-        # Mock temporary directory
-        mock_temp_dir.return_value.__enter__.return_value = "/tmp/test"
-        mock_temp_dir.return_value.__exit__.return_value = None
-        mock_run_7z.return_value = Mock()
-
         # Test reading file with space before number
         content = sz.read("puzzles/puzzle 10.txt")
 
         assert content == expected_content
 
-        # Verify extraction was called with correct filename
+        # Verify the member was streamed to stdout under its exact name
         mock_run_7z.assert_called_once()
         call_args = mock_run_7z.call_args[0][0]
+        assert "-so" in call_args
         assert "puzzles/puzzle 10.txt" in call_args
+        assert mock_run_7z.call_args[1] == {"text": False}
+
+
+def test_sevenzipfile_read_exact_name_skips_member_scan(archive_cwd):
+    """Test that an exact member name is resolved without scanning the listing."""
+    from py7zz.archive_info import ArchiveInfo
+
+    info = ArchiveInfo("data.bin")
+    info.file_size = 4
+    sz = SevenZipFile("test.7z")
+
+    with patch.object(sz, "_get_detailed_info", return_value=[info]), patch(
+        "py7zz.core.run_7z", Mock(return_value=SimpleNamespace(stdout=b"data"))
+    ), patch.object(sz, "_resolve_member") as mock_resolve:
+        assert sz.read("data.bin") == b"data"
+
+    mock_resolve.assert_not_called()
+
+
+def test_sevenzipfile_read_checks_streamed_size(archive_cwd):
+    """Test that read() does not return a stream that misses the member."""
+    from py7zz.archive_info import ArchiveInfo
+
+    info = ArchiveInfo("data.bin")
+    info.file_size = 4
+    sz = SevenZipFile("test.7z")
+    # 7zz exits cleanly but selects nothing, so neither -so nor x yields data
+    mock_run_7z = Mock(return_value=SimpleNamespace(stdout=b""))
+
+    with patch.object(sz, "_get_detailed_info", return_value=[info]), patch(
+        "py7zz.core.run_7z", mock_run_7z
+    ), pytest.raises(Py7zzFileNotFoundError):
+        sz.read("data.bin")
+
+    # The stream was retried by extracting to disk
+    assert mock_run_7z.call_count == 2
+    assert "-spd" in mock_run_7z.call_args[0][0]
+
+
+_READ_MANY_CONTENTS = {
+    "puzzles/puzzle 1.txt": b"one",
+    "puzzles/puzzle 10.txt": b"ten",
+    "files/multiple      spaces.txt": b"spaces",
+    "normal_file.txt": b"normal",
+    "nested/dir/deep file.bin": b"\x00\x01",
+}
+
+
+@pytest.mark.parametrize(
+    ("size_offset", "expected_calls"),
+    [(0, 1), (1000, 2)],
+    ids=["streamed", "extracted-fallback"],
+)
+def test_sevenzipfile_read_many_single_extraction(
+    archive_cwd, size_offset, expected_calls
+):
+    """Test that read_many() streams several members from one 7zz call.
+
+    When the listed sizes do not match the streamed bytes, read_many() falls
+    back to a single extraction to disk.
+    """
+    from py7zz.archive_info import ArchiveInfo
 
+    contents = _READ_MANY_CONTENTS
+    mock_info_list = [ArchiveInfo(name) for name in contents]
+    for info in mock_info_list:
+        info.file_size = len(contents[info.filename]) + size_offset
+        info.external_attr = 0x20
+
+    sz = SevenZipFile("test.7z")
+    mock_run_7z = _fake_7z_extract(contents)
 
-@patch("pathlib.Path.exists", return_value=True)
-def test_sevenzipfile_issue_21_reproduction(mock_exists):
+    with patch.object(sz, "_get_detailed_info", return_value=mock_info_list), patch(
+        "py7zz.core.run_7z", mock_run_7z
+    ):
+        # Request in a different order than the archive streams them
+        result = sz.read_many(list(reversed(contents)))
+
+    assert result == contents
+    assert mock_run_7z.call_count == expected_calls
+    assert "-so" in mock_run_7z.call_args_list[0][0][0]
+    assert mock_run_7z.listed[: len(contents)] == list(reversed(contents))
+
+
+def test_sevenzipfile_issue_21_reproduction(archive_cwd):
     """Test that Issue #21 reported scenario now works correctly."""
     from py7zz.archive_info import ArchiveInfo
 
@@ -361,7 +693,7 @@ def test_sevenzipfile_issue_21_reproduction(mock_exists):
     mock_info_list[0].file_size = 607
     mock_info_list[0].external_attr = 0x20
 
-    mock_info_list[1].file_size = 607
+    mock_info_list[1].file_size = len(b"puzzle 10 content")
     mock_info_list[1].external_attr = 0x20
 
     mock_info_list[2].file_size = 0
@@ -386,21 +718,16 @@ def test_sevenzipfile_issue_21_reproduction(mock_exists):
         # Test that problematic file can now be found and read
         expected_content = b"puzzle 10 content"
 
-        with patch("py7zz.core.run_7z") as mock_run_7z, patch(
-            "tempfile.TemporaryDirectory"
-        ) as mock_temp_dir, patch(
-            "pathlib.Path.read_bytes", return_value=expected_content
-        ):
-            mock_temp_dir.return_value.__enter__.return_value = "/tmp/test"
-            mock_temp_dir.return_value.__exit__.return_value = None
-            mock_run_7z.return_value = Mock()
+        mock_run_7z = Mock(return_value=SimpleNamespace(stdout=expected_content))
 
+        with patch("py7zz.core.run_7z", mock_run_7z):
             # This should now work (was failing before the fix)
             content = sz.read("puzzles/puzzle 10.txt")
             assert content == expected_content
+            assert "puzzles\\puzzle 10.txt" in mock_run_7z.call_args[0][0]
 
 
-def test_sevenzipfile_multiple_consecutive_spaces():
+def test_sevenzipfile_multiple_consecutive_spaces(archive_cwd):
     """Test that multiple consecutive spaces are preserved exactly."""
     from py7zz.archive_info import ArchiveInfo
 
@@ -420,9 +747,7 @@ def test_sevenzipfile_multiple_consecutive_spaces():
 
     sz = SevenZipFile(Path("test.7z"))
 
-    with patch("pathlib.Path.exists", return_value=True), patch.object(
-        sz, "_get_detailed_info", return_value=mock_info_list
-    ):
+    with patch.object(sz, "_get_detailed_info", return_value=mock_info_list):
         files = sz._list_contents()
 
         # All original spacing should be exactly preserved
@@ -5,11 +5,14 @@ Cross-platform compatibility integration tests.
 
 Tests platform-specific behaviors, filename compatibility,
 path handling, and binary detection across different operating systems.
+
+Every test works in its own temporary directory and only reads the shared
+module fixtures, so the module is safe to distribute with ``pytest -n auto``
+when pytest-xdist is installed.
 """
 
 import contextlib
 import os
-import platform
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -17,10 +20,135 @@ from unittest.mock import patch
 import pytest
 
 from py7zz.async_ops import AsyncSevenZipFile
-from py7zz.core import SevenZipFile, find_7z_binary
+from py7zz.core import SevenZipFile, find_7z_binary, run_7z
 from py7zz.exceptions import ExtractionError, FilenameCompatibilityError
 from py7zz.filename_sanitizer import is_windows, sanitize_filename
 
+# Resolved once at import: the host platform cannot change mid-run, and the
+# library's own check keeps skip conditions in step with its sanitization.
+_IS_WINDOWS = is_windows()
+
+_WINDOWS_BAD_NAMES = (
+    "file<name>.txt",
+    "file>name.txt",
+    "file:name.txt",
+    'file"name.txt',
+    "file|name.txt",
+    "file?name.txt",
+    "file*name.txt",
+    "CON.txt",
+    "PRN.txt",
+    "AUX.txt",
+    "NUL.txt",
+    "COM1.txt",
+    "LPT1.txt",
+)
+_FORBIDDEN_CHARS = frozenset('<>:"|?*')
+_WINDOWS_RESERVED_STEMS = frozenset(
+    ["CON", "PRN", "AUX", "NUL"]
+    + [f"COM{i}" for i in range(1, 10)]
+    + [f"LPT{i}" for i in range(1, 10)]
+)
+
+_UNICODE_NAMES = (
+    "测试文件.txt",  # Chinese
+    "тестовый_файл.txt",  # Russian
+    "файл_тест.txt",  # Cyrillic
+    "ファイル.txt",  # Japanese
+    "🚀_rocket.txt",  # Emoji
+    "café_münü.txt",  # Accented characters
+)
+_UNICODE_PAYLOADS = {name: f"Content of {name}".encode() for name in _UNICODE_NAMES}
+
+# Moderately large (1MB) payload, built once per process and shared read-only
+_LARGE_CONTENT = b"x" * (1024 * 1024)
+# Memory-backed scratch space for bulky temp files where the platform has one
+_TMPFS_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+@pytest.fixture(scope="module")
+def trivial_archive(tmp_path_factory):
+    """Build a one-file archive once per module for tests that only read it.
+
+    Returns:
+        Tuple of (archive path, content of its single member ``test.txt``)
+    """
+    source_dir = tmp_path_factory.mktemp("trivial")
+    content = b"test content"
+    test_file = source_dir / "test.txt"
+    test_file.write_bytes(content)
+
+    archive_path = source_dir / "trivial.7z"
+    with SevenZipFile(archive_path, "w") as sz:
+        sz.add(test_file)
+
+    return archive_path, content
+
+
+@pytest.fixture(scope="module")
+def wildcard_archive(tmp_path_factory):
+    """Build archives whose member names contain 7zz wildcard characters.
+
+    ``a*.txt`` and ``q?.txt`` would also match ``ab.txt`` and ``qz.txt`` if
+    7zz treated them as patterns. Not available on Windows, where such
+    names cannot be created.
+
+    Returns:
+        Tuple of (plain archive, password-protected archive, password,
+        mapping of member name to content)
+    """
+    source_dir = tmp_path_factory.mktemp("wildcard") / "wild"
+    (source_dir / "d").mkdir(parents=True)
+    contents = {
+        "wild/a*.txt": b"STAR",
+        "wild/ab.txt": b"ABAB",
+        "wild/q?.txt": b"Q",
+        "wild/qz.txt": b"QQQ",
+        "wild/d/x.txt": b"X",
+    }
+    for name, data in contents.items():
+        (source_dir.parent / name).write_bytes(data)
+
+    archive_path = source_dir.parent / "wildcard.7z"
+    with SevenZipFile(archive_path, "w") as sz:
+        sz.add(source_dir)
+
+    password = "secret"
+    encrypted_path = source_dir.parent / "wildcard_encrypted.7z"
+    run_7z(["a", str(encrypted_path), f"-p{password}", str(source_dir)])
+
+    return archive_path, encrypted_path, password, contents
+
+
+def _index_tree(root):
+    """Map each file name under ``root`` to the paths it occurs at, in one walk."""
+    index = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            index.setdefault(filename, []).append(Path(dirpath, filename))
+    return index
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _cached_7z_binary():
+    """Resolve the 7zz binary once for every archive operation in this module.
+
+    Library calls look the binary up on each 7zz invocation; the answer
+    cannot change while these tests run. Tests that exercise detection call
+    the real find_7z_binary imported above, which is left untouched.
+    """
+    try:
+        binary = find_7z_binary()
+    except RuntimeError:
+        # No binary available: let tests that need one fail or skip as usual
+        yield None
+        return
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("py7zz.core.find_7z_binary", lambda: binary)
+        mp.setattr("py7zz.async_ops.find_7z_binary", lambda: binary)
+        yield binary
+
 
 class TestCrossPlatformBinaryDetection:
     """Test binary detection across different platforms."""
@@ -38,7 +166,7 @@ class TestCrossPlatformBinaryDetection:
             assert Path(binary_path).exists()
 
             # Binary should be executable
-            if platform.system() != "Windows":
+            if not _IS_WINDOWS:
                 assert os.access(binary_path, os.X_OK)
 
         except RuntimeError as e:
@@ -61,7 +189,7 @@ class TestCrossPlatformBinaryDetection:
 
         try:
             # Make it executable on Unix-like systems
-            if platform.system() != "Windows":
+            if not _IS_WINDOWS:
                 os.chmod(fake_path, 0o700)
 
             # Set environment variable
@@ -78,7 +206,7 @@ class TestCrossPlatformBinaryDetection:
                 del os.environ["PY7ZZ_BINARY"]
             Path(fake_path).unlink(missing_ok=True)
 
-    @pytest.mark.skipif(platform.system() == "Windows", reason="Unix-specific test")
+    @pytest.mark.skipif(_IS_WINDOWS, reason="Unix-specific test")
     def test_unix_binary_permissions(self):
         """Test that the binary has correct permissions on Unix systems."""
         binary_path = find_7z_binary()
@@ -86,7 +214,7 @@ class TestCrossPlatformBinaryDetection:
             f"Binary {binary_path} is not executable"
         )
 
-    @pytest.mark.skipif(platform.system() != "Windows", reason="Windows-specific test")
+    @pytest.mark.skipif(not _IS_WINDOWS, reason="Windows-specific test")
     def test_windows_binary_extension(self):
         """Test that Windows binary has .exe extension."""
         binary_path = find_7z_binary()
@@ -98,21 +226,9 @@ class TestCrossPlatformBinaryDetection:
 class TestCrossPlatformPathHandling:
     """Test path handling across different platforms."""
 
-    def test_path_separator_normalization(self, tmp_path):
+    def test_path_separator_normalization(self, tmp_path, trivial_archive):
         """Test that path separators are handled correctly across platforms."""
-        # Create test files with different path separators
-        test_dir = tmp_path / "test_paths"
-        test_dir.mkdir()
-
-        # Create a file
-        test_file = test_dir / "test.txt"
-        test_file.write_text("test content")
-
-        # Create archive
-        archive_path = tmp_path / "test_paths.7z"
-
-        with SevenZipFile(archive_path, "w") as sz:
-            sz.add(test_file)
+        archive_path, content = trivial_archive
 
         # Extract and verify
         extract_dir = tmp_path / "extracted"
@@ -126,15 +242,15 @@ class TestCrossPlatformPathHandling:
         # Find the extracted test file
         extracted_test_files = [f for f in extracted_files if f.name == "test.txt"]
         assert len(extracted_test_files) == 1
-        assert extracted_test_files[0].read_text() == "test content"
+        assert extracted_test_files[0].read_bytes() == content
 
     def test_long_path_support(self, tmp_path):
         """Test support for long file paths."""
         # Create a deeply nested directory structure
-        deep_path = tmp_path
-        for i in range(10):
-            deep_path = deep_path / f"very_long_directory_name_{i}_with_many_characters"
-            deep_path.mkdir()
+        deep_path = tmp_path.joinpath(
+            *(f"very_long_directory_name_{i}_with_many_characters" for i in range(10))
+        )
+        deep_path.mkdir(parents=True)
 
         # Create a file with a long name
         long_filename = "a" * 100 + ".txt"
@@ -155,95 +271,51 @@ class TestCrossPlatformPathHandling:
         # Verify the file was extracted correctly
         extracted_files = list(extract_dir.rglob("*.txt"))
         assert len(extracted_files) == 1
-        assert extracted_files[0].read_text() == "content in deeply nested file"
+        assert extracted_files[0].read_bytes() == b"content in deeply nested file"
 
-    def test_unicode_path_support(self, tmp_path):
+    @pytest.mark.parametrize("name", _UNICODE_NAMES)
+    def test_unicode_path_support(self, tmp_path, name):
         """Test support for Unicode characters in file paths."""
-        # Create files with Unicode names
-        unicode_names = [
-            "测试文件.txt",  # Chinese
-            "тестовый_файл.txt",  # Russian
-            "файл_тест.txt",  # Cyrillic
-            "ファイル.txt",  # Japanese
-            "🚀_rocket.txt",  # Emoji
-            "café_münü.txt",  # Accented characters
-        ]
-
-        test_files = []
-        for name in unicode_names:
-            try:
-                test_file = tmp_path / name
-                test_file.write_text(f"Content of {name}")
-                test_files.append(test_file)
-            except (OSError, UnicodeEncodeError):
-                # Skip if the filesystem doesn't support this character
-                continue
-
-        if not test_files:
-            pytest.skip("Filesystem doesn't support Unicode filenames")
+        test_file = tmp_path / name
+        try:
+            test_file.write_bytes(_UNICODE_PAYLOADS[name])
+        except (OSError, UnicodeEncodeError):
+            # Only the filename can fail here; the payload is already bytes
+            pytest.skip(f"Filesystem doesn't support Unicode filename {name!r}")
 
         # Create archive
         archive_path = tmp_path / "unicode_test.7z"
 
         with SevenZipFile(archive_path, "w") as sz:
-            for test_file in test_files:
-                sz.add(test_file)
+            sz.add(test_file)
 
         # Extract and verify
         extract_dir = tmp_path / "extracted_unicode"
         with SevenZipFile(archive_path, "r") as sz:
             sz.extract(extract_dir)
 
-        # Verify files were extracted
-        for original_file in test_files:
-            extracted_files = list(extract_dir.rglob(original_file.name))
-            assert len(extracted_files) >= 1, (
-                f"Unicode file {original_file.name} not found after extraction"
-            )
+        extracted_files = _index_tree(extract_dir).get(name, [])
+        assert extracted_files, f"Unicode file {name} not found after extraction"
+        assert extracted_files[0].read_bytes() == _UNICODE_PAYLOADS[name]
 
 
 class TestWindowsFilenameCompatibility:
     """Test Windows filename compatibility features."""
 
-    @pytest.mark.skipif(not is_windows(), reason="Windows-specific test")
-    def test_windows_invalid_characters_handling(self, tmp_path):
+    @pytest.mark.skipif(not _IS_WINDOWS, reason="Windows-specific test")
+    @pytest.mark.parametrize("name", _WINDOWS_BAD_NAMES)
+    def test_windows_invalid_characters_handling(self, name):
         """Test handling of Windows invalid characters in filenames."""
         # Test the sanitization logic directly
-        problematic_names = [
-            "file<name>.txt",
-            "file>name.txt",
-            "file:name.txt",
-            'file"name.txt',
-            "file|name.txt",
-            "file?name.txt",
-            "file*name.txt",
-            "CON.txt",
-            "PRN.txt",
-            "AUX.txt",
-            "NUL.txt",
-            "COM1.txt",
-            "LPT1.txt",
-        ]
+        sanitized, was_changed = sanitize_filename(name)
 
-        for name in problematic_names:
-            sanitized, was_changed = sanitize_filename(name)
-            # Verify the sanitized name is valid on Windows
-            assert "<" not in sanitized
-            assert ">" not in sanitized
-            assert ":" not in sanitized
-            assert '"' not in sanitized
-            assert "|" not in sanitized
-            assert "?" not in sanitized
-            assert "*" not in sanitized
-
-            # Reserved names should be modified
-            if (
-                name.upper().split(".")[0] in ["CON", "PRN", "AUX", "NUL"]
-                or name.upper().split(".")[0] in [f"COM{i}" for i in range(1, 10)]
-                or name.upper().split(".")[0] in [f"LPT{i}" for i in range(1, 10)]
-            ):
-                assert sanitized != name
-                assert was_changed
+        # Verify the sanitized name is valid on Windows
+        assert not {c for c in sanitized if c in _FORBIDDEN_CHARS}
+
+        # Reserved names should be modified
+        if name.upper().split(".")[0] in _WINDOWS_RESERVED_STEMS:
+            assert sanitized != name
+            assert was_changed
 
     def test_filename_sanitization_mock_extraction(self, tmp_path):
         """Test filename sanitization during extraction using mocks."""
@@ -252,36 +324,32 @@ class TestWindowsFilenameCompatibility:
         source_dir.mkdir()
 
         # Create files with safe names
-        safe_files = ["normal.txt", "another_file.txt"]
-        for name in safe_files:
-            (source_dir / name).write_text(f"Content of {name}")
+        safe_files = [source_dir / name for name in ("normal.txt", "another_file.txt")]
+        for safe_file in safe_files:
+            safe_file.write_text(f"Content of {safe_file.name}")
 
         archive_path = tmp_path / "test.7z"
         with SevenZipFile(archive_path, "w") as sz:
-            for name in safe_files:
-                sz.add(source_dir / name)
+            sz.add_many(safe_files)
 
         # Now mock the problematic scenario
         problematic_names = ["file<name>.txt", "CON.txt"]
 
-        with patch("py7zz.core.SevenZipFile._list_contents") as mock_list:
-            mock_list.return_value = problematic_names
-
-            with patch("py7zz.filename_sanitizer.needs_sanitization") as mock_needs:
-                mock_needs.side_effect = lambda name: name in problematic_names
-
-                with patch("py7zz.core._is_filename_error") as mock_is_error:
-                    mock_is_error.return_value = True
-
-                    extract_dir = tmp_path / "extracted"
+        extract_dir = tmp_path / "extracted"
 
-                    with SevenZipFile(archive_path, "r") as sz, contextlib.suppress(
-                        ExtractionError, FilenameCompatibilityError
-                    ):
-                        # This should trigger sanitization logic
-                        sz.extract(extract_dir)
+        with patch.object(
+            SevenZipFile, "_list_contents", return_value=problematic_names
+        ), patch(
+            "py7zz.filename_sanitizer.needs_sanitization",
+            side_effect=lambda name: name in problematic_names,
+        ), patch("py7zz.core._is_filename_error", return_value=True):
+            with SevenZipFile(archive_path, "r") as sz, contextlib.suppress(
+                ExtractionError, FilenameCompatibilityError
+            ):
+                # This should trigger sanitization logic
+                sz.extract(extract_dir)
 
-    @pytest.mark.skipif(is_windows(), reason="Non-Windows test")
+    @pytest.mark.skipif(_IS_WINDOWS, reason="Non-Windows test")
     def test_no_sanitization_on_non_windows(self, tmp_path):
         """Test that filename sanitization is skipped on non-Windows systems."""
         # Create files with characters that would be problematic on Windows
@@ -306,24 +374,26 @@ class TestWindowsFilenameCompatibility:
         # Create and extract archive
         archive_path = tmp_path / "test.7z"
         with SevenZipFile(archive_path, "w") as sz:
-            for test_file in created_files:
-                sz.add(test_file)
+            sz.add_many(created_files)
 
         extract_dir = tmp_path / "extracted"
         with SevenZipFile(archive_path, "r") as sz:
             sz.extract(extract_dir)
 
         # Verify files were extracted with original names
+        extracted = _index_tree(extract_dir)
         for original_file in created_files:
-            extracted_files = list(extract_dir.rglob(original_file.name))
+            extracted_files = extracted.get(original_file.name, [])
             assert len(extracted_files) == 1
-            assert extracted_files[0].read_text() == f"Content of {original_file.name}"
+            assert extracted_files[0].read_bytes() == (
+                f"Content of {original_file.name}".encode()
+            )
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestAsyncCrossPlatformCompatibility:
     """Test async operations across different platforms."""
 
-    @pytest.mark.asyncio
     async def test_async_binary_detection(self):
         """Test that async operations use the same binary detection."""
         # Test that async operations work with the detected binary
@@ -351,9 +421,8 @@ class TestAsyncCrossPlatformCompatibility:
             # Verify extraction
             extracted_files = list(extract_dir.rglob("*.txt"))
             assert len(extracted_files) == 1
-            assert extracted_files[0].read_text() == "async test content"
+            assert extracted_files[0].read_bytes() == b"async test content"
 
-    @pytest.mark.asyncio
     async def test_async_unicode_support(self):
         """Test async operations with Unicode filenames."""
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -378,20 +447,18 @@ class TestAsyncCrossPlatformCompatibility:
                 await asz.extractall(extract_dir)
 
             # Verify extraction
-            extracted_files = list(extract_dir.rglob("*测试*"))
+            extracted_files = _index_tree(extract_dir).get(unicode_name, [])
             assert len(extracted_files) == 1
-            assert extracted_files[0].read_text() == "Unicode async content"
+            assert extracted_files[0].read_bytes() == b"Unicode async content"
 
-    @pytest.mark.asyncio
     async def test_async_large_file_handling(self):
         """Test async operations with large files across platforms."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with tempfile.TemporaryDirectory(dir=_TMPFS_DIR) as tmp_dir:
             tmp_path = Path(tmp_dir)
 
             # Create a moderately large test file (1MB)
             large_file = tmp_path / "large_test.dat"
-            large_content = b"x" * (1024 * 1024)  # 1MB
-            large_file.write_bytes(large_content)
+            large_file.write_bytes(_LARGE_CONTENT)
 
             # Test async compression
             archive_path = tmp_path / "large_async.7z"
@@ -416,25 +483,36 @@ class TestAsyncCrossPlatformCompatibility:
             # Verify extracted file
             extracted_files = list(extract_dir.rglob("large_test.dat"))
             assert len(extracted_files) == 1
-            assert extracted_files[0].stat().st_size == len(large_content)
+            assert extracted_files[0].stat().st_size == len(_LARGE_CONTENT)
+
+
+class TestCompressionMethods:
+    """Test archives written with each documented compression method."""
+
+    @pytest.mark.parametrize("method", ["lzma2", "lzma", "ppmd", "bzip2", "deflate"])
+    def test_method_round_trip(self, tmp_path, method):
+        """Test that the default level works with the chosen method."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"method content " * 64)
+        archive_path = tmp_path / "method.7z"
+
+        with SevenZipFile(archive_path, "w", method=method) as sz:
+            sz.add(test_file)
+
+        with SevenZipFile(archive_path) as sz:
+            assert sz.read("test.txt") == test_file.read_bytes()
+            assert method in sz.getinfo("test.txt").method.lower()
 
 
 class TestPlatformSpecificEdgeCases:
     """Test platform-specific edge cases and error conditions."""
 
-    def test_permission_handling(self, tmp_path):
+    def test_permission_handling(self, tmp_path, trivial_archive):
         """Test handling of permission issues across platforms."""
-        # Create test file
-        test_file = tmp_path / "permission_test.txt"
-        test_file.write_text("permission test")
-
-        # Create archive
-        archive_path = tmp_path / "permission_test.7z"
-        with SevenZipFile(archive_path, "w") as sz:
-            sz.add(test_file)
+        archive_path, _ = trivial_archive
 
         # Try to extract to a read-only directory (Unix-like systems)
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
             readonly_dir = tmp_path / "readonly"
             readonly_dir.mkdir()
             os.chmod(readonly_dir, 0o400)  # Read-only for owner only
@@ -448,20 +526,11 @@ class TestPlatformSpecificEdgeCases:
                 # Restore permissions for cleanup
                 os.chmod(readonly_dir, 0o700)
 
-    def test_disk_space_handling(self, tmp_path):
+    def test_disk_space_handling(self, tmp_path, trivial_archive):
         """Test behavior when disk space is limited."""
         # This is a conceptual test - in practice, we can't easily simulate
         # disk space limitations in a unit test. We'll test the error paths instead.
-
-        test_file = tmp_path / "space_test.txt"
-        test_file.write_text("disk space test")
-
-        archive_path = tmp_path / "space_test.7z"
-        with SevenZipFile(archive_path, "w") as sz:
-            sz.add(test_file)
-
-        # Verify the archive was created successfully
-        assert archive_path.exists()
+        archive_path, _ = trivial_archive
 
         # Test extraction (should succeed in normal conditions)
         extract_dir = tmp_path / "extracted"
@@ -471,15 +540,9 @@ class TestPlatformSpecificEdgeCases:
         extracted_files = list(extract_dir.rglob("*.txt"))
         assert len(extracted_files) == 1
 
-    def test_concurrent_access_handling(self, tmp_path):
+    def test_concurrent_access_handling(self, trivial_archive):
         """Test handling of concurrent access to archives."""
-        # Create test archive
-        test_file = tmp_path / "concurrent_test.txt"
-        test_file.write_text("concurrent access test")
-
-        archive_path = tmp_path / "concurrent_test.7z"
-        with SevenZipFile(archive_path, "w") as sz:
-            sz.add(test_file)
+        archive_path, _ = trivial_archive
 
         # Test multiple concurrent read operations
         def read_archive():
@@ -493,7 +556,7 @@ class TestPlatformSpecificEdgeCases:
         assert names1 == names2
         assert len(names1) > 0
 
-    @pytest.mark.skipif(platform.system() == "Windows", reason="Unix-specific test")
+    @pytest.mark.skipif(_IS_WINDOWS, reason="Unix-specific test")
     def test_symlink_handling_unix(self, tmp_path):
         """Test symbolic link handling on Unix-like systems."""
         # Create original file
@@ -551,18 +614,86 @@ class TestPlatformSpecificEdgeCases:
             sz.extract(extract_dir)
 
         # Verify all content types were extracted
-        extracted_text = list(extract_dir.rglob("text.txt"))
-        extracted_binary = list(extract_dir.rglob("binary.bin"))
-        extracted_nested = list(extract_dir.rglob("nested.txt"))
+        extracted = _index_tree(extract_dir)
+        extracted_text = extracted.get("text.txt", [])
+        extracted_binary = extracted.get("binary.bin", [])
+        extracted_nested = extracted.get("nested.txt", [])
 
         assert len(extracted_text) == 1
         assert len(extracted_binary) == 1
         assert len(extracted_nested) == 1
 
         # Verify content integrity
-        assert extracted_text[0].read_text() == "text content"
+        assert extracted_text[0].read_bytes() == b"text content"
         assert extracted_binary[0].read_bytes() == b"\x00\x01\x02\x03\xff"
-        assert extracted_nested[0].read_text() == "nested content"
+        assert extracted_nested[0].read_bytes() == b"nested content"
+
+
+@pytest.mark.skipif(_IS_WINDOWS, reason="Wildcard characters are invalid on Windows")
+class TestWildcardMemberNames:
+    """Test that members named with 7zz wildcard characters select only themselves."""
+
+    @pytest.mark.parametrize("encrypted", [False, True], ids=["plain", "encrypted"])
+    def test_extract_files_individually(self, tmp_path, wildcard_archive, encrypted):
+        """Test streaming to sanitized names keeps each member's own content."""
+        archive_path, encrypted_path, password, contents = wildcard_archive
+        mapping = {"wild/q?.txt": "q_.txt", "wild/a*.txt": "a_.txt"}
+
+        with SevenZipFile(encrypted_path if encrypted else archive_path) as sz:
+            if encrypted:
+                sz.setpassword(password.encode())
+            sz._extract_files_individually(tmp_path, mapping, True)
+
+        for original, sanitized in mapping.items():
+            assert (tmp_path / sanitized).read_bytes() == contents[original]
+
+    def test_extract_files_individually_single_member(self, tmp_path, wildcard_archive):
+        """Test a lone wildcard name is not extended to the members it matches."""
+        archive_path, _, _, contents = wildcard_archive
+
+        with SevenZipFile(archive_path) as sz:
+            sz._extract_files_individually(tmp_path, {"wild/a*.txt": "a_.txt"}, True)
+
+        assert (tmp_path / "a_.txt").read_bytes() == contents["wild/a*.txt"]
+
+    def test_read_wildcard_names(self, wildcard_archive):
+        """Test read() and read_many() return only the named member's bytes."""
+        archive_path, _, _, contents = wildcard_archive
+
+        with SevenZipFile(archive_path) as sz:
+            assert sz.read("wild/a*.txt") == contents["wild/a*.txt"]
+            assert sz.read_many(["wild/a*.txt", "wild/q?.txt"]) == {
+                "wild/a*.txt": contents["wild/a*.txt"],
+                "wild/q?.txt": contents["wild/q?.txt"],
+            }
+
+    def test_read_directory_rejected(self, wildcard_archive):
+        """Test that directories are not read as the files they contain."""
+        archive_path, _, _, _ = wildcard_archive
+
+        with SevenZipFile(archive_path) as sz:
+            with pytest.raises(IsADirectoryError):
+                sz.read("wild/d")
+            with pytest.raises(IsADirectoryError):
+                sz.read_many(["wild/ab.txt", "wild/d"])
+
+    def test_add_many_literal_paths(self, tmp_path, monkeypatch):
+        """Test add_many() adds blank-padded and wildcard paths as given."""
+        monkeypatch.chdir(tmp_path)
+        contents = {"a.txt": b"A", " lead.txt": b"LEAD", "a*.txt": b"STAR"}
+        for name, data in contents.items():
+            Path(name).write_bytes(data)
+        Path("ab.txt").write_bytes(b"ABAB")
+
+        with SevenZipFile("literal.7z", "w") as sz:
+            sz.add_many(list(contents))
+
+        with SevenZipFile("literal.7z") as sz:
+            names = sz._list_contents()
+            assert sz.read("a*.txt") == contents["a*.txt"]
+
+        # Listing values are read with surrounding blanks trimmed
+        assert sorted(names) == ["a*.txt", "a.txt", "lead.txt"]
 
 
 if __name__ == "__main__":
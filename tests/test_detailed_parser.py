@@ -16,10 +16,13 @@ from py7zz.archive_info import ArchiveInfo
 from py7zz.detailed_parser import (
     _determine_file_type,
     _parse_attributes,
+    _parse_date_time,
     _parse_datetime,
     _parse_int,
     create_archive_summary,
     get_detailed_archive_info,
+    iter_parse_7zz_slt_output,
+    parse_7zz_slt_names,
     parse_7zz_slt_output,
 )
 
@@ -248,6 +251,65 @@ Comment = This file contains important documentation
         assert documented.filename == "documented.txt"
         assert documented.comment == "This file contains important documentation"
 
+    def test_parse_entries_separated_by_blank_lines(self):
+        """Test current 7zz output, where only the header ends in dashes."""
+        slt_output = (
+            b"--\r\nPath = x.7z\r\nType = 7z\r\nMethod = LZMA2:12\r\n\r\n"
+            b"----------\r\n"
+            b"Path = d\r\nSize = 0\r\nAttributes = D drwxr-xr-x\r\nCRC = \r\n\r\n"
+            b"Path = a.txt\r\nSize = 2\r\nAttributes = A -rw-r--r--\r\n"
+            b"CRC = DDEAA107\r\nMethod = LZMA2:12\r\n\r\n"
+            b"Path = d/b.txt\r\nSize = 3\r\nAttributes = A -rw-r--r--\r\n"
+        )
+
+        members = parse_7zz_slt_output(slt_output)
+
+        assert [m.filename for m in members] == ["d", "a.txt", "d/b.txt"]
+        assert [m.file_size for m in members] == [0, 2, 3]
+        assert members[0].is_dir()
+        assert members[1].CRC == 0xDDEAA107
+        assert members[1].method == "LZMA2:12"
+
+    def test_parse_ignores_archive_header_properties(self):
+        """Test that header properties never turn the archive into a member."""
+        slt_output = (
+            "--\nPath = notes.zip\nType = zip\nPhysical Size = 300\n"
+            "Comment = archive-level comment\n\n"
+            "----------\nPath = a.txt\nSize = 2\nAttributes = A\n"
+        )
+
+        members = parse_7zz_slt_output(slt_output)
+
+        assert [m.filename for m in members] == ["a.txt"]
+
+    def test_iter_parse_yields_members_lazily(self):
+        """Test the streaming parser yields members one entry at a time."""
+        slt_output = (
+            "----------\nPath = a.txt\nSize = 1\n\n"
+            "Path = b.txt\nSize = 2\n\nPath = c.txt\nSize = 3\n"
+        )
+
+        members = iter_parse_7zz_slt_output(slt_output)
+
+        assert next(members).filename == "a.txt"
+        assert [m.file_size for m in members] == [2, 3]
+
+    def test_parse_names_skips_directories(self):
+        """Test the names-only parser drops directory entries as it goes."""
+        # Real 7zz l -ba -slt output, captured as bytes
+        slt_output = (
+            "Path = src\nSize = 0\nAttributes = D drwxr-xr-x\n\n"
+            "Path = src/main.py\nSize = 120\nAttributes = A -rw-r--r--\n\n"
+            "Path = docs/\nSize = 0\n\n"
+            "Path = héllo 文件.txt\nSize = 2\nAttributes = A -rw-r--r--\n"
+        ).encode()
+        dir_names: list = []
+
+        files = parse_7zz_slt_names(slt_output, dir_names)
+
+        assert files == ["src/main.py", "héllo 文件.txt"]
+        assert dir_names == ["src", "docs/"]
+
 
 class TestHelperFunctions:
     """Test helper parsing functions."""
@@ -297,6 +359,26 @@ class TestHelperFunctions:
         date_tuple, timestamp = _parse_datetime("2024/01/15 10:30:45")
         assert date_tuple == (2024, 1, 15, 10, 30, 45)
 
+        # Day first
+        date_tuple, timestamp = _parse_datetime("15/01/2024 10:30:45")
+        assert date_tuple == (2024, 1, 15, 10, 30, 45)
+
+    def test_parse_datetime_7zz_fractional_seconds(self):
+        """Test the 100ns-precision timestamps current 7zz versions print."""
+        date_tuple, timestamp = _parse_datetime("2024-01-15 10:30:45.3115626")
+
+        assert date_tuple == (2024, 1, 15, 10, 30, 45)
+        assert timestamp == datetime(2024, 1, 15, 10, 30, 45).timestamp()
+
+    def test_parse_datetime_repeated_values_are_cached(self):
+        """Test that repeated timestamps are parsed once and give equal results."""
+        value = "2023-06-30 08:15:00"
+        first = _parse_datetime(value)
+        hits = _parse_date_time.cache_info().hits
+
+        assert _parse_datetime(value) == first
+        assert _parse_date_time.cache_info().hits == hits + 1
+
     def test_parse_datetime_invalid(self):
         """Test datetime parsing with invalid inputs."""
         assert _parse_datetime("") == (None, None)
@@ -227,6 +227,17 @@ class TestPerformanceLogging:
             # Should have called debug twice (start and end)
             assert mock_logger.debug.call_count == 2
 
+    def test_performance_context_manager_debug_disabled(self):
+        """Test PerformanceLogger skips its debug messages when debug is off."""
+        with patch("py7zz.logging_config.logging.getLogger") as mock_get_logger:
+            mock_logger = mock_get_logger.return_value
+            mock_logger.isEnabledFor.return_value = False
+
+            with PerformanceLogger("test_operation"):
+                pass
+
+            mock_logger.debug.assert_not_called()
+
     def test_performance_decorator(self):
         """Test log_performance decorator."""
         with patch("py7zz.logging_config.logging.getLogger") as mock_get_logger:
@@ -241,6 +252,19 @@ class TestPerformanceLogging:
             assert result == "result"
             assert mock_logger.debug.call_count == 2
 
+    def test_performance_decorator_debug_disabled(self):
+        """Test log_performance calls straight through when debug is off."""
+        with patch("py7zz.logging_config.logging.getLogger") as mock_get_logger:
+            mock_logger = mock_get_logger.return_value
+            mock_logger.isEnabledFor.return_value = False
+
+            @log_performance("decorated_function")
+            def test_func():
+                return "result"
+
+            assert test_func() == "result"
+            mock_logger.debug.assert_not_called()
+
 
 class TestDynamicConfiguration:
     """Test dynamic logging configuration changes."""
@@ -12,54 +12,52 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from py7zz.archive_info import ArchiveInfo
 from py7zz.core import SevenZipFile
 from py7zz.exceptions import ExtractionError, FileNotFoundError
 
 
+@pytest.fixture
+def mock_mkdir():
+    """Pretend the archive exists; yields the stubbed Path.mkdir."""
+    with patch("py7zz.core.Path.exists", return_value=True), patch(
+        "py7zz.core.Path.mkdir"
+    ) as mock_mkdir:
+        yield mock_mkdir
+
+
 class TestExtractallMembersParameter:
     """Test the extractall members parameter functionality."""
 
-    def test_extractall_no_members_extracts_all(self):
+    def test_extractall_no_members_extracts_all(self, mock_mkdir):
         """Test that extractall() without members parameter extracts everything."""
         mock_archive_path = Path("/mock/archive.7z")
 
-        with patch("py7zz.core.Path.exists", return_value=True), patch.object(
-            SevenZipFile, "extract"
-        ) as mock_extract:
+        with patch.object(SevenZipFile, "extract") as mock_extract:
             sz = SevenZipFile(mock_archive_path, "r")
             sz.extractall("output")
 
             # Should call extract with overwrite=True
             mock_extract.assert_called_once_with(Path("output"), overwrite=True)
 
-    def test_extractall_empty_members_list(self):
+    def test_extractall_empty_members_list(self, mock_mkdir):
         """Test that extractall() with empty members list does nothing."""
         mock_archive_path = Path("/mock/archive.7z")
 
-        with patch("py7zz.core.Path.exists", return_value=True), patch(
-            "py7zz.core.Path.mkdir"
-        ) as mock_mkdir, patch.object(
-            SevenZipFile, "_extract_selective_members"
-        ) as mock_selective:
+        with patch.object(SevenZipFile, "_extract_selective_members") as mock_selective:
             sz = SevenZipFile(mock_archive_path, "r")
             sz.extractall("output", members=[])
 
-            # Should create output directory
-            mock_mkdir.assert_called_once()
-
-            # Should call selective extraction with empty list
-            mock_selective.assert_called_once_with(Path("output"), [])
+            # Should neither create the output directory nor extract
+            mock_mkdir.assert_not_called()
+            mock_selective.assert_not_called()
 
-    def test_extractall_with_specific_members(self):
+    def test_extractall_with_specific_members(self, mock_mkdir):
         """Test extractall() with specific member names."""
         mock_archive_path = Path("/mock/archive.7z")
         test_members = ["file1.txt", "dir/file2.txt", "file3.txt"]
 
-        with patch("py7zz.core.Path.exists", return_value=True), patch(
-            "py7zz.core.Path.mkdir"
-        ) as mock_mkdir, patch.object(
-            SevenZipFile, "_extract_selective_members"
-        ) as mock_selective:
+        with patch.object(SevenZipFile, "_extract_selective_members") as mock_selective:
             sz = SevenZipFile(mock_archive_path, "r")
             sz.extractall("output", members=test_members)
 
@@ -102,13 +100,21 @@ class TestExtractSelectiveMembers:
     @patch("py7zz.core.run_7z")
     def test_extract_selective_members_success(self, mock_run_7z):
         """Test successful selective extraction."""
-        mock_run_7z.return_value = Mock()
+        list_contents = []
+
+        def capture_list_file(args):
+            # The list file only exists while run_7z is running
+            list_file = next(arg for arg in args if arg.startswith("-i@"))[3:]
+            list_contents.append(Path(list_file).read_text(encoding="utf-8"))
+            return Mock()
+
+        mock_run_7z.side_effect = capture_list_file
         test_members = ["file1.txt", "file2.txt"]
         target_path = Path("/mock/output")
 
         self.sz._extract_selective_members(target_path, test_members)
 
-        # Should call run_7z with correct arguments
+        # Should call run_7z once with correct arguments
         mock_run_7z.assert_called_once()
         args = mock_run_7z.call_args[0][0]
 
@@ -116,8 +122,21 @@ class TestExtractSelectiveMembers:
         assert str(self.mock_archive_path) in args
         assert f"-o{target_path}" in args
         assert "-y" in args  # assume yes
-        assert "file1.txt" in args
-        assert "file2.txt" in args
+        assert "-scsUTF-8" in args
+        # Members are passed through the list file, not the command line
+        assert "file1.txt" not in args
+        assert list_contents == ["file1.txt\nfile2.txt\n"]
+
+    @patch("py7zz.core.run_7z")
+    def test_extract_selective_members_single_member(self, mock_run_7z):
+        """Test that a single member is passed on the command line."""
+        target_path = Path("/mock/output")
+
+        self.sz._extract_selective_members(target_path, ["file1.txt"])
+
+        args = mock_run_7z.call_args[0][0]
+        assert args[-1] == "file1.txt"
+        assert not any(arg.startswith("-i@") for arg in args)
 
     def test_extract_selective_members_empty_list(self):
         """Test selective extraction with empty members list."""
@@ -188,10 +207,13 @@ class TestExtractSelectiveWithSanitization:
         all_files = ["file:name.txt", "CON.txt", "normal.txt", "other.txt"]
 
         with patch.object(self.sz, "_list_contents", return_value=all_files):
-            mock_needs_sanitization.side_effect = lambda f: f in [
-                "file:name.txt",
-                "CON.txt",
-            ]
+            mock_needs_sanitization.side_effect = lambda f: (
+                f
+                in [
+                    "file:name.txt",
+                    "CON.txt",
+                ]
+            )
             mock_get_mapping.return_value = {
                 "file:name.txt": "file_name.txt",
                 "CON.txt": "CON_file.txt",
@@ -204,23 +226,48 @@ class TestExtractSelectiveWithSanitization:
             with patch.object(
                 self.sz, "_extract_files_individually"
             ) as mock_individual:
-                # Set up the method to succeed with some files
-                def mock_extract_individual(target, mapping):
-                    # Simulate successful extraction of 2 files
-                    pass
+                self.sz._extract_selective_with_sanitization(
+                    target_path, requested_members
+                )
 
-                mock_individual.side_effect = mock_extract_individual
+                # Verify sanitization mapping was generated for requested members only
+                mock_get_mapping.assert_called_once_with(
+                    ["file:name.txt", "CON.txt", "normal.txt"]
+                )
+                mock_individual.assert_called_once_with(
+                    target_path, mock_get_mapping.return_value, True
+                )
 
-                # Should not raise exception
-                import contextlib
+    @patch("py7zz.core.needs_sanitization", return_value=True)
+    @patch("py7zz.core.log_sanitization_changes")
+    def test_extract_selective_with_sanitization_lists_archive_once(
+        self, mock_log_changes, mock_needs_sanitization
+    ):
+        """Test that the fallback reuses one parsed listing of the archive."""
+        members = [ArchiveInfo("file:name.txt"), ArchiveInfo("CON.txt")]
 
-                with contextlib.suppress(Exception):
-                    self.sz._extract_selective_with_sanitization(
-                        target_path, requested_members
-                    )
+        with patch("py7zz.core.Path.exists", return_value=True), patch(
+            "py7zz.detailed_parser.get_detailed_archive_info", return_value=members
+        ) as mock_get_info, patch(
+            "py7zz.core.get_sanitization_mapping",
+            return_value={"file:name.txt": "file_name.txt"},
+        ), patch.object(
+            self.sz, "_extract_files_individually"
+        ) as mock_individual, patch.object(
+            self.sz, "_list_contents", wraps=self.sz._list_contents
+        ) as mock_list:
+            self.sz._extract_selective_with_sanitization(
+                Path("/mock/output"), ["file:name.txt"]
+            )
+            # A second fallback on the same object still needs no new listing
+            self.sz._extract_selective_with_sanitization(
+                Path("/mock/output"), ["file:name.txt"]
+            )
 
-                # Verify sanitization mapping was generated for requested members only
-                mock_get_mapping.assert_called_once_with(all_files)
+        # One listing per fallback, parsed from 7zz output only once
+        assert mock_list.call_count == 2
+        mock_get_info.assert_called_once()
+        assert mock_individual.call_count == 2
 
     def test_extract_selective_with_sanitization_no_requested_members_in_archive(self):
         """Test sanitization when requested members don't exist in archive."""
@@ -259,13 +306,11 @@ class TestExtractSelectiveWithSanitization:
 class TestExtractallIntegration:
     """Integration tests for extractall with members parameter."""
 
-    def test_extractall_members_zipfile_compatibility(self):
+    def test_extractall_members_zipfile_compatibility(self, mock_mkdir):
         """Test that extractall members parameter matches zipfile interface."""
         mock_archive_path = Path("/mock/ziplike.7z")
 
-        with patch("py7zz.core.Path.exists", return_value=True), patch.object(
-            SevenZipFile, "_extract_selective_members"
-        ) as mock_selective:
+        with patch.object(SevenZipFile, "_extract_selective_members") as mock_selective:
             sz = SevenZipFile(mock_archive_path, "r")
 
             # Test zipfile-style usage
@@ -276,13 +321,11 @@ class TestExtractallIntegration:
                 Path("/tmp/extract"), members_to_extract
             )
 
-    def test_extractall_members_tarfile_compatibility(self):
+    def test_extractall_members_tarfile_compatibility(self, mock_mkdir):
         """Test that extractall members parameter matches tarfile interface."""
         mock_archive_path = Path("/mock/tarlike.7z")
 
-        with patch("py7zz.core.Path.exists", return_value=True), patch.object(
-            SevenZipFile, "_extract_selective_members"
-        ) as mock_selective:
+        with patch.object(SevenZipFile, "_extract_selective_members") as mock_selective:
             sz = SevenZipFile(mock_archive_path, "r")
 
             # Test tarfile-style usage
@@ -293,15 +336,11 @@ class TestExtractallIntegration:
                 Path("/tmp/extract"), members_to_extract
             )
 
-    def test_extractall_default_path_with_members(self):
+    def test_extractall_default_path_with_members(self, mock_mkdir):
         """Test extractall with members but default path."""
         mock_archive_path = Path("/mock/archive.7z")
 
-        with patch("py7zz.core.Path.exists", return_value=True), patch(
-            "py7zz.core.Path.mkdir"
-        ) as mock_mkdir, patch.object(
-            SevenZipFile, "_extract_selective_members"
-        ) as mock_selective:
+        with patch.object(SevenZipFile, "_extract_selective_members") as mock_selective:
             sz = SevenZipFile(mock_archive_path, "r")
             sz.extractall(members=["selected.txt"])
 
@@ -309,14 +348,12 @@ class TestExtractallIntegration:
             mock_mkdir.assert_called_once()
             mock_selective.assert_called_once_with(Path("."), ["selected.txt"])
 
-    def test_extractall_with_unicode_member_names(self):
+    def test_extractall_with_unicode_member_names(self, mock_mkdir):
         """Test extractall with Unicode member names."""
         mock_archive_path = Path("/mock/unicode.7z")
         unicode_members = ["测试文件.txt", "файл.txt", "アーカイブ.txt"]
 
-        with patch("py7zz.core.Path.exists", return_value=True), patch.object(
-            SevenZipFile, "_extract_selective_members"
-        ) as mock_selective:
+        with patch.object(SevenZipFile, "_extract_selective_members") as mock_selective:
             sz = SevenZipFile(mock_archive_path, "r")
             sz.extractall("/tmp/unicode", members=unicode_members)
 
@@ -324,7 +361,7 @@ class TestExtractallIntegration:
                 Path("/tmp/unicode"), unicode_members
             )
 
-    def test_extractall_with_special_character_member_names(self):
+    def test_extractall_with_special_character_member_names(self, mock_mkdir):
         """Test extractall with special character member names."""
         mock_archive_path = Path("/mock/special.7z")
         special_members = [
@@ -334,9 +371,7 @@ class TestExtractallIntegration:
             "file(with)parens.txt",
         ]
 
-        with patch("py7zz.core.Path.exists", return_value=True), patch.object(
-            SevenZipFile, "_extract_selective_members"
-        ) as mock_selective:
+        with patch.object(SevenZipFile, "_extract_selective_members") as mock_selective:
             sz = SevenZipFile(mock_archive_path, "r")
             sz.extractall("/tmp/special", members=special_members)
 
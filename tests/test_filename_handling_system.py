@@ -15,12 +15,17 @@ Consolidated from:
 - test_filename_compatibility.py (extraction integration with sanitization)
 """
 
+import contextlib
+import io
+import os
 import subprocess
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from py7zz.archive_info import ArchiveInfo
 from py7zz.core import SevenZipFile, _is_filename_error
 from py7zz.exceptions import ExtractionError, FilenameCompatibilityError
 from py7zz.filename_sanitizer import (
@@ -32,9 +37,70 @@ from py7zz.filename_sanitizer import (
 )
 
 
+class _FakeRun7z:
+    """Plain stand-in for run_7z that records calls and delegates to ``handler``."""
+
+    def __init__(self):
+        self.calls = []
+        self.handler = lambda args: SimpleNamespace(stdout="", stderr="", returncode=0)
+
+    def __call__(self, args, **kwargs):
+        self.calls.append(args)
+        return self.handler(args)
+
+
+def _streaming(data):
+    """Return a _stream_7z stand-in whose stdout holds ``data``."""
+    return lambda args: contextlib.nullcontext(io.BytesIO(data))
+
+
+def _raising(error):
+    """Return a run_7z handler that always raises ``error``."""
+
+    def handler(args):
+        raise error
+
+    return handler
+
+
+@pytest.fixture
+def fake_run_7z(monkeypatch):
+    """
+    Run SevenZipFile extraction against a stubbed file system and 7zz.
+
+    The archive appears to exist, no directories are created and the
+    platform reports Windows. Plain functions are installed instead of
+    mocks so each stubbed call costs no more than a function call.
+    Yields the run_7z stand-in.
+    """
+    fake = _FakeRun7z()
+    monkeypatch.setattr(Path, "exists", lambda self, **kwargs: True)
+    monkeypatch.setattr(Path, "mkdir", lambda self, *args, **kwargs: None)
+    monkeypatch.setattr("py7zz.core.is_windows", lambda: True)
+    monkeypatch.setattr("py7zz.core.run_7z", fake)
+    yield fake
+
+
+@pytest.fixture
+def windows():
+    """Make both core and the sanitizer behave as on Windows."""
+    with patch("py7zz.filename_sanitizer.is_windows", return_value=True), patch(
+        "py7zz.core.is_windows", return_value=True
+    ):
+        yield
+
+
 class TestWindowsDetection:
     """Test Windows platform detection."""
 
+    def setup_method(self):
+        """Forget the detected platform so each test detects it afresh."""
+        is_windows.cache_clear()
+
+    def teardown_method(self):
+        """Drop the patched answer so later tests see the real platform."""
+        is_windows.cache_clear()
+
     def test_is_windows_true(self):
         """Test Windows detection when running on Windows."""
         with patch("platform.system", return_value="Windows"):
@@ -45,6 +111,14 @@ class TestWindowsDetection:
         with patch("platform.system", return_value="Linux"):
             assert is_windows() is False
 
+    def test_is_windows_computed_once(self):
+        """Test that the platform is looked up only once."""
+        with patch("platform.system", return_value="Windows") as mock_system:
+            assert is_windows() is True
+            assert is_windows() is True
+
+        mock_system.assert_called_once()
+
 
 class TestNeedsSanitization:
     """Test filename sanitization detection."""
@@ -112,6 +186,8 @@ class TestNeedsSanitization:
             "LPT7",
             "LPT8",
             "LPT9",
+            "CONIN$",
+            "CONOUT$",
         ]
 
         for name in reserved_names:
@@ -130,6 +206,19 @@ class TestNeedsSanitization:
                 f"Should detect lowercase reserved name: {name.lower()}"
             )
 
+    def test_reserved_names_by_position(self):
+        """Test reserved names in path components and near misses."""
+        assert needs_sanitization("dir/CON.txt") is True
+        assert needs_sanitization("dir/lpt1") is True
+        assert needs_sanitization("Aux.tar.gz") is True
+        assert needs_sanitization("CON/") is True
+        assert needs_sanitization("COM0.txt") is False
+        assert needs_sanitization("CONSOLE.txt") is False
+        assert needs_sanitization("dir/conout$.log") is True
+        assert needs_sanitization("CONIN.txt") is False
+        assert needs_sanitization("CON/file.txt") is False
+        assert needs_sanitization("dir.CON") is False
+
     def test_trailing_spaces_and_dots(self):
         """Test detection of trailing spaces and dots."""
         assert needs_sanitization("filename ") is True
@@ -191,6 +280,10 @@ class TestSanitizeFilename:
         assert filename == "LPT1_file"
         assert changed is True
 
+        filename, changed = sanitize_filename("CONIN$")
+        assert filename == "CONIN$_file"
+        assert changed is True
+
     def test_remove_trailing_spaces_dots(self):
         """Test removal of trailing spaces and dots."""
         filename, changed = sanitize_filename("filename ")
@@ -301,6 +394,30 @@ class TestGetSanitizationMapping:
         """Cleanup after each test."""
         self.windows_patcher.stop()
 
+    def test_repeated_components_sanitized_once(self):
+        """Test that directory names shared by many paths are cached."""
+        from py7zz.filename_sanitizer import _sanitize_name
+
+        file_list = [f"dir:a/sub?/file{i}:x.txt" for i in range(50)]
+
+        _sanitize_name.cache_clear()
+        mapping = get_sanitization_mapping(file_list)
+
+        assert mapping["dir:a/sub?/file7:x.txt"] == "dir_a/sub_/file7_x.txt"
+        # Two shared directories plus one entry per distinct file name
+        assert _sanitize_name.cache_info().misses == 2 + len(file_list)
+        assert _sanitize_name.cache_info().hits == 2 * (len(file_list) - 1)
+
+    def test_many_collisions_stay_unique(self):
+        """Test that names collapsing onto one sanitized name stay unique."""
+        file_list = ["dir/file_.txt"] + [f"dir/file{c}.txt" for c in '<>:"|?*']
+
+        mapping = get_sanitization_mapping(file_list)
+
+        assert len(set(mapping.values())) == len(mapping) == 7
+        assert "dir/file_.txt" not in mapping.values()
+        assert mapping["dir/file<.txt"] == "dir/file__1.txt"
+
     def test_generate_mapping_for_problematic_files(self):
         """Test generation of mapping for files that need sanitization."""
         file_list = [
@@ -391,65 +508,29 @@ class TestExtractionWithSanitization:
         self.mock_archive = Path("test.7z")
         self.mock_output_dir = Path("output")
 
-    @patch("py7zz.core.is_windows", return_value=True)
-    @patch("py7zz.core.run_7z")
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.mkdir")
-    def test_successful_direct_extraction(
-        self, mock_mkdir, mock_exists, mock_run_7z, mock_is_windows
-    ):
+    def test_successful_direct_extraction(self, fake_run_7z):
         """Test successful extraction without sanitization needed."""
-        # Mock successful extraction
-        mock_run_7z.return_value = Mock()
-
         sz = SevenZipFile(self.mock_archive)
         sz.extract(self.mock_output_dir)
 
         # Should only call run_7z once (direct extraction succeeded)
-        assert mock_run_7z.call_count == 1
+        assert len(fake_run_7z.calls) == 1
 
-    @patch("py7zz.core.is_windows", return_value=True)
-    @patch("py7zz.core.run_7z")
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.mkdir")
-    def test_extraction_with_sanitization_fallback(
-        self, mock_mkdir, mock_exists, mock_run_7z, mock_is_windows
-    ):
+    def test_extraction_with_sanitization_fallback(self, fake_run_7z):
         """Test extraction falling back to sanitization when direct extraction fails."""
-        # Mock the archive listing
-        mock_list_result = Mock()
-        mock_list_result.stdout = """
-        Date      Time    Attr         Size   Compressed  Name
-        ------------------- ----- ------------ ------------  ------------------------
-        2023-01-01 12:00:00 ....A         1000         500  normal_file.txt
-        2023-01-01 12:00:00 ....A         2000        1000  file:with:colons.txt
-        2023-01-01 12:00:00 ....A         1500         750  CON.txt
-        ------------------- ----- ------------ ------------  ------------------------
-                                        4500        2250  3 files
-        """
-
-        # Configure run_7z to fail first (direct extraction), succeed for listing, then succeed for sanitized extraction
-        call_count = 0
-
-        def run_7z_side_effect(args):
-            nonlocal call_count
-            call_count += 1
-
-            if (
-                call_count == 1
-            ):  # First call (direct extraction) - fail with filename error
-                error = subprocess.CalledProcessError(
-                    1, args, stderr="Cannot create file: invalid name"
-                )
-                raise error
-            elif "l" in args:  # List command - succeed
-                return mock_list_result
-            else:  # Sanitized extraction - succeed
-                return Mock()
+        # Fail the direct extraction with a filename error, succeed afterwards
+        filename_error = subprocess.CalledProcessError(
+            1, ["7zz"], stderr="Cannot create file: invalid name"
+        )
+        succeed = fake_run_7z.handler
 
-        mock_run_7z.side_effect = run_7z_side_effect
+        def run_7z_handler(args):
+            if len(fake_run_7z.calls) == 1:
+                raise filename_error
+            return succeed(args)
+
+        fake_run_7z.handler = run_7z_handler
 
-        # Mock the sanitized extraction methods
         sz = SevenZipFile(self.mock_archive)
 
         with patch.object(sz, "_extract_with_sanitization") as mock_sanitized_extract:
@@ -460,17 +541,11 @@ class TestExtractionWithSanitization:
                 Path(self.mock_output_dir), False
             )
 
-    @patch("py7zz.core.is_windows", return_value=True)
-    @patch("py7zz.core.run_7z")
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.mkdir")
-    def test_extraction_fails_non_filename_error(
-        self, mock_mkdir, mock_exists, mock_run_7z, mock_is_windows
-    ):
+    def test_extraction_fails_non_filename_error(self, fake_run_7z):
         """Test that non-filename errors are not handled by sanitization."""
-        # Mock extraction failure with non-filename error
-        error = subprocess.CalledProcessError(1, ["7zz"], stderr="Archive is corrupted")
-        mock_run_7z.side_effect = error
+        fake_run_7z.handler = _raising(
+            subprocess.CalledProcessError(1, ["7zz"], stderr="Archive is corrupted")
+        )
 
         sz = SevenZipFile(self.mock_archive)
 
@@ -480,63 +555,31 @@ class TestExtractionWithSanitization:
         # Should raise ExtractionError, not try sanitization
         assert "Archive is corrupted" in str(exc_info.value)
 
-    @patch("py7zz.core.is_windows", return_value=True)
-    @patch("py7zz.core.run_7z")
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.mkdir")
-    def test_sanitization_with_no_problematic_files(
-        self, mock_mkdir, mock_exists, mock_run_7z, mock_is_windows
-    ):
+    def test_sanitization_with_no_problematic_files(self, fake_run_7z):
         """Test sanitization when no files actually need sanitization."""
-        # Mock list output with no problematic files
-        mock_list_result = Mock()
-        mock_list_result.stdout = """
-        Date      Time    Attr         Size   Compressed  Name
-        ------------------- ----- ------------ ------------  ------------------------
-        2023-01-01 12:00:00 ....A         1000         500  normal_file1.txt
-        2023-01-01 12:00:00 ....A         2000        1000  normal_file2.txt
-        ------------------- ----- ------------ ------------  ------------------------
-                                        3000        1500  2 files
-        """
-
-        call_count = 0
-
-        def run_7z_side_effect(args):
-            nonlocal call_count
-            call_count += 1
-
-            if call_count == 1:  # First call fails with filename error
-                error = subprocess.CalledProcessError(
-                    1, args, stderr="Cannot create file: invalid name"
-                )
-                raise error
-            elif "l" in args:  # List command
-                return mock_list_result
-            else:
-                return Mock()
-
-        mock_run_7z.side_effect = run_7z_side_effect
+        fake_run_7z.handler = _raising(
+            subprocess.CalledProcessError(
+                1, ["7zz"], stderr="Cannot create file: invalid name"
+            )
+        )
 
         sz = SevenZipFile(self.mock_archive)
 
-        with pytest.raises(ExtractionError) as exc_info:
+        with patch.object(
+            sz, "_list_contents", return_value=["normal_file1.txt", "normal_file2.txt"]
+        ), pytest.raises(ExtractionError) as exc_info:
             sz.extract(self.mock_output_dir)
 
         assert "No problematic filenames detected" in str(exc_info.value)
 
-    @patch("py7zz.core.is_windows", return_value=False)
-    @patch("py7zz.core.run_7z")
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.mkdir")
-    def test_non_windows_no_sanitization(
-        self, mock_mkdir, mock_exists, mock_run_7z, mock_is_windows
-    ):
+    def test_non_windows_no_sanitization(self, fake_run_7z, monkeypatch):
         """Test that non-Windows systems don't attempt sanitization."""
-        # Mock extraction failure
-        error = subprocess.CalledProcessError(
-            1, ["7zz"], stderr="Cannot create file: invalid name"
+        fake_run_7z.handler = _raising(
+            subprocess.CalledProcessError(
+                1, ["7zz"], stderr="Cannot create file: invalid name"
+            )
         )
-        mock_run_7z.side_effect = error
+        monkeypatch.setattr("py7zz.core.is_windows", lambda: False)
 
         sz = SevenZipFile(self.mock_archive)
 
@@ -555,8 +598,6 @@ class TestSanitizedExtractionMethods:
         self.mock_archive = Path("test.7z")
         self.sz = SevenZipFile(self.mock_archive)
 
-    @patch("py7zz.filename_sanitizer.is_windows", return_value=True)
-    @patch("py7zz.core.is_windows", return_value=True)
     @patch("tempfile.TemporaryDirectory")
     @patch("py7zz.core.run_7z")
     @patch("pathlib.Path.exists", return_value=True)
@@ -565,8 +606,7 @@ class TestSanitizedExtractionMethods:
         mock_exists,
         mock_run_7z,
         mock_temp_dir,
-        mock_core_is_windows,
-        mock_sanitizer_is_windows,
+        windows,
     ):
         """Test successful extraction to temp directory with sanitization."""
         # Mock temporary directory
@@ -585,8 +625,6 @@ class TestSanitizedExtractionMethods:
             # Should have called move_sanitized_files
             mock_move.assert_called_once()
 
-    @patch("py7zz.filename_sanitizer.is_windows", return_value=True)
-    @patch("py7zz.core.is_windows", return_value=True)
     @patch("tempfile.TemporaryDirectory")
     @patch("py7zz.core.run_7z")
     @patch("pathlib.Path.exists", return_value=True)
@@ -595,8 +633,7 @@ class TestSanitizedExtractionMethods:
         mock_exists,
         mock_run_7z,
         mock_temp_dir,
-        mock_core_is_windows,
-        mock_sanitizer_is_windows,
+        windows,
     ):
         """Test fallback to individual extraction when temp extraction fails."""
         # Mock temporary directory
@@ -620,60 +657,172 @@ class TestSanitizedExtractionMethods:
             # Should have called individual extraction
             mock_individual.assert_called_once()
 
-    @patch("py7zz.filename_sanitizer.is_windows", return_value=True)
-    @patch("py7zz.core.is_windows", return_value=True)
-    def test_extract_files_individually_success(
-        self, mock_core_is_windows, mock_sanitizer_is_windows
-    ):
+    @pytest.mark.parametrize("same_device", [True, False])
+    def test_move_sanitized_files(self, tmp_path, same_device):
+        """Test moving files within and across file systems."""
+        source = tmp_path / "source"
+        target = tmp_path / "target"
+        (source / "dir").mkdir(parents=True)
+        target.mkdir()
+        (source / "dir" / "file:name.txt").write_bytes(b"data")
+        (source / "plain.txt").write_bytes(b"plain")
+
+        real_stat = os.stat
+        # Report a distinct device for each of the two directories
+        devices = [] if same_device else [0, 1]
+
+        def fake_stat(path, *args, **kwargs):
+            if devices:
+                return Mock(st_dev=devices.pop())
+            return real_stat(path, *args, **kwargs)
+
+        with patch("py7zz.core.os.stat", side_effect=fake_stat), patch(
+            "py7zz.core.os.replace", wraps=os.replace
+        ) as mock_replace:
+            self.sz._move_sanitized_files(
+                source, target, {"dir/file:name.txt": "dir/file_name.txt"}, False
+            )
+
+        assert mock_replace.called is same_device
+        assert (target / "dir" / "file_name.txt").read_bytes() == b"data"
+        assert (target / "plain.txt").read_bytes() == b"plain"
+        assert not (source / "plain.txt").exists()
+
+    def test_extract_files_individually_success(self, windows, tmp_path):
         """Test individual file extraction with sanitization."""
         sanitization_mapping = {
             "file:name.txt": "file_name.txt",
             "CON.txt": "CON_file.txt",
         }
+        listing = [ArchiveInfo("file:name.txt"), ArchiveInfo("CON.txt")]
+        listing[0].file_size = 3
+        listing[1].file_size = 2
+        real_mkdir = Path.mkdir
+
+        # Both members streamed back to back in archive order
+        with patch(
+            "py7zz.core._stream_7z", side_effect=_streaming(b"abcde")
+        ) as mock_stream, patch("shutil.move") as mock_move, patch.object(
+            self.sz, "_get_detailed_info", return_value=listing
+        ), patch.object(
+            Path, "mkdir", autospec=True, side_effect=real_mkdir
+        ) as mock_mkdir:
+            self.sz._extract_files_individually(tmp_path, sanitization_mapping, True)
+
+            # All files are streamed by one 7zz run
+            mock_stream.assert_called_once()
+            args = mock_stream.call_args[0][0]
+            assert "-so" in args
+            assert any(arg.startswith("-i@") for arg in args)
+            # Data is written straight to the sanitized paths
+            mock_move.assert_not_called()
+            assert (tmp_path / "file_name.txt").read_bytes() == b"abc"
+            assert (tmp_path / "CON_file.txt").read_bytes() == b"de"
+            # Both files share one target directory, created once
+            mock_mkdir.assert_called_once()
+
+    def test_extract_files_individually_retries_failed_batch(self, windows, tmp_path):
+        """Test that a failed batch run is retried one file at a time."""
+        sanitization_mapping = {
+            "file:name.txt": "file_name.txt",
+            "CON.txt": "CON_file.txt",
+        }
 
-        with patch("py7zz.core.run_7z") as mock_run_7z, patch(
-            "shutil.move"
-        ) as mock_move, patch("tempfile.NamedTemporaryFile") as mock_temp_file, patch(
-            "pathlib.Path.mkdir"
-        ), patch("pathlib.Path.exists", return_value=False):
-            # Mock temporary file
-            mock_temp_instance = MagicMock()
-            mock_temp_instance.name = "/tmp/temp_file"
-            mock_temp_file.return_value.__enter__.return_value = mock_temp_instance
-
-            # Mock successful extraction
-            mock_run_7z.return_value = Mock()
+        def fail_batches(args):
+            if any(arg.startswith("-i@") for arg in args):
+                raise subprocess.CalledProcessError(1, ["7zz"], stderr="Failed")
+            if args[-1] == "CON.txt":
+                raise subprocess.CalledProcessError(1, ["7zz"], stderr="Failed")
+            return contextlib.nullcontext(io.BytesIO(b"data"))
+
+        listing = [ArchiveInfo("file:name.txt"), ArchiveInfo("CON.txt")]
+        for info in listing:
+            info.file_size = 4
+
+        with patch(
+            "py7zz.core._stream_7z", side_effect=fail_batches
+        ) as mock_stream, patch.object(
+            self.sz, "_get_detailed_info", return_value=listing
+        ):
+            self.sz._extract_files_individually(tmp_path, sanitization_mapping, True)
+
+            # One batch attempt plus one retry per file
+            assert mock_stream.call_count == 3
+            assert (tmp_path / "file_name.txt").read_bytes() == b"data"
+            assert not (tmp_path / "CON_file.txt").exists()
+
+    @pytest.mark.parametrize("streamed", [b"ab", b"abcd"])
+    def test_extract_files_individually_size_mismatch(self, tmp_path, streamed):
+        """Test that a stream the listing does not account for is discarded."""
+        listing = [ArchiveInfo("file:name.txt")]
+        listing[0].file_size = 3
+
+        with patch(
+            "py7zz.core._stream_7z", side_effect=_streaming(streamed)
+        ), patch.object(self.sz, "_get_detailed_info", return_value=listing):
+            with pytest.raises(FilenameCompatibilityError):
+                self.sz._extract_files_individually(
+                    tmp_path, {"file:name.txt": "file_name.txt"}, True
+                )
 
-            self.sz._extract_files_individually(
-                Path("output"), sanitization_mapping, True
-            )
+        # The partly written file is removed again
+        assert not (tmp_path / "file_name.txt").exists()
 
-            # Should have called run_7z for each file
-            assert mock_run_7z.call_count == 2
-            # Should have moved files
-            assert mock_move.call_count == 2
+    @pytest.mark.parametrize("solid", [False, True])
+    def test_extract_files_individually_parallel_retry(self, tmp_path, solid):
+        """Test that retries run concurrently only for non-solid archives."""
+        from concurrent.futures import ThreadPoolExecutor
 
-    @patch("py7zz.filename_sanitizer.is_windows", return_value=True)
-    @patch("py7zz.core.is_windows", return_value=True)
-    def test_extract_files_individually_all_fail(
-        self, mock_core_is_windows, mock_sanitizer_is_windows
+        sanitization_mapping = {
+            "file:name.txt": "file_name.txt",
+            "CON.txt": "CON_file.txt",
+        }
+        listing = [ArchiveInfo("file:name.txt"), ArchiveInfo("CON.txt")]
+        for info in listing:
+            info.file_size = 4
+            info.compress_size = 4
+        if solid:
+            # Later files in a solid block have no packed size of their own
+            listing[1].compress_size = 0
+
+        def fail_batches(args):
+            if any(arg.startswith("-i@") for arg in args):
+                raise subprocess.CalledProcessError(1, ["7zz"], stderr="Failed")
+            return contextlib.nullcontext(io.BytesIO(b"data"))
+
+        with patch("py7zz.core._stream_7z", side_effect=fail_batches), patch.object(
+            self.sz, "_get_detailed_info", return_value=listing
+        ), patch(
+            "py7zz.core.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as mock_pool:
+            self.sz._extract_files_individually(tmp_path, sanitization_mapping, True)
+
+        assert mock_pool.called is not solid
+        assert (tmp_path / "file_name.txt").read_bytes() == b"data"
+        assert (tmp_path / "CON_file.txt").read_bytes() == b"data"
+
+    @pytest.mark.parametrize("sanitized", ["../escape.txt", "dir/../../escape.txt"])
+    def test_extract_files_individually_rejects_escaping_names(
+        self, tmp_path, sanitized
     ):
+        """Test that sanitized names may not leave the target directory."""
+        with patch("py7zz.core._stream_7z") as mock_stream:
+            with pytest.raises(FilenameCompatibilityError, match="outside"):
+                self.sz._extract_files_individually(
+                    tmp_path / "out", {"file:name.txt": sanitized}, True
+                )
+
+            mock_stream.assert_not_called()
+
+    def test_extract_files_individually_all_fail(self, windows):
         """Test individual extraction when all files fail."""
         sanitization_mapping = {"file:name.txt": "file_name.txt"}
 
-        with patch("py7zz.core.run_7z") as mock_run_7z, patch(
-            "tempfile.NamedTemporaryFile"
-        ) as mock_temp_file:
-            # Mock temporary file
-            mock_temp_instance = MagicMock()
-            mock_temp_instance.name = "/tmp/temp_file"
-            mock_temp_file.return_value.__enter__.return_value = mock_temp_instance
-
-            # Mock failed extraction
-            mock_run_7z.side_effect = subprocess.CalledProcessError(
-                1, ["7zz"], stderr="Failed"
-            )
-
+        # Mock failed extraction
+        failure = subprocess.CalledProcessError(1, ["7zz"], stderr="Failed")
+        with patch("py7zz.core._stream_7z", side_effect=failure), patch.object(
+            self.sz, "_get_detailed_info", return_value=[ArchiveInfo("file:name.txt")]
+        ):
             with pytest.raises(FilenameCompatibilityError) as exc_info:
                 self.sz._extract_files_individually(
                     Path("output"), sanitization_mapping, True
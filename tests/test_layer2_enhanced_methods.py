@@ -158,7 +158,7 @@ class TestSevenZipFileEnhancedMethods:
         """Test the open() method for reading files."""
 
         # Mock 7z outputs for different operations
-        def mock_run_7z_side_effect(args):
+        def mock_run_7z_side_effect(args, **kwargs):
             if "l" in args and len(args) == 2:
                 # Simple listing for namelist()
                 return MagicMock(
@@ -456,6 +456,15 @@ class TestVersionEdgeCases:
         assert not is_dev_version("1.0.0")
         assert not is_dev_version("1.0.0a1")
 
+    def test_parse_version_results_are_independent(self):
+        """Test that cached parses hand out independent dictionaries."""
+        first = parse_version("1.0.0a1")
+        first["major"] = 99
+
+        second = parse_version("1.0.0a1")
+        assert second["major"] == 1
+        assert second is not first
+
     def test_version_generation_edge_cases(self):
         """Test version generation with edge cases."""
         # Test with zero build number